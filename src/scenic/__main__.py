@@ -79,6 +79,13 @@ simOpts.add_argument(
     metavar="N",
     help="max # of rejected simulations before sampling a new scene (default 1)",
 )
+simOpts.add_argument(
+    "--workers",
+    type=int,
+    default=1,
+    metavar="N",
+    help="run simulations in parallel using N worker processes (requires --count)",
+)
 
 # Interactive rendering options
 intOptions = parser.add_argument_group("static scene diagramming options")
@@ -134,6 +141,9 @@ debugOpts.add_argument(
     "--dump-python", help="dump Python equivalent of final AST", action="store_true"
 )
 debugOpts.add_argument("--no-pruning", help="disable pruning", action="store_true")
+debugOpts.add_argument(
+    "--no-cache", help="disable caching of compiled Scenic files", action="store_true"
+)
 debugOpts.add_argument(
     "--gather-stats",
     type=int,
@@ -181,6 +191,7 @@ translator.dumpScenicAST = args.dump_scenic_ast
 translator.dumpFinalAST = args.dump_ast
 translator.dumpASTPython = args.dump_python
 translator.usePruning = not args.no_pruning
+translator.useCompiledCache = not args.no_cache
 if args.seed is not None:
     if args.verbosity >= 1:
         print(f"Using random seed = {args.seed}")
@@ -205,7 +216,10 @@ totalTime = time.time() - startTime
 if args.verbosity >= 1:
     print(f"Scenario constructed in {totalTime:.2f} seconds.")
 
-if args.simulate:
+parallel = args.simulate and args.workers > 1
+if parallel and args.count <= 0:
+    parser.error("--workers requires a positive --count")
+if args.simulate and not parallel:
     simulator = errors.callBeginningScenicTrace(scenario.getSimulator)
 
 
@@ -214,13 +228,26 @@ def generateScene(maxIterations=2000):
     scene, iterations = errors.callBeginningScenicTrace(
         lambda: scenario.generate(maxIterations=maxIterations, verbosity=args.verbosity)
     )
+    reportScene(scene, iterations, startTime)
+    return scene, iterations
+
+
+def generateScenes(maxIterations=2000):
+    scenes = scenario.iterScenes(maxIterations=maxIterations, verbosity=args.verbosity)
+    while True:
+        startTime = time.time()
+        scene, iterations = errors.callBeginningScenicTrace(lambda: next(scenes))
+        reportScene(scene, iterations, startTime)
+        yield scene, iterations
+
+
+def reportScene(scene, iterations, startTime):
     if args.verbosity >= 1:
         totalTime = time.time() - startTime
         print(f"  Generated scene in {iterations} iterations, {totalTime:.4g} seconds.")
         if args.show_params:
             for param, value in scene.params.items():
                 print(f'    Parameter "{param}": {value}')
-    return scene, iterations
 
 
 def runSimulation(scene):
@@ -244,18 +271,59 @@ def runSimulation(scene):
         totalTime = time.time() - startTime
         print(f"  Ran simulation in {totalTime:.4g} seconds.")
     if simulation and args.show_records:
-        for name, value in simulation.result.records.items():
-            if isinstance(value, list):
-                print(f'    Record "{name}": (time series)')
-                for step, subval in value:
-                    print(f"      {step:4d}: {subval}")
-            else:
-                print(f'    Record "{name}": {value}')
+        reportRecords(simulation.result)
     return simulation is not None
 
 
+def reportRecords(result):
+    for name, value in result.records.items():
+        if isinstance(value, list):
+            print(f'    Record "{name}": (time series)')
+            for step, subval in value:
+                print(f"      {step:4d}: {subval}")
+        else:
+            print(f'    Record "{name}": {value}')
+
+
+def runSimulations(count):
+    startTime = time.time()
+    if args.verbosity >= 1:
+        print(f"  Running {count} simulations using {args.workers} workers...")
+    simulations = scenario.iterSimulations(
+        count,
+        workers=args.workers,
+        ordered=False,
+        maxSteps=args.time,
+        verbosity=args.verbosity,
+        maxIterations=args.max_sims_per_scene,
+    )
+    successCount = 0
+    while True:
+        simulation = errors.callBeginningScenicTrace(lambda: next(simulations, None))
+        if simulation is None:
+            break
+        if simulation.result is not None:
+            successCount += 1
+        if args.verbosity >= 1:
+            if simulation.error is not None:
+                print(f"  Simulation {simulation.index} failed: {simulation.error}")
+            elif simulation.result is None:
+                print(f"  Simulation {simulation.index} was rejected.")
+            else:
+                reason = simulation.result.terminationReason
+                print(f"  Simulation {simulation.index} ended because: {reason}")
+        if simulation.result is not None and args.show_records:
+            reportRecords(simulation.result)
+    if args.verbosity >= 1:
+        totalTime = time.time() - startTime
+        print(f"  Ran {successCount} successful simulations in {totalTime:.4g} seconds.")
+
+
 try:
-    if args.gather_stats is None:
+    if parallel:
+        runSimulations(args.count)
+
+    elif args.gather_stats is None:
         # Generate scenes interactively until killed/count reached
         if not args.simulate:  # will need matplotlib to draw scene schematic
             import matplotlib
@@ -268,8 +336,7 @@ try:
                 )
 
         successCount = 0
-        while True:
-            scene, _ = generateScene()
+        for scene, _ in generateScenes():
             if args.simulate:
                 success = runSimulation(scene)
                 if success:
@@ -330,7 +397,7 @@ except KeyboardInterrupt:
     pass
 
 finally:
-    if args.simulate:
+    if args.simulate and not parallel:
         simulator.destroy()
 
 
@@ -128,18 +128,50 @@ class Samplable(LazilyEvaluable):
         self._conditioned = self  # version (partially) conditioned on requirements
 
     @staticmethod
-    def sampleAll(quantities):
+    def sampleAll(quantities, subsamples=None):
         """Sample all the given Samplables, which may have dependencies in common.
 
+        If **subsamples** is given, it should be a dictionary of values already sampled
+        as returned by a previous call to this method; it will be updated in place with
+        the values of the new quantities. This allows a set of quantities to be sampled
+        in several stages.
+
         Reproducibility note: the order in which the quantities are given can affect the
         order in which calls to random are made, affecting the final result.
+
+        .. versionchanged:: 3.1
+            Added the **subsamples** argument.
         """
-        subsamples = DefaultIdentityDict()
+        if subsamples is None:
+            subsamples = DefaultIdentityDict()
         for q in quantities:
             if q not in subsamples:
                 subsamples[q] = q.sample(subsamples) if needsSampling(q) else q
         return subsamples
 
+    @staticmethod
+    def sampleAllBatch(quantities, count):
+        """Draw several independent samples of the given Samplables at once.
+
+        Primitive distributions (and arithmetic on them) whose dependencies can be
+        sampled in batches are sampled immediately, with a single call to NumPy for all
+        the samples. All other values are sampled lazily, one sample at a time as in
+        `sampleAll`, as the samples are iterated over.
+
+        Reproducibility note: batched distributions use NumPy's global random number
+        generator rather than Python's, so the results will differ from those of
+        `sampleAll` even with the same random seeds.
+
+        Returns:
+            An iterator over **count** samples, each of which is either a dictionary of
+            sampled values as returned by `sampleAll` or, if the sample was rejected,
+            the corresponding `RejectionException`.
+        """
+        sampler = _BatchSampler(count)
+        for q in quantities:
+            sampler.prepare(q)
+        return sampler.samples()
+
     def sample(self, subsamples=None):
         """Sample this value, optionally given some values already sampled."""
         if subsamples is None:
@@ -161,6 +193,27 @@ class Samplable(LazilyEvaluable):
         """
         raise NotImplementedError
 
+    def sampleBatchGiven(self, values, count):
+        """Sample several values at once, given arrays of values for all dependencies.
+
+        Optionally implemented by subclasses; see `sampleAllBatch`. Classes which
+        override `sampleGiven` without overriding this method are sampled one sample
+        at a time.
+
+        Args:
+            values (DefaultIdentityDict): dictionary mapping each dependency to a NumPy
+                array of its sampled values (one per sample).
+            count (int): the number of values to sample.
+
+        Returns:
+            A NumPy array of **count** numbers, or a list of **count** values of any
+            other type (only numeric arrays are passed on to dependent values, which
+            otherwise are sampled one at a time). If the values cannot be sampled in a
+            batch (e.g. if some samples would have to be rejected), this method should
+            raise `NotImplementedError` so that they are sampled one at a time instead.
+        """
+        raise NotImplementedError("sampleBatchGiven() not supported by this samplable")
+
     def serializeValue(self, values, serializer):
         for child in self._conditioned._dependencies:
             serializer.writeSamplable(child, values)
@@ -183,6 +236,78 @@ class Samplable(LazilyEvaluable):
         return value
 
 
+@functools.lru_cache(maxsize=None)
+def _supportsBatchSampling(cls):
+    # Only use sampleBatchGiven if it is defined alongside the sampleGiven method
+    # which would otherwise be used, so that subclasses overriding sampleGiven
+    # don't silently inherit an inconsistent batch implementation.
+    for klass in cls.__mro__:
+        if "sampleGiven" in vars(klass):
+            return "sampleBatchGiven" in vars(klass)
+    return False
+
+
+def _isNumericBatch(values):
+    return isinstance(values, numpy.ndarray) and values.dtype.kind in "if"
+
+
+def _isNumericConstant(value):
+    return type(value) in (int, float)
+
+
+class _BatchSampler:
+    """Helper class implementing `Samplable.sampleAllBatch`."""
+
+    def __init__(self, count):
+        self.count = count
+        self.batches = DefaultIdentityDict()  # values sampled in batches
+        self.batched = []
+        self.unbatched = []  # values to sample individually, in dependency order
+        self.seen = set()
+
+    def prepare(self, q):
+        if id(q) in self.seen or not needsSampling(q):
+            return
+        self.seen.add(id(q))
+        conditioned = q._conditioned
+        deps = conditioned._dependencies
+        for child in deps:
+            self.prepare(child)
+
+        # Try sampling all values at once
+        if _supportsBatchSampling(type(conditioned)) and all(
+            dep in self.batches or not needsSampling(dep) for dep in deps
+        ):
+            try:
+                values = conditioned.sampleBatchGiven(self.batches, self.count)
+            except NotImplementedError:
+                pass
+            else:
+                if _isNumericBatch(values):
+                    assert values.shape == (self.count,)
+                    self.batches[q] = values
+                    values = values.tolist()
+                assert len(values) == self.count
+                self.batched.append((q, values))
+                return
+
+        # Otherwise we'll sample this value individually for each sample
+        self.unbatched.append(q)
+
+    def samples(self):
+        for i in range(self.count):
+            subsamples = DefaultIdentityDict()
+            for q, values in self.batched:
+                subsamples[q] = values[i]
+            try:
+                for q in self.unbatched:
+                    subsamples[q] = q._conditioned.sampleGiven(subsamples)
+            except RejectionException as e:
+                yield e
+            else:
+                yield subsamples
+
+
 class ConstantSamplable(Samplable):
     """A samplable which always evaluates to a constant value.
 
@@ -197,6 +322,11 @@ class ConstantSamplable(Samplable):
     def sampleGiven(self, value):
         return self.value
 
+    def sampleBatchGiven(self, values, count):
+        if not _isNumericConstant(self.value):
+            raise NotImplementedError
+        return numpy.full(count, self.value)
+
 
 class Distribution(Samplable):
     """Abstract class for distributions.
@@ -815,6 +945,22 @@ class OperatorDistribution(Distribution):
             )
         return result
 
+    def sampleBatchGiven(self, values, count):
+        func = _batchOperators.get(self.operator)
+        if func is None or self.kwoperands:
+            raise NotImplementedError
+        args = [values[self.object]]
+        args.extend(values[child] for child in self.operands)
+        if not all(_isNumericBatch(arg) or _isNumericConstant(arg) for arg in args):
+            raise NotImplementedError
+        if self.operator in ("__truediv__", "__rtruediv__"):
+            divisor = args[1] if self.operator == "__truediv__" else args[0]
+            if numpy.any(numpy.asarray(divisor) == 0):
+                # Division by zero must raise an exception as usual.
+                raise NotImplementedError
+        result = func(*args)
+        return numpy.broadcast_to(result, (count,))
+
     def evaluateInner(self, context):
         obj = valueInContext(self.object, context)
         operands = tuple(valueInContext(arg, context) for arg in self.operands)
@@ -918,6 +1064,24 @@ allowedReversibleOperators = {
 }
 
 
+# NumPy implementations of operators, for sampling values in batches.
+# Only operators which cannot raise exceptions on numbers are included (except
+# for division, where we check for zero divisors separately).
+_batchOperators = {
+    "__neg__": numpy.negative,
+    "__pos__": numpy.positive,
+    "__abs__": numpy.absolute,
+    "__add__": numpy.add,
+    "__radd__": lambda x, y: numpy.add(y, x),
+    "__sub__": numpy.subtract,
+    "__rsub__": lambda x, y: numpy.subtract(y, x),
+    "__mul__": numpy.multiply,
+    "__rmul__": lambda x, y: numpy.multiply(y, x),
+    "__truediv__": numpy.true_divide,
+    "__rtruediv__": lambda x, y: numpy.true_divide(y, x),
+}
+
+
 def makeOperatorHandler(op, ty):
     # Various special cases to simplify the expression forest by removing some
     # operations that do nothing (such as adding zero to a random number).
@@ -993,6 +1157,22 @@ class MultiplexerDistribution(Distribution):
         assert 0 <= idx < len(self.options), (idx, len(self.options))
         return value[self.options[idx]]
 
+    def sampleBatchGiven(self, values, count):
+        options = [values[opt] for opt in self.options]
+        kinds = set()
+        for option in options:
+            if _isNumericBatch(option):
+                kinds.add(option.dtype.kind)
+            elif _isNumericConstant(option):
+                kinds.add("i" if type(option) is int else "f")
+            else:
+                raise NotImplementedError
+        if len(kinds) != 1:
+            # Mixing ints and floats would change the types of the sampled values.
+            raise NotImplementedError
+        choices = numpy.stack(numpy.broadcast_arrays(*options, numpy.empty(count))[:-1])
+        return choices[values[self.index], numpy.arange(count)]
+
     def serializeValue(self, values, serializer):
         # We override this method to save space: we don't need to serialize all
         # of our options, only the one we're selecting.
@@ -1049,6 +1229,10 @@ class Range(Distribution):
     def sampleGiven(self, value):
         return random.uniform(value[self.low], value[self.high])
 
+    def sampleBatchGiven(self, values, count):
+        low, high = values[self.low], values[self.high]
+        return numpy.random.uniform(low, high, count)
+
     def evaluateInner(self, context):
         low = valueInContext(self.low, context)
         high = valueInContext(self.high, context)
@@ -1127,6 +1311,13 @@ class Normal(Distribution):
     def sampleGiven(self, value):
         return random.gauss(value[self.mean], value[self.stddev])
 
+    def sampleBatchGiven(self, values, count):
+        stddev = values[self.stddev]
+        if numpy.any(numpy.less(stddev, 0)):
+            # NumPy rejects negative standard deviations, unlike random.gauss.
+            raise NotImplementedError
+        return numpy.random.normal(values[self.mean], stddev, count)
+
     def evaluateInner(self, context):
         mean = valueInContext(self.mean, context)
         stddev = valueInContext(self.stddev, context)
@@ -1205,6 +1396,20 @@ class TruncatedNormal(Normal):
         p = alpha_cdf + unif * (beta_cdf - alpha_cdf)
         return mean + (stddev * Normal.cdfinv(0, 1, p))
 
+    def sampleBatchGiven(self, values, count):
+        import scipy.special  # slow import not often needed
+
+        mean, stddev = values[self.mean], values[self.stddev]
+        alpha = (self.low - mean) / stddev
+        beta = (self.high - mean) / stddev
+        alpha_cdf = scipy.special.ndtr(alpha)
+        beta_cdf = scipy.special.ndtr(beta)
+        if numpy.any(beta_cdf - alpha_cdf < 1e-15):
+            warnings.warn("low precision when sampling TruncatedNormal")
+        unif = numpy.random.random_sample(count)
+        p = alpha_cdf + unif * (beta_cdf - alpha_cdf)
+        return mean + (stddev * scipy.special.ndtri(p))
+
     def evaluateInner(self, context):
         mean = valueInContext(self.mean, context)
         stddev = valueInContext(self.stddev, context)
@@ -1264,6 +1469,19 @@ class DiscreteRange(Distribution):
             raise RejectionException(self.emptyMessage)
         return random.randint(left, right)
 
+    def sampleBatchGiven(self, values, count):
+        if self.weights:
+            total = self.cumulativeWeights[-1]
+            points = numpy.random.random_sample(count) * total
+            indices = numpy.searchsorted(self.cumulativeWeights, points, side="right")
+            return self.low + numpy.minimum(indices, len(self.options) - 1)
+        left = numpy.ceil(values[self.low]).astype(int)
+        right = numpy.floor(values[self.high]).astype(int)
+        if numpy.any(right < left):
+            # Some samples must be rejected; handle them individually.
+            raise NotImplementedError
+        return numpy.random.randint(left, right + 1, count)
+
     def supportInterval(self):
         ll, lh = supportInterval(self.low)
         hl, hh = supportInterval(self.high)
@@ -3,7 +3,6 @@
 import importlib
 import itertools
 import pathlib
-import pdb
 import sys
 import traceback
 import types
@@ -297,6 +296,8 @@ def optionallyDebugRejection(exc=None):
     if not postMortemRejections:
         return
     print("Scene/simulation rejected. Entering debugger...")
+    import pdb
+
     if exc:
         pdb.post_mortem(exc.__traceback__)
     else:
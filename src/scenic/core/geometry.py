@@ -113,6 +113,49 @@ def distanceToLine(point, a, b):
 makeShapelyPoint = shapely.lib.points
 
 
+def overlappingSpherePairs(centers, radii):
+    """Find all pairs of spheres which overlap (or touch).
+
+    Uses sort-and-sweep along the x-axis to find candidate pairs whose projections
+    overlap, then filters them with an exact sphere-sphere test, all vectorized
+    with NumPy.
+
+    Args:
+        centers: (n,3) array of sphere centers.
+        radii: (n,) array of sphere radii.
+
+    Returns:
+        A pair of integer arrays ``(first, second)`` such that ``first[k] < second[k]``
+        are the indices of the k-th overlapping pair. The pairs are sorted in
+        lexicographic order.
+    """
+    centers = np.asarray(centers, dtype=float).reshape((-1, 3))
+    radii = np.asarray(radii, dtype=float)
+    count = len(radii)
+    lows = centers[:, 0] - radii
+    highs = centers[:, 0] + radii
+
+    # Sort spheres by the lower end of their x-interval; the spheres which can
+    # overlap the i-th (in sorted order) are then those following it whose lower
+    # ends are at most its upper end.
+    order = np.argsort(lows, kind="stable")
+    ends = np.searchsorted(lows[order], highs[order], side="right")
+    counts = np.maximum(ends - np.arange(1, count + 1), 0)
+    total = int(counts.sum())
+    starts = np.cumsum(counts) - counts
+    firstSorted = np.repeat(np.arange(count), counts)
+    secondSorted = firstSorted + 1 + (np.arange(total) - np.repeat(starts, counts))
+    first, second = order[firstSorted], order[secondSorted]
+
+    # Narrow down to pairs whose spheres actually overlap
+    dists = np.linalg.norm(centers[first] - centers[second], axis=1)
+    overlapping = dists <= radii[first] + radii[second]
+    first, second = first[overlapping], second[overlapping]
+    lower, upper = np.minimum(first, second), np.maximum(first, second)
+    ordering = np.lexsort((upper, lower))
+    return lower[ordering], upper[ordering]
+
+
 def polygonUnion(polys, buf=0, tolerance=0, holeTolerance=0.002):
     if not polys:
         return shapely.geometry.Polygon()
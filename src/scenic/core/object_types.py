@@ -21,6 +21,7 @@ import random
 import typing
 import warnings
 
+import fcl
 import numpy as np
 import shapely
 import shapely.affinity
@@ -135,6 +136,35 @@ class Constructible(Samplable):
                         clearers[attr] = clearer
         cls._cache_clearers = clearers
 
+        # Determine which properties each cached value depends on (if known), so
+        # that only the caches affected by a change to some properties are cleared.
+        directDeps = {}
+        for attr in clearers:
+            value = next(sc.__dict__[attr] for sc in cls.__mro__ if attr in sc.__dict__)
+            if isinstance(value, property):
+                value = value.fget
+            directDeps[attr] = getattr(value, "_scenic_cache_dependencies", None)
+
+        def resolveDeps(attr, active):
+            deps = directDeps[attr]
+            if deps is None or attr in active:
+                return None
+            props = set()
+            for dep in deps:
+                if dep in directDeps:  # depends on another cached value
+                    subdeps = resolveDeps(dep, active | {attr})
+                    if subdeps is None:
+                        return None
+                    props.update(subdeps)
+                else:
+                    props.add(dep)
+            return frozenset(props)
+
+        cls._cache_dependencies = {
+            attr: resolveDeps(attr, frozenset()) for attr in clearers
+        }
+        cls._cache_clearersByChange = {}
+
         # Find all defaults provided by the class or its superclasses
         allDefs = collections.defaultdict(list)
 
@@ -448,10 +478,16 @@ class Constructible(Samplable):
         )
         return properties, constProps
 
-    def _recomputeDynamicFinals(self):
+    def _recomputeDynamicFinals(self, changed=None):
         # Evaluate default value expression for each dynamic final property
-        # and assign the obtained value
+        # and assign the obtained value. If the set of properties which have changed
+        # is given, only recompute the properties depending on them (adding those
+        # to the set).
         for prop, recomputer in self._dynamicFinalProperties.items():
+            if changed is not None:
+                if changed.isdisjoint(self._defaults[prop].requiredProperties):
+                    continue
+                changed.add(prop)
             rawVal = recomputer(self)
             value = valueInContext(rawVal, self)
             self._specify(self, prop, value)
@@ -534,11 +570,19 @@ class Constructible(Samplable):
         if behavior := newprops["behavior"]:
             behavior._assignTo(self)
 
+        self._propertiesChanged()
         return oldVals
 
     def _revert(self, oldVals):
         for prop, val in oldVals.items():
             object.__setattr__(self, prop, val)
+        self._propertiesChanged()
+
+    def _propertiesChanged(self):
+        # Update derived values after properties have been changed other than by
+        # the simulator (which skips objects whose dynamic properties are unchanged).
+        self._recomputeDynamicFinals()
+        self._clearCaches()
 
     def sampleGiven(self, value):
         if not needsSampling(self):
@@ -561,8 +605,28 @@ class Constructible(Samplable):
         constProps = self._constProps.difference(overrides)
         return self._withProperties(props, constProps=constProps)
 
-    def _clearCaches(self):
-        for clearer in self._cache_clearers.values():
+    def _clearCaches(self, changed=None):
+        """Clear cached values derived from the properties of this object.
+
+        Args:
+            changed: Set of properties which have changed. If given, only the cached
+                values which depend on these properties (or whose dependencies are
+                unknown) are cleared; otherwise all are.
+        """
+        if changed is None:
+            clearers = self._cache_clearers.values()
+        else:
+            changed = frozenset(changed)
+            clearers = self._cache_clearersByChange.get(changed)
+            if clearers is None:
+                clearers = tuple(
+                    clearer
+                    for attr, clearer in self._cache_clearers.items()
+                    if (deps := self._cache_dependencies[attr]) is None
+                    or not deps.isdisjoint(changed)
+                )
+                self._cache_clearersByChange[changed] = clearers
+        for clearer in clearers:
             clearer(self)
 
     def dumpAsScenicCode(self, stream, skipConstProperties=True):
@@ -753,7 +817,7 @@ class Point(Constructible):
         "_nonObservingEntity": None,
     }
 
-    @cached_property
+    @cached_property(dependencies=("position", "visibleDistance"))
     def visibleRegion(self):
         """The :term:`visible region` of this object.
 
@@ -773,6 +837,15 @@ class Point(Constructible):
             occludingObjects: A list of objects that can occlude visibility.
         """
         return canSee(
+            target=other,
+            occludingObjects=occludingObjects,
+            debug=debug,
+            **self._visibilityParameters(),
+        )
+
+    def _visibilityParameters(self):
+        """The parameters describing this viewer for use by `scenic.core.visibility`."""
+        return dict(
             position=self.position,
             orientation=None,
             visibleDistance=self.visibleDistance,
@@ -780,12 +853,9 @@ class Point(Constructible):
             rayCount=self.viewRayCount,
             rayDensity=self.viewRayDensity,
             distanceScaling=self.viewRayDistanceScaling,
-            target=other,
-            occludingObjects=occludingObjects,
-            debug=debug,
         )
 
-    @cached_property
+    @cached_property(dependencies=("position",))
     def corners(self):
         return (self.position,)
 
@@ -902,7 +972,9 @@ class OrientedPoint(Point):
                 min(self.viewAngles[1], math.pi),
             )
 
-    @cached_property
+    @cached_property(
+        dependencies=("position", "orientation", "visibleDistance", "viewAngles")
+    )
     def visibleRegion(self):
         """The :term:`visible region` of this object.
 
@@ -930,6 +1002,14 @@ class OrientedPoint(Point):
             occludingObjects: A list of objects that can occlude visibility.
         """
         return canSee(
+            target=other,
+            occludingObjects=occludingObjects,
+            debug=debug,
+            **self._visibilityParameters(),
+        )
+
+    def _visibilityParameters(self):
+        return dict(
             position=self.position,
             orientation=self.orientation,
             visibleDistance=self.visibleDistance,
@@ -937,9 +1017,6 @@ class OrientedPoint(Point):
             rayCount=self.viewRayCount,
             rayDensity=self.viewRayDensity,
             distanceScaling=self.viewRayDistanceScaling,
-            target=other,
-            occludingObjects=occludingObjects,
-            debug=debug,
         )
 
     def relativize(self, vec):
@@ -949,6 +1026,18 @@ class OrientedPoint(Point):
     def relativePosition(self, vec):
         return self.position.offsetLocally(self.orientation, vec)
 
+    def _relativePositions(self, offsets):
+        """Batch version of `relativePosition` for a sequence of offset tuples."""
+        position, orientation = self.position, self.orientation
+        if (
+            isLazy(position)
+            or isLazy(orientation)
+            or any(isLazy(coord) for offset in offsets for coord in offset)
+        ):
+            return tuple(self.relativePosition(Vector(*offset)) for offset in offsets)
+        points = orientation._rotateMany(offsets) + position.coordinates
+        return tuple(Vector(*point) for point in points.tolist())
+
     def distancePast(self, vec):
         """Distance past a given point, assuming we've been moving in a straight line."""
         diff = self.position - vec
@@ -964,6 +1053,11 @@ class OrientedPoint(Point):
 ## Object
 
 
+# Properties determining the position and extent of an object's bounding box
+_boxDependencies = ("position", "orientation", "width", "length", "height")
+_poseProperties = frozenset(("position", "orientation"))
+
+
 class Object(OrientedPoint):
     """The Scenic class ``Object``.
 
@@ -1143,6 +1237,24 @@ class Object(OrientedPoint):
         ):
             return self._boundingPolygon.intersects(other.polygons)
 
+        # For two objects with fixed bounds, first compare their bounding spheres, then
+        # check for collisions using the cached collision geometry of their shapes;
+        # this avoids building meshes for their occupied spaces in most cases.
+        if isinstance(other, Object) and self._hasStaticBounds and other._hasStaticBounds:
+            if self.position.distanceTo(other.position) > self.radius + other.radius:
+                return False
+
+            request = fcl.CollisionRequest()
+            result = fcl.CollisionResult()
+            if fcl.collide(
+                self._collisionObject(), other._collisionObject(), request, result
+            ):
+                return True
+
+            # The collision check detects containment as well for convex shapes
+            if self._isConvex and other._isConvex:
+                return False
+
         ## Default Case
         # Extract other's occupied space if it's an object
         if isinstance(other, Object):
@@ -1157,79 +1269,87 @@ class Object(OrientedPoint):
 
         return self.occupiedSpace.intersects(other_occupied_space)
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def left(self):
         return self.relativize(Vector(-self.hw, 0))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def right(self):
         return self.relativize(Vector(self.hw, 0))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def front(self):
         return self.relativize(Vector(0, self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def back(self):
         return self.relativize(Vector(0, -self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def top(self):
         return self.relativize(Vector(0, 0, self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def bottom(self):
         return self.relativize(Vector(0, 0, -self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def frontLeft(self):
         return self.relativize(Vector(-self.hw, self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def frontRight(self):
         return self.relativize(Vector(self.hw, self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def backLeft(self):
         return self.relativize(Vector(-self.hw, -self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def backRight(self):
         return self.relativize(Vector(self.hw, -self.hl))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def topFrontLeft(self):
         return self.relativize(Vector(-self.hw, self.hl, self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def topFrontRight(self):
         return self.relativize(Vector(self.hw, self.hl, self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def topBackLeft(self):
         return self.relativize(Vector(-self.hw, -self.hl, self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def topBackRight(self):
         return self.relativize(Vector(self.hw, -self.hl, self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def bottomFrontLeft(self):
         return self.relativize(Vector(-self.hw, self.hl, -self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def bottomFrontRight(self):
         return self.relativize(Vector(self.hw, self.hl, -self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def bottomBackLeft(self):
         return self.relativize(Vector(-self.hw, -self.hl, -self.hh))
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def bottomBackRight(self):
         return self.relativize(Vector(self.hw, -self.hl, -self.hh))
 
-    @cached_property
+    @cached_property(
+        dependencies=(
+            "position",
+            "orientation",
+            "cameraOffset",
+            "visibleDistance",
+            "viewAngles",
+        )
+    )
     def visibleRegion(self):
         """The :term:`visible region` of this object.
 
@@ -1254,8 +1374,16 @@ class Object(OrientedPoint):
               for visibility.
             occludingObjects: A list of objects that can occlude visibility.
         """
-        true_position = self.position.offsetLocally(self.orientation, self.cameraOffset)
         return canSee(
+            target=other,
+            occludingObjects=occludingObjects,
+            debug=debug,
+            **self._visibilityParameters(),
+        )
+
+    def _visibilityParameters(self):
+        true_position = self.position.offsetLocally(self.orientation, self.cameraOffset)
+        return dict(
             position=true_position,
             orientation=self.orientation,
             visibleDistance=self.visibleDistance,
@@ -1263,38 +1391,34 @@ class Object(OrientedPoint):
             rayCount=self.viewRayCount,
             rayDensity=self.viewRayDensity,
             distanceScaling=self.viewRayDistanceScaling,
-            target=other,
-            occludingObjects=occludingObjects,
-            debug=debug,
         )
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def corners(self):
         """A tuple containing the corners of this object's bounding box"""
         hw, hl, hh = self.hw, self.hl, self.hh
-        return (
-            self.relativePosition(Vector(hw, hl, hh)),
-            self.relativePosition(Vector(-hw, hl, hh)),
-            self.relativePosition(Vector(-hw, -hl, hh)),
-            self.relativePosition(Vector(hw, -hl, hh)),
-            self.relativePosition(Vector(hw, hl, -hh)),
-            self.relativePosition(Vector(-hw, hl, -hh)),
-            self.relativePosition(Vector(-hw, -hl, -hh)),
-            self.relativePosition(Vector(hw, -hl, -hh)),
+        return self._relativePositions(
+            (
+                (hw, hl, hh),
+                (-hw, hl, hh),
+                (-hw, -hl, hh),
+                (hw, -hl, hh),
+                (hw, hl, -hh),
+                (-hw, hl, -hh),
+                (-hw, -hl, -hh),
+                (hw, -hl, -hh),
+            )
         )
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies)
     def _corners2D(self):
         hw, hl = self.hw, self.hl
         # Note: 2D show method assumes cyclic order of vertices
-        return (
-            self.relativePosition(Vector(hw, hl)),
-            self.relativePosition(Vector(-hw, hl)),
-            self.relativePosition(Vector(-hw, -hl)),
-            self.relativePosition(Vector(hw, -hl)),
+        return self._relativePositions(
+            ((hw, hl, 0), (-hw, hl, 0), (-hw, -hl, 0), (hw, -hl, 0))
         )
 
-    @cached_property
+    @cached_property(dependencies=_boxDependencies + ("shape",))
     def occupiedSpace(self):
         """A region representing the space this object occupies"""
         shape = self.shape
@@ -1308,6 +1432,33 @@ class Object(OrientedPoint):
             _isConvex=shape.isConvex,
         )
 
+    def _clearCaches(self, changed=None):
+        # If only the pose of this object has changed, move its occupied space into
+        # place rather than building it again from the object's shape.
+        space = None
+        deps = self._cache_dependencies.get("occupiedSpace")
+        if changed is not None and deps is not None and not changed.isdisjoint(deps):
+            if changed.isdisjoint(deps - _poseProperties):
+                try:
+                    space = self.__getattribute__("_cached_occupiedSpace")
+                except AttributeError:
+                    pass
+        super()._clearCaches(changed)
+        if type(space) is MeshVolumeRegion:
+            self._cached_occupiedSpace = space._moved(self.position, self.orientation)
+
+    def _collisionObject(self):
+        """An FCL collision object for the space this object occupies.
+
+        Uses the cached collision geometry of the object's shape, placed with a rigid
+        transform, rather than building a new mesh like `occupiedSpace`.
+        """
+        geometry = self.shape.collisionGeometry((self.width, self.length, self.height))
+        orientation = self.orientation
+        quaternion = (orientation.w, orientation.x, orientation.y, orientation.z)
+        transform = fcl.Transform(quaternion, tuple(self.position))
+        return fcl.CollisionObject(geometry, transform)
+
     @property
     def _isConvex(self):
         """Whether this object's shape is convex"""
@@ -1325,12 +1476,12 @@ class Object(OrientedPoint):
         )
         return not any(needsSampling(v) for v in deps)
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace",))
     def boundingBox(self):
         """A region representing this object's bounding box"""
         return MeshVolumeRegion(self.occupiedSpace.mesh.bounding_box, centerMesh=False)
 
-    @cached_property
+    @cached_property(dependencies=("width", "length", "height", "shape"))
     def inradius(self):
         """A lower bound on the inradius of this object"""
 
@@ -1391,7 +1542,7 @@ class Object(OrientedPoint):
         # Return the inradius (possibly a distribution) with proper support information
         return inradiusActual(self.width, self.length, self.height, self.shape)
 
-    @cached_property
+    @cached_property(dependencies=("width", "length", "shape"))
     def planarInradius(self):
         """A lower bound on the planar inradius of this object.
 
@@ -1453,12 +1604,12 @@ class Object(OrientedPoint):
         # Return the planar inradius (possibly a distribution) with proper support information
         return planarInradiusActual(self.width, self.length, self.shape)
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace",))
     def surface(self):
         """A region containing the entire surface of this object"""
         return self.occupiedSpace.getSurfaceRegion()
 
-    @cached_property
+    @cached_property(dependencies=("topSurface",))
     def onSurface(self):
         """The surface used by the ``on`` specifier.
 
@@ -1469,7 +1620,7 @@ class Object(OrientedPoint):
         """
         return self.topSurface
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def topSurface(self):
         """A region containing the top surface of this object
 
@@ -1482,7 +1633,7 @@ class Object(OrientedPoint):
             thresholds=self.sideComponentThresholds,
         )
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def rightSurface(self):
         """A region containing the right surface of this object
 
@@ -1495,7 +1646,7 @@ class Object(OrientedPoint):
             thresholds=self.sideComponentThresholds,
         )
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def leftSurface(self):
         """A region containing the left surface of this object
 
@@ -1508,7 +1659,7 @@ class Object(OrientedPoint):
             thresholds=self.sideComponentThresholds,
         )
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def frontSurface(self):
         """A region containing the front surface of this object
 
@@ -1521,7 +1672,7 @@ class Object(OrientedPoint):
             thresholds=self.sideComponentThresholds,
         )
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def backSurface(self):
         """A region containing the back surface of this object
 
@@ -1534,7 +1685,7 @@ class Object(OrientedPoint):
             thresholds=self.sideComponentThresholds,
         )
 
-    @cached_property
+    @cached_property(dependencies=("occupiedSpace", "sideComponentThresholds"))
     def bottomSurface(self):
         """A region containing the bottom surface of this object
 
@@ -1630,7 +1781,7 @@ class Object(OrientedPoint):
         plt.fill(x, y, "w")
         plt.plot(x + (x[0],), y + (y[0],), color="k", linewidth=1)
 
-    @cached_property
+    @cached_property(dependencies=("shape", "orientation"))
     def _isPlanarBox(self):
         """Whether this object is a box aligned with the XY plane."""
         return (
@@ -1639,7 +1790,7 @@ class Object(OrientedPoint):
             and self.orientation.roll == 0
         )
 
-    @cached_property
+    @cached_property(dependencies=("_isPlanarBox", "occupiedSpace"))
     def _boundingPolygon(self):
         # Fast case for planar boxes
         if self._isPlanarBox:
@@ -1736,7 +1887,7 @@ class Point2D(Point):
     _scenic_properties = {}
     _3DClass = Point
 
-    @cached_property
+    @cached_property(dependencies=("position", "visibleDistance"))
     def visibleRegion(self):
         """The :term:`visible region` of this 2D point.
 
@@ -1806,7 +1957,7 @@ class OrientedPoint2D(Point2D, OrientedPoint):
                 newspecs.append(spec)
         return newspecs
 
-    @cached_property
+    @cached_property(dependencies=("position", "heading", "visibleDistance", "viewAngle"))
     def visibleRegion(self):
         """The :term:`visible region` of this 2D oriented point.
 
@@ -1849,7 +2000,15 @@ class Object2D(OrientedPoint2D, Object):
 
         super()._specify(context, prop, value)
 
-    @cached_property
+    @cached_property(
+        dependencies=(
+            "position",
+            "heading",
+            "cameraOffset",
+            "visibleDistance",
+            "viewAngle",
+        )
+    )
     def visibleRegion(self):
         """The :term:`visible region` of this 2D object.
 
@@ -576,23 +576,38 @@ def feasibleRHPolygon(
     ):
         return None
     polygons = []
-    expanded = [(poly.buffer(maxDist), heading) for poly, heading in tField.cells]
-    for baseCell, baseHeading in field.cells:
+    expanded = [
+        (cell.buffer(maxDist), lower, upper)
+        for cell, lower, upper in tField.cellHeadingBounds()
+    ]
+    tree = shapely.STRtree([cell for cell, lower, upper in expanded])
+    for baseCell, baseLower, baseUpper in field.cellHeadingBounds():
         # TODO skip cells not contained in base region?
-        for expandedTargetCell, targetHeading in expanded:
+        baseHeading, baseL, baseR = _widenOffsets(baseLower, baseUpper, offsetL, offsetR)
+        candidates = tree.query(baseCell, predicate="intersects")
+        for index in sorted(candidates):
+            expandedTargetCell, targetLower, targetUpper = expanded[index]
+            targetHeading, targetL, targetR = _widenOffsets(
+                targetLower, targetUpper, tOffsetL, tOffsetR
+            )
             lower, upper = relativeHeadingRange(
-                baseHeading, offsetL, offsetR, targetHeading, tOffsetL, tOffsetR
+                baseHeading, baseL, baseR, targetHeading, targetL, targetR
             )
             if upper >= lowerBound and lower <= upperBound:  # RH intervals overlap
                 intersection = baseCell & expandedTargetCell
-                if not intersection.is_empty:
-                    assert isinstance(
-                        intersection, shapely.geometry.Polygon
-                    ), intersection
-                    polygons.append(intersection)
+                for part in shapely.get_parts(intersection):
+                    if isinstance(part, shapely.geometry.Polygon):
+                        polygons.append(part)
     return polygonUnion(polygons)
 
 
+def _widenOffsets(lower, upper, offsetL, offsetR):
+    """Fold bounds on a heading into the bounds on a disturbance added to it."""
+    if lower is None or (upper - lower) + (offsetR - offsetL) >= math.tau:
+        return None, offsetL, offsetR
+    return lower, offsetL, offsetR + (upper - lower)
+
+
 def relativeHeadingRange(
     baseHeading, offsetL, offsetR, targetHeading, tOffsetL, tOffsetR
 ):
@@ -8,6 +8,7 @@ Manipulations of meshes is done using the
 """
 
 from abc import ABC, abstractmethod
+import bisect
 import itertools
 import math
 import random
@@ -48,6 +49,7 @@ from scenic.core.geometry import (
     headingOfSegment,
     hypot,
     makeShapelyPoint,
+    normalizeAngle,
     plotPolygon,
     pointIsInCone,
     polygonUnion,
@@ -261,6 +263,13 @@ class PointInRegionDistribution(VectorDistribution):
     def sampleGiven(self, value):
         return value[self.region].uniformPointInner()
 
+    def sampleBatchGiven(self, values, count):
+        region = values[self.region]
+        if not isinstance(region, PolygonalRegion):
+            raise NotImplementedError
+        points = region.uniformPoints(count).tolist()
+        return [region.orient(Vector(*point)) for point in points]
+
     @property
     def heading(self):
         if self.region.orientation is not None:
@@ -741,6 +750,20 @@ def orientationFor(first, second, reversed):
     return o1
 
 
+def _toPointArray(points, dim=3):
+    """Convert points to an array of shape (N, 2) or (N, 3).
+
+    Arrays are used as they are; other sequences of points are converted to arrays
+    with **dim** coordinates per point.
+    """
+    if not isinstance(points, numpy.ndarray):
+        points = [toVector(point).coordinates[:dim] for point in points]
+        points = numpy.array(points, dtype=float).reshape(-1, dim)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError("points must be an array of shape (N, 2) or (N, 3)")
+    return points
+
+
 class UndefinedSamplingException(Exception):
     pass
 
@@ -1075,9 +1098,14 @@ class MeshVolumeRegion(MeshRegion):
         onDirection: The direction to use if an object being placed on this region doesn't specify one.
     """
 
+    #: Number of calls to `containsObject` after which to build the voxel
+    #: approximations used to accelerate it (see `_VoxelContainmentGrid`).
+    _containmentGridThreshold = 16
+
     def __init__(self, *args, _internal=False, _isConvex=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._isConvex = _isConvex
+        self._containmentQueries = 0
 
         if isLazy(self):
             return
@@ -1095,17 +1123,24 @@ class MeshVolumeRegion(MeshRegion):
                 " Consider using scenic.core.utils.repairMesh."
             )
 
+    @cached_property
+    def num_samples(self):
+        """Number of samples to take when rejection sampling the volume of this region.
+
+        Computed lazily, since this requires the volume of the mesh, and many regions
+        (e.g. the occupied spaces of objects) are never sampled from.
+        """
         # Compute how many samples are necessary to achieve 99% probability
         # of success when rejection sampling volume.
         p_volume = self._mesh.volume / self._mesh.bounding_box.volume
 
         if p_volume > 0.99:
-            self.num_samples = 1
+            num_samples = 1
         else:
-            self.num_samples = min(1e6, max(1, math.ceil(math.log(0.01, 1 - p_volume))))
+            num_samples = min(1e6, max(1, math.ceil(math.log(0.01, 1 - p_volume))))
 
         # Always try to take at least 8 samples to avoid surface point total rejections
-        self.num_samples = max(self.num_samples, 8)
+        return max(num_samples, 8)
 
     # Property testing methods #
     @distributionFunction
@@ -1322,6 +1357,18 @@ class MeshVolumeRegion(MeshRegion):
             return numpy.all(vertex_distances > 0)
 
         # PASS 3
+        # If this region has been queried many times (e.g. because it is the workspace),
+        # use conservative voxel approximations of its inside and outside, which can
+        # decide most objects not close to the boundary of the region.
+        self._containmentQueries += 1
+        if self._containmentQueries >= self._containmentGridThreshold:
+            grid = self._containmentGrid
+            if grid is not None:
+                contained = grid.containsObject(obj)
+                if contained is not None:
+                    return contained
+
+        # PASS 4
         # Take the object's position if contained in the mesh, or a random sample otherwise.
         # Then check if the point is not in the region, return False if so. Otherwise, compute
         # the circumradius of the object from that point and see if the closest point on the
@@ -1363,7 +1410,7 @@ class MeshVolumeRegion(MeshRegion):
             if region_distance > obj_circumradius:
                 return True
 
-        # PASS 4
+        # PASS 5
         # Take the region's center_mass if contained in the mesh, or a random sample otherwise.
         # Then get the circumradius of the region from that point and the farthest point on
         # the object from this point. If the maximum distance is greater than the circumradius,
@@ -1394,7 +1441,7 @@ class MeshVolumeRegion(MeshRegion):
             if obj_max_distance > reg_circumradius:
                 return False
 
-        # PASS 5
+        # PASS 6
         # If the difference between the object's region and this region is empty,
         # i.e. obj_region - self_region = EmptyRegion, that means the object is
         # entirely contained in this region.
@@ -1749,6 +1796,14 @@ class MeshVolumeRegion(MeshRegion):
     def isConvex(self):
         return self.mesh.is_convex if self._isConvex is None else self._isConvex
 
+    @cached_property
+    def _containmentGrid(self):
+        try:
+            return _VoxelContainmentGrid(self.mesh)
+        except ValueError:
+            # e.g. the mesh is degenerate; fall back on the exact checks
+            return None
+
     @property
     def dimensionality(self):
         return 3
@@ -1762,6 +1817,44 @@ class MeshVolumeRegion(MeshRegion):
         """Returns a VoxelRegion representing a filled voxelization of this mesh"""
         return VoxelRegion(voxelGrid=self.mesh.voxelized(pitch).fill(), lazy=lazy)
 
+    def _moved(self, position, rotation):
+        """This region with its mesh placed at a different position and rotation.
+
+        Gives the same region as constructing it again from the same base mesh and
+        dimensions, but is cheaper since the already-scaled mesh is only moved by a
+        rigid transformation.
+        """
+        assert not isLazy(self)
+        position, rotation = toVector(position), toOrientation(rotation)
+        if self.rotation is None:
+            delta = rotation.r
+        else:
+            delta = rotation.r * self.rotation.r.inv()
+        offset = numpy.array(position, dtype=float)
+        if self.position is not None:
+            offset -= delta.apply(numpy.array(self.position))
+        region = MeshVolumeRegion(
+            self.mesh,
+            position=offset,
+            rotation=Orientation(delta),
+            orientation=(
+                True
+                if self.__dict__.get("_usingDefaultOrientation", False)
+                else self.orientation
+            ),
+            tolerance=self.tolerance,
+            centerMesh=False,
+            onDirection=self.onDirection,
+            name=self.name,
+            _internal=True,
+            _isConvex=self._isConvex,
+        )
+        region.dimensions = self.dimensions
+        region.position = position
+        region.rotation = rotation
+        region.centerMesh = self.centerMesh
+        return region
+
     @distributionFunction
     def _erodeOverapproximate(self, maxErosion, pitch):
         """Compute an overapproximation of this region eroded.
@@ -2115,6 +2208,107 @@ class SpheroidRegion(MeshVolumeRegion):
         )
 
 
+class _VoxelContainmentGrid:
+    """Conservative voxel approximations of the inside and outside of a mesh.
+
+    The voxels touching the surface of the mesh are marked by subdividing the mesh
+    and marking the voxels overlapping the bounding box of each triangle. The remaining
+    voxels contain no part of the surface, so each connected component of them lies
+    entirely inside or entirely outside the mesh, which we determine by testing a
+    single point of the component.
+
+    Args:
+        mesh: A `trimesh.base.Trimesh` which is a well-defined volume.
+        resolution: Number of voxels along the longest side of the mesh's bounding box.
+    """
+
+    def __init__(self, mesh, resolution=64):
+        # Set up a grid extending at least one voxel beyond the mesh on every side
+        pitch = max(mesh.extents) / resolution
+        self.pitch = pitch
+        self.origin = mesh.bounds[0] - 2 * pitch
+        self.shape = numpy.ceil(mesh.extents / pitch).astype(int) + 5
+
+        # Mark the voxels touching the surface. We subdivide the mesh so that the
+        # bounding box of each triangle spans at most 3 voxels along each axis, and
+        # pad it slightly so that surfaces lying on voxel boundaries mark both sides.
+        maxEdge = 2 * pitch
+        longestEdge = numpy.max(mesh.edges_unique_length)
+        maxIter = max(math.ceil(math.log2(longestEdge / maxEdge)), 0)
+        vertices, faces = trimesh.remesh.subdivide_to_size(
+            mesh.vertices, mesh.faces, max_edge=maxEdge, max_iter=maxIter
+        )
+        triangles = vertices[faces]
+        epsilon = 1e-3 * pitch
+        low = self.voxelIndices(triangles.min(axis=1) - epsilon)
+        high = self.voxelIndices(triangles.max(axis=1) + epsilon)
+        marked = numpy.zeros(self.shape, dtype=bool)
+        for offset in itertools.product(range(4), repeat=3):
+            indices = low + offset
+            valid = numpy.all(indices <= high, axis=1)
+            marked[tuple(indices[valid].T)] = True
+
+        # Classify each connected component of the unmarked voxels as inside or
+        # outside the mesh
+        free = ~marked
+        labels, numLabels = scipy.ndimage.label(free)
+        labelIDs, firstVoxels = numpy.unique(labels, return_index=True)
+        indices = numpy.column_stack(numpy.unravel_index(firstVoxels, labels.shape))
+        componentInside = numpy.zeros(numLabels + 1, dtype=bool)
+        componentInside[labelIDs] = mesh.contains(self.origin + indices * pitch)
+        componentInside[0] = False  # label 0 is the marked voxels
+        inside = componentInside[labels]
+        self.outside = free & ~inside
+
+        # Store prefix sums of the voxels not known to be inside, so that we can tell
+        # in constant time whether a box lies entirely inside
+        notInside = numpy.zeros(self.shape + 1, dtype=numpy.int32)
+        notInside[1:, 1:, 1:] = (~inside).cumsum(0).cumsum(1).cumsum(2)
+        self.notInside = notInside
+
+    def voxelIndices(self, points):
+        return numpy.floor((points - self.origin) / self.pitch + 0.5).astype(int)
+
+    def containsObject(self, obj):
+        """Check if the mesh contains an object, if it can be decided conservatively.
+
+        Returns:
+            True if the object is contained in the mesh, False if it is not, or None
+            if that cannot be determined from the voxel approximations.
+        """
+        objMesh = obj.occupiedSpace.mesh
+
+        # If the bounding box of the object is covered by voxels inside the mesh, the
+        # object is contained in it
+        low, high = self.voxelIndices(objMesh.bounds)
+        if numpy.all(low >= 0) and numpy.all(high < self.shape):
+            S = self.notInside
+            (x0, y0, z0), (x1, y1, z1) = low, high + 1
+            count = (
+                S[x1, y1, z1]
+                - S[x0, y1, z1]
+                - S[x1, y0, z1]
+                - S[x1, y1, z0]
+                + S[x0, y0, z1]
+                + S[x0, y1, z0]
+                + S[x1, y0, z0]
+                - S[x0, y0, z0]
+            )
+            if count == 0:
+                return True
+
+        # If some vertex of the object lies in a voxel outside the mesh (or outside
+        # the grid, which extends beyond the mesh), the object is not contained in it
+        indices = self.voxelIndices(objMesh.vertices)
+        inGrid = numpy.all((indices >= 0) & (indices < self.shape), axis=1)
+        if not numpy.all(inGrid):
+            return False
+        if numpy.any(self.outside[tuple(indices.T)]):
+            return False
+
+        return None
+
+
 class VoxelRegion(Region):
     """(WIP) Region represented by a voxel grid in 3D space.
 
@@ -2840,21 +3034,54 @@ class PolygonalRegion(Region):
         for polygon in self.polygons.geoms:
             triangles.extend(triangulatePolygon(polygon))
         assert len(triangles) > 0, self.polygons
-        shapely.prepare(triangles)
-        trianglesAndBounds = tuple((tri, tri.bounds) for tri in triangles)
-        areas = (triangle.area for triangle in triangles)
-        cumulativeTriangleAreas = tuple(itertools.accumulate(areas))
-        return trianglesAndBounds, cumulativeTriangleAreas
+        # Array of triangles, each given by the (x, y) coordinates of its 3 vertices
+        vertices = shapely.get_coordinates(triangles).reshape(-1, 4, 2)[:, :3]
+        areas = shapely.area(triangles)
+        cumulativeTriangleAreas = numpy.cumsum(areas)
+        return vertices, cumulativeTriangleAreas
+
+    @cached_property
+    def _samplingTriangles(self):
+        # Python version of _samplingData, which is faster for individual samples.
+        vertices, cumulativeAreas = self._samplingData
+        return tuple(map(tuple, vertices.tolist())), tuple(cumulativeAreas.tolist())
 
     def uniformPointInner(self):
-        trisAndBounds, cumulativeAreas = self._samplingData
-        triangle, bounds = random.choices(trisAndBounds, cum_weights=cumulativeAreas)[0]
-        minx, miny, maxx, maxy = bounds
-        # TODO improve?
-        while True:
-            x, y = random.uniform(minx, maxx), random.uniform(miny, maxy)
-            if shapely.intersects_xy(triangle, x, y):
-                return self.orient(Vector(x, y, self.z))
+        triangles, cumulativeAreas = self._samplingTriangles
+        triangle = random.choices(triangles, cum_weights=cumulativeAreas)[0]
+        (ax, ay), (bx, by), (cx, cy) = triangle
+        # Sample uniformly from the triangle using barycentric coordinates
+        u, v = random.random(), random.random()
+        if u + v > 1:
+            u, v = 1 - u, 1 - v
+        x = ax + u * (bx - ax) + v * (cx - ax)
+        y = ay + u * (by - ay) + v * (cy - ay)
+        return self.orient(Vector(x, y, self.z))
+
+    def uniformPoints(self, count):
+        """Sample several points uniformly at random from this region at once.
+
+        Like `sampleAllBatch`, this uses NumPy's global random number generator rather
+        than Python's. Preferred orientations are not applied.
+
+        .. versionadded:: 3.1
+
+        Args:
+            count (int): The number of points to sample.
+
+        Returns:
+            A NumPy array of shape (**count**, 3) whose rows are the sampled points.
+        """
+        vertices, cumulativeAreas = self._samplingData
+        targets = numpy.random.random_sample(count) * cumulativeAreas[-1]
+        indices = numpy.searchsorted(cumulativeAreas, targets, side="right")
+        triangles = vertices[numpy.minimum(indices, len(vertices) - 1)]
+        u, v = numpy.random.random_sample((2, count, 1))
+        flip = (u + v) > 1
+        u, v = numpy.where(flip, 1 - u, u), numpy.where(flip, 1 - v, v)
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        points = a + u * (b - a) + v * (c - a)
+        return numpy.column_stack((points, numpy.full(count, float(self.z))))
 
     @distributionFunction
     def intersects(self, other, triedReversed=False):
@@ -3135,6 +3362,14 @@ class CircularRegion(PolygonalRegion):
         pt = Vector(x + (r * cos(t)), y + (r * sin(t)), z)
         return self.orient(pt)
 
+    def uniformPoints(self, count):
+        x, y, z = self.center
+        r = self.radius * numpy.sqrt(numpy.random.random_sample(count))
+        t = numpy.random.uniform(-math.pi, math.pi, count)
+        return numpy.column_stack(
+            (x + r * numpy.cos(t), y + r * numpy.sin(t), numpy.full(count, float(z)))
+        )
+
     @property
     def AABB(self):
         x, y, _ = self.center
@@ -3242,6 +3477,15 @@ class SectorRegion(PolygonalRegion):
         pt = Vector(x + (r * cos(t)), y + (r * sin(t)), z)
         return self.orient(pt)
 
+    def uniformPoints(self, count):
+        x, y, z = self.center
+        r = self.radius * numpy.sqrt(numpy.random.random_sample(count))
+        ha = self.angle / 2.0
+        t = numpy.random.uniform(-ha, ha, count) + (self.heading + (math.pi / 2))
+        return numpy.column_stack(
+            (x + r * numpy.cos(t), y + r * numpy.sin(t), numpy.full(count, float(z)))
+        )
+
     def __repr__(self):
         return f"SectorRegion({self.center!r},{self.radius!r},{self.heading!r},{self.angle!r})"
 
@@ -3322,6 +3566,16 @@ class RectangularRegion(PolygonalRegion):
         pt = self.position.offsetRotated(self.heading, Vector(rx, ry, 0))
         return self.orient(pt)
 
+    def uniformPoints(self, count):
+        hw, hl = self.hw, self.hl
+        rx = numpy.random.uniform(-hw, hw, count)
+        ry = numpy.random.uniform(-hl, hl, count)
+        c, s = cos(self.heading), sin(self.heading)
+        x, y, z = self.position
+        return numpy.column_stack(
+            (x + (c * rx - s * ry), y + (s * rx + c * ry), numpy.full(count, float(z)))
+        )
+
     @property
     def AABB(self):
         x, y, z = zip(*self.corners)
@@ -3401,14 +3655,6 @@ class PolylineRegion(Region):
                 f"invalid LineString {self.lineString}"
             )
         shapely.prepare(self.lineString)
-        self.segments = self.segmentsOf(self.lineString)
-        cumulativeLengths = []
-        total = 0
-        for p, q in self.segments:
-            dx, dy = p[0] - q[0], p[1] - q[1]
-            total += math.hypot(dx, dy)
-            cumulativeLengths.append(total)
-        self.cumulativeLengths = cumulativeLengths
         if self.points is None:
             pts = []
             last = None
@@ -3419,6 +3665,53 @@ class PolylineRegion(Region):
                 last = q
             self.points = tuple(pts)
 
+    @cached_property
+    def segments(self):
+        """The segments of the polyline, as pairs of points."""
+        return self.segmentsOf(self.lineString)
+
+    @cached_property
+    def cumulativeLengths(self):
+        """The length of the polyline up to the end of each segment."""
+        cumulativeLengths = []
+        total = 0
+        for p, q in self.segments:
+            dx, dy = p[0] - q[0], p[1] - q[1]
+            total += math.hypot(dx, dy)
+            cumulativeLengths.append(total)
+        return cumulativeLengths
+
+    @cached_property
+    def _segmentArray(self):
+        # Endpoints of the segments, as an array of shape (N, 2, 2)
+        segments = [(start[:2], end[:2]) for start, end in self.segments]
+        return numpy.array(segments, dtype=float).reshape(-1, 2, 2)
+
+    @cached_property
+    def _cumulativeLengthArray(self):
+        return numpy.array([0] + self.cumulativeLengths, dtype=float)
+
+    @cached_property
+    def _segmentTree(self):
+        # Spatial index of the segments, for nearest-segment queries
+        return shapely.STRtree(shapely.linestrings(self._segmentArray))
+
+    _derivedAttributes = (
+        "_cached_segments",
+        "_cached_cumulativeLengths",
+        "_cached__segmentArray",
+        "_cached__cumulativeLengthArray",
+        "_cached__segmentTree",
+    )
+
+    def __getstate__(self):
+        # Segment data is cheap to recompute but expensive to pickle, so we recompute
+        # it lazily after unpickling.
+        state = self.__dict__.copy()
+        for name in self._derivedAttributes:
+            state.pop(name, None)
+        return state
+
     @classmethod
     def segmentsOf(cls, lineString):
         if isinstance(lineString, shapely.geometry.LineString):
@@ -3586,26 +3879,54 @@ class PolylineRegion(Region):
         The distance is positive if the point is left of the nearest segment,
         and negative otherwise.
         """
-        dist = self.distanceTo(point)
-        start, end = self.nearestSegmentTo(point)
-        rp = point - start
-        tangent = end - start
-        return dist if tangent.angleWith(rp) >= 0 else -dist
+        point = toVector(point)
+        index, dist2D = self._nearestSegment(shapely.Point(point.x, point.y))
+        (sx, sy), (ex, ey) = self._segmentArray[index].tolist()
+        dist = math.hypot(dist2D, point.z)
+        angle = math.atan2(point.y - sy, point.x - sx) - math.atan2(ey - sy, ex - sx)
+        return dist if normalizeAngle(angle) >= 0 else -dist
 
     @distributionMethod
     def project(self, point):
-        pt = shapely.ops.nearest_points(self.lineString, makeShapelyPoint(point))[0]
-        return Vector(*pt.coords[0])
+        point = toVector(point)
+        index, _ = self._nearestSegment(shapely.Point(point.x, point.y))
+        (ax, ay), (bx, by) = self._segmentArray[index].tolist()
+        dx, dy = bx - ax, by - ay
+        length2 = dx * dx + dy * dy
+        r = ((point.x - ax) * dx + (point.y - ay) * dy) / length2 if length2 > 0 else 0
+        r = min(max(r, 0), 1)
+        return Vector(ax + r * dx, ay + r * dy)
 
     @distributionMethod
     def nearestSegmentTo(self, point):
-        dist = self.lineString.project(makeShapelyPoint(point))
-        # TODO optimize?
-        for segment, cumLen in zip(self.segments, self.cumulativeLengths):
-            if dist <= cumLen:
-                break
-        # FYI, could also get here if loop runs to completion due to rounding error
-        return (Vector(*segment[0]), Vector(*segment[1]))
+        """Find the segment of the polyline nearest to a point.
+
+        If several segments are equally near, the first one along the polyline is
+        returned.
+
+        .. versionchanged:: 3.1
+            Uses a spatial index of the segments rather than searching all of them.
+        """
+        point = toVector(point)
+        index, _ = self._nearestSegment(shapely.Point(point.x, point.y))
+        return tuple(Vector(*endpoint) for endpoint in self.segments[index])
+
+    def _nearestSegment(self, point):
+        # Returns the index of the first of the segments nearest to the given shapely
+        # Point, together with the distance to it.
+        indices, distances = self._segmentTree.query_nearest(
+            point, all_matches=True, return_distance=True
+        )
+        return int(indices.min()), float(distances[0])
+
+    def _nearestSegments(self, points):
+        # Vectorized version of _nearestSegment for an array of points.
+        inputs, found = self._segmentTree.query_nearest(
+            shapely.points(points[:, :2]), all_matches=True
+        )
+        indices = numpy.full(len(points), len(self._segmentArray))
+        numpy.minimum.at(indices, inputs, found)
+        return indices
 
     def pointAlongBy(self, distance, normalized=False) -> Vector:
         """Find the point a given distance along the polyline from its start.
@@ -3613,9 +3934,125 @@ class PolylineRegion(Region):
         If **normalized** is true, then distance should be between 0 and 1, and
         is interpreted as a fraction of the length of the polyline. So for example
         ``pointAlongBy(0.5, normalized=True)`` returns the polyline's midpoint.
+        Negative distances are measured backwards from the end of the polyline.
+        """
+        cumulativeLengths = self.cumulativeLengths
+        total = cumulativeLengths[-1]
+        if normalized:
+            distance *= total
+        if distance < 0:
+            distance += total
+        distance = min(max(distance, 0), total)
+        index = min(
+            bisect.bisect_left(cumulativeLengths, distance), len(self.segments) - 1
+        )
+        (ax, ay), (bx, by) = self._segmentArray[index].tolist()
+        startLength = cumulativeLengths[index - 1] if index > 0 else 0
+        length = cumulativeLengths[index] - startLength
+        r = (distance - startLength) / length if length > 0 else 0
+        return Vector(ax + r * (bx - ax), ay + r * (by - ay))
+
+    def nearestSegmentsTo(self, points):
+        """Find the segments of the polyline nearest to many points at once.
+
+        Vectorized version of `nearestSegmentTo`.
+
+        .. versionadded:: 3.1
+
+        Args:
+            points: An array of shape (N, 2) or (N, 3), or a sequence of points.
+
+        Returns:
+            An array of shape (N, 2, 2) giving the 2D coordinates of the endpoints of
+            the nearest segment to each point.
+        """
+        points = _toPointArray(points)
+        return self._segmentArray[self._nearestSegments(points)]
+
+    def signedDistancesTo(self, points):
+        """Compute the signed distances from the polyline to many points at once.
+
+        Vectorized version of `signedDistanceTo`.
+
+        .. versionadded:: 3.1
+
+        Args:
+            points: An array of shape (N, 2) or (N, 3), or a sequence of points.
+
+        Returns:
+            An array of shape (N,) of signed distances.
+        """
+        points = _toPointArray(points)
+        segments = self._segmentArray[self._nearestSegments(points)]
+        distances = shapely.distance(
+            shapely.linestrings(segments), shapely.points(points[:, :2])
+        )
+        if points.shape[1] == 3:
+            distances = numpy.hypot(distances, points[:, 2])
+        start, end = segments[:, 0], segments[:, 1]
+        offset, tangent = points[:, :2] - start, end - start
+        angles = numpy.arctan2(offset[:, 1], offset[:, 0]) - numpy.arctan2(
+            tangent[:, 1], tangent[:, 0]
+        )
+        angles[angles > math.pi] -= math.tau
+        angles[angles < -math.pi] += math.tau
+        return numpy.where(angles >= 0, distances, -distances)
+
+    def projectAll(self, points):
+        """Project many points onto the polyline at once.
+
+        Vectorized version of `project`.
+
+        .. versionadded:: 3.1
+
+        Args:
+            points: An array of shape (N, 2) or (N, 3), or a sequence of points.
+
+        Returns:
+            An array of shape (N, 3) whose rows are the nearest points of the polyline.
+        """
+        points = _toPointArray(points)
+        segments = self._segmentArray[self._nearestSegments(points)]
+        start, delta = segments[:, 0], segments[:, 1] - segments[:, 0]
+        length2 = numpy.einsum("ij,ij->i", delta, delta)
+        dots = numpy.einsum("ij,ij->i", points[:, :2] - start, delta)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            r = numpy.where(length2 > 0, dots / length2, 0)
+        projected = start + numpy.clip(r, 0, 1)[:, numpy.newaxis] * delta
+        return numpy.column_stack((projected, numpy.zeros(len(points))))
+
+    def pointsAlongBy(self, distances, normalized=False):
+        """Find many points at given distances along the polyline at once.
+
+        Vectorized version of `pointAlongBy`.
+
+        .. versionadded:: 3.1
+
+        Args:
+            distances: A sequence or array of distances.
+            normalized (bool): Whether the distances are fractions of the length of
+                the polyline, as in `pointAlongBy`.
+
+        Returns:
+            An array of shape (N, 3) whose rows are the points.
         """
-        pt = self.lineString.interpolate(distance, normalized=normalized)
-        return Vector(pt.x, pt.y)
+        distances = numpy.array(distances, dtype=float).reshape(-1)
+        cumulativeLengths = self._cumulativeLengthArray
+        total = cumulativeLengths[-1]
+        if normalized:
+            distances *= total
+        distances[distances < 0] += total
+        distances = numpy.clip(distances, 0, total)
+        indices = numpy.searchsorted(cumulativeLengths[1:], distances, side="left")
+        numpy.minimum(indices, len(self._segmentArray) - 1, out=indices)
+        segments = self._segmentArray[indices]
+        startLengths = cumulativeLengths[indices]
+        lengths = cumulativeLengths[indices + 1] - startLengths
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            r = numpy.where(lengths > 0, (distances - startLengths) / lengths, 0)
+        start, end = segments[:, 0], segments[:, 1]
+        points = start + r[:, numpy.newaxis] * (end - start)
+        return numpy.column_stack((points, numpy.zeros(len(distances))))
 
     def equallySpacedPoints(self, num):
         return [self.pointAlongBy(d) for d in numpy.linspace(0, self.length, num)]
@@ -6,13 +6,16 @@ from functools import reduce
 import inspect
 import itertools
 
+import fcl
+import numpy
 import rv_ltl
-import trimesh
 
 from scenic.core.distributions import Samplable, needsSampling, toDistribution
 from scenic.core.errors import InvalidScenarioError
+from scenic.core.geometry import overlappingSpherePairs
 from scenic.core.lazy_eval import needsLazyEvaluation
 from scenic.core.propositions import Atomic, PropositionNode
+from scenic.core.visibility import batchCanSee
 import scenic.syntax.relations as relations
 
 
@@ -317,21 +320,33 @@ class BlanketCollisionRequirement(SamplingRequirement):
 
     def falsifiedByInner(self, sample):
         objects = tuple(sample[obj] for obj in self.objects)
-        cm = trimesh.collision.CollisionManager()
-        for i, obj in enumerate(objects):
-            if not obj.allowCollisions:
-                cm.add_object(str(i), obj.occupiedSpace.mesh)
-        collision, names = cm.in_collision_internal(return_names=True)
-
-        if collision:
-            self._collidingObjects = tuple(sorted(names))
-
-        return collision
+        indices = [i for i, obj in enumerate(objects) if not obj.allowCollisions]
+
+        # Broad phase: find pairs of objects whose bounding spheres overlap.
+        centers = numpy.array([tuple(objects[i].position) for i in indices])
+        radii = numpy.array([objects[i].radius for i in indices])
+        first, second = overlappingSpherePairs(centers, radii)
+
+        # Narrow phase: check the candidate pairs for collisions, using the cached
+        # collision geometry of each object's shape.
+        collisionObjects = {}
+        for a, b in zip(first, second):
+            i, j = indices[a], indices[b]
+            for k in (i, j):
+                if k not in collisionObjects:
+                    collisionObjects[k] = objects[k]._collisionObject()
+            request = fcl.CollisionRequest()
+            result = fcl.CollisionResult()
+            if fcl.collide(collisionObjects[i], collisionObjects[j], request, result):
+                self._collidingObjects = (i, j)
+                return True
+
+        return False
 
     @property
     def violationMsg(self):
         assert self._collidingObjects is not None
-        objA_index, objB_index = map(int, self._collidingObjects[0])
+        objA_index, objB_index = self._collidingObjects
         objA, objB = self.objects[objA_index], self.objects[objB_index]
         return f"Intersection violation: {objA} intersects {objB}"
 
@@ -360,8 +375,12 @@ class VisibilityRequirement(SamplingRequirement):
         self.potential_occluders = tuple(
             obj for obj in objects if obj is not self.source and obj is not self.target
         )
+        self._batch = None  # group of requirements checked together, if any
+        self._batchIndex = None
 
     def falsifiedByInner(self, sample):
+        if self._batch is not None:
+            return not self._batch.canSee(self._batchIndex, sample)
         source = sample[self.source]
         target = sample[self.target]
         potential_occluders = tuple(sample[obj] for obj in self.potential_occluders)
@@ -373,6 +392,51 @@ class VisibilityRequirement(SamplingRequirement):
         return f"Visibility violation: {self.target} is not visible from {self.source}"
 
 
+def batchVisibilityRequirements(requirements):
+    """Arrange for visibility requirements to be checked together where possible.
+
+    Requirements with the same source and the same potential occluders (apart from
+    their targets) are grouped, so that checking any of them for a sample checks all
+    of them at once using `batchCanSee`, with the same results as checking them
+    separately.
+    """
+    groups = {}
+    for req in requirements:
+        if isinstance(req, VisibilityRequirement):
+            objects = frozenset(map(id, req.potential_occluders + (req.target,)))
+            groups.setdefault((id(req.source), objects), []).append(req)
+    for group in groups.values():
+        if len(group) > 1:
+            batch = _VisibilityBatch(group)
+            for index, req in enumerate(group):
+                req._batch, req._batchIndex = batch, index
+
+
+class _VisibilityBatch:
+    """Visibility requirements with a common source and occluders, checked together."""
+
+    def __init__(self, requirements):
+        self.source = requirements[0].source
+        self.objects = requirements[0].potential_occluders + (requirements[0].target,)
+        self.targets = tuple(req.target for req in requirements)
+        self._sample = self._results = None
+
+    def canSee(self, index, sample):
+        if sample is not self._sample:
+            source = sample[self.source]
+            targets = [sample[target] for target in self.targets]
+            objects = (sample[obj] for obj in self.objects)
+            occluders = tuple(obj for obj in objects if obj.occluding)
+            self._results = batchCanSee([source], targets, occluders)[0]
+            self._sample = sample
+        return bool(self._results[index])
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_sample"] = state["_results"] = None
+        return state
+
+
 class NonVisibilityRequirement(VisibilityRequirement):
     def falsifiedByInner(self, sample):
         return not super().falsifiedByInner(sample)
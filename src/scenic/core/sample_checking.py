@@ -2,8 +2,11 @@
 
 from abc import ABC, abstractmethod
 from collections import deque
+import math
 import time
 
+import numpy
+
 from scenic.core.distributions import RejectionException
 from scenic.core.requirements import BlanketCollisionRequirement, IntersectionRequirement
 
@@ -134,3 +137,134 @@ class WeightedAcceptanceChecker(SampleChecker):
     def getWeightedAcceptanceProb(self, req):
         sum_acc, sum_time = self.bufferSums[req]
         return (sum_acc / self.bufferSize) * (sum_time / self.bufferSize)
+
+
+class AdaptiveOrderingChecker(SampleChecker):
+    """Orders requirements using learned estimates of when they reject together.
+
+    Every **explorationInterval** samples (and for the first few samples), all
+    requirements are evaluated and the set of those which rejected the sample is
+    recorded, so that the last **window** such records estimate the joint rejection
+    probabilities of the requirements. The time taken by each requirement is also
+    tracked. Every **replanInterval** samples, the order in which requirements are
+    checked is recomputed greedily: each requirement in turn is the one with the
+    highest probability of rejecting a sample accepted by the requirements before it,
+    per unit of time taken to check it. This is the optimal order when requirements
+    are independent, but unlike ordering by individual acceptance rates, it does not
+    waste time checking requirements which usually reject only samples that earlier
+    requirements have already rejected.
+
+    Args:
+        window: Max number of fully-checked samples to use when estimating rejection
+            probabilities.
+        explorationInterval: Number of samples between fully-checked samples.
+        replanInterval: Number of samples between recomputations of the order.
+    """
+
+    #: Number of samples to fully check before using the estimated probabilities.
+    warmup = 10
+
+    def __init__(self, window=200, explorationInterval=20, replanInterval=50):
+        super().__init__()
+        self.window = window
+        self.explorationInterval = explorationInterval
+        self.replanInterval = replanInterval
+
+    def setRequirements(self, requirements):
+        super().setRequirements(requirements)
+
+        count = len(self.requirements)
+        self.records = numpy.zeros((self.window, count), dtype=bool)
+        self.numRecords = 0
+        self.totalTimes = [0.0] * count
+        self.timesChecked = [0] * count
+        self.samplesChecked = 0
+        self.plan = tuple(range(count))
+
+    def checkRequirementsInner(self, sample):
+        self.samplesChecked += 1
+        if self.samplesChecked % self.replanInterval == 0:
+            self.plan = self.planOrder()
+
+        if (
+            self.numRecords < self.warmup
+            or self.samplesChecked % self.explorationInterval == 0
+        ):
+            return self.checkAllRequirements(sample)
+
+        requirements, totalTimes, timesChecked = (
+            self.requirements,
+            self.totalTimes,
+            self.timesChecked,
+        )
+        for index in self.plan:
+            req = requirements[index]
+            if not req.active:
+                continue
+            start = time.perf_counter()
+            rejected = req.falsifiedBy(sample)
+            totalTimes[index] += time.perf_counter() - start
+            timesChecked[index] += 1
+            if rejected:
+                return req.violationMsg
+
+        return None
+
+    def checkAllRequirements(self, sample):
+        """Check all requirements, recording which ones rejected the sample."""
+        rejection = None
+        rejected = numpy.zeros(len(self.requirements), dtype=bool)
+        for index, req in enumerate(self.requirements):
+            if not req.active:
+                continue
+            start = time.perf_counter()
+            try:
+                if req.falsifiedBy(sample):
+                    rejected[index] = True
+                    rejection = rejection or req.violationMsg
+            except RejectionException as e:
+                rejected[index] = True
+                rejection = rejection or e
+            self.totalTimes[index] += time.perf_counter() - start
+            self.timesChecked[index] += 1
+
+        self.records[self.numRecords % self.window] = rejected
+        self.numRecords += 1
+        if self.numRecords == self.warmup:
+            self.plan = self.planOrder()
+        return rejection
+
+    def planOrder(self):
+        """Compute the order in which to check requirements.
+
+        Returns:
+            A tuple of requirement indices. Optional requirements which would only be
+            checked after all non-optional requirements are omitted.
+        """
+        records = self.records[: min(self.numRecords, self.window)]
+        costs = numpy.array(
+            [
+                total / count if count > 0 else math.inf
+                for total, count in zip(self.totalTimes, self.timesChecked)
+            ]
+        )
+        known = numpy.isfinite(costs)
+        # Requirements never timed get the average cost, so they are tried eventually.
+        costs[~known] = costs[known].mean() if known.any() else 1
+        costs = numpy.maximum(costs, 1e-9)
+
+        remaining = numpy.ones(len(self.requirements), dtype=bool)
+        needed = {i for i, req in enumerate(self.requirements) if not req.optional}
+        passing = numpy.ones(len(records), dtype=bool)
+        plan = []
+        while needed:
+            # Laplace-smoothed probability of rejecting given the plan so far passed
+            subset = records[passing]
+            probabilities = (subset.sum(axis=0) + 1) / (len(subset) + 2)
+            scores = numpy.where(remaining, probabilities / costs, -1)
+            best = int(scores.argmax())
+            plan.append(best)
+            remaining[best] = False
+            needed.discard(best)
+            passing &= ~records[:, best]
+        return tuple(plan)
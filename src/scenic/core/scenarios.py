@@ -3,6 +3,9 @@
 import dataclasses
 import io
 import itertools
+import math
+import multiprocessing
+import multiprocessing.connection
 import random
 import sys
 import time
@@ -35,9 +38,17 @@ from scenic.core.requirements import (
     IntersectionRequirement,
     NonVisibilityRequirement,
     VisibilityRequirement,
+    batchVisibilityRequirements,
 )
 from scenic.core.sample_checking import BasicChecker, WeightedAcceptanceChecker
 from scenic.core.serialization import Serializer, dumpAsScenicCode
+from scenic.core.simulators import (
+    BatchSimulation,
+    SimulationCreationError,
+    SimulationResult,
+    SpawnedAgent,
+)
+from scenic.core.utils import DefaultIdentityDict
 from scenic.core.vectors import Vector
 
 # Global params
@@ -117,6 +128,152 @@ class _Deactivator:
         self.deactivate()
 
 
+def _generateBatchInWorker(task):
+    """Generate scenes in a worker process for `Scenario.generateBatch`.
+
+    The scenes are returned in serialized form, to be decoded by the original
+    scenario in the parent process.
+    """
+    import dill
+
+    index, data, seed, numScenes, maxIterations, verbosity = task
+    random.seed(seed)
+    numpy.random.seed(seed)
+    scenario = dill.loads(data)
+    scenes, iterations = scenario.generateBatch(numScenes, maxIterations, verbosity)
+    encoded = [scenario.sceneToBytes(scene, allowPickle=True) for scene in scenes]
+    return index, encoded, iterations
+
+
+_simulationWorker = None  # scenario and simulator of a batch simulation worker process
+
+
+def _startSimulationWorker(data, factoryData):
+    """Set up a worker process for `Scenario.simulateBatch`."""
+    from multiprocessing import util
+
+    import dill
+
+    global _simulationWorker
+    scenario = dill.loads(data)
+    simulator = scenario._makeBatchSimulator(dill.loads(factoryData))
+    # Shut down the simulator when the worker process exits
+    util.Finalize(simulator, simulator.destroy, exitpriority=10)
+    _simulationWorker = (scenario, simulator)
+
+
+def _runSimulationWorker(connection, data, factoryData):
+    """Main loop of a worker process for `Scenario.simulateBatch`.
+
+    Replies to each message with a pair (success, value): first once the worker is
+    ready, then with the outcome of each task, until sent `None`.
+    """
+    try:
+        _startSimulationWorker(data, factoryData)
+        connection.send((True, None))
+    except BaseException as e:
+        connection.send((False, e))
+        return
+    while (task := connection.recv()) is not None:
+        try:
+            reply = (True, _simulateInWorker(*task))
+        except BaseException as e:
+            reply = (False, e)
+        connection.send(reply)
+
+
+def _simulateInWorker(index, seed, maxSceneIterations, options):
+    """Run a simulation in a worker process for `Scenario.simulateBatch`.
+
+    The scene and result are returned in serialized form, to be decoded by the
+    original scenario in the parent process.
+    """
+    import dill
+
+    scenario, simulator = _simulationWorker
+    scene, simulation, error = scenario._simulateOne(
+        simulator, seed, maxSceneIterations, options
+    )
+    if scene is not None:
+        numSceneObjects = len(scene.objects)
+        scene = scenario.sceneToBytes(scene, allowPickle=True)
+    if simulation is None:
+        return index, scene, None, None, error
+
+    # Agents can't be sent across processes, so identify those from the scene by
+    # index and replace any others with placeholders
+    result = simulation.result
+    keys = {
+        obj: i if i < numSceneObjects else SpawnedAgent(i, type(obj).__name__)
+        for i, obj in enumerate(simulation.objects)
+    }
+    actions = tuple(
+        {keys[agent]: acts for agent, acts in step.items()} for step in result.actions
+    )
+    encoded = dill.dumps(
+        (
+            result.trajectory,
+            actions,
+            result.terminationType,
+            result.terminationReason,
+            result.records,
+        )
+    )
+    replay = simulation.getReplay() if simulation._replayOut else None
+    return index, scene, encoded, replay, error
+
+
+class _SimulationWorker:
+    """A worker process running simulations for `Scenario.iterSimulations`."""
+
+    def __init__(self, context, data, factoryData):
+        self.connection, workerConnection = context.Pipe()
+        self.process = context.Process(
+            target=_runSimulationWorker, args=(workerConnection, data, factoryData)
+        )
+        self.process.start()
+        workerConnection.close()
+        self.ready = False
+        self.task = None  # index and seed of the current simulation, if any
+        self.deadline = None
+
+    def submit(self, index, seed, maxSceneIterations, options, timeout):
+        self.connection.send((index, seed, maxSceneIterations, options))
+        self.task = (index, seed)
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    def receive(self):
+        try:
+            success, value = self.connection.recv()
+        except EOFError:
+            raise RuntimeError("simulation worker process exited unexpectedly") from None
+        if not success:
+            raise value
+        self.ready = True
+        self.task = self.deadline = None
+        return value
+
+    def stop(self, timeout=None):
+        """Stop the worker after its current simulation, killing it if that takes
+        longer than **timeout** seconds."""
+        try:
+            if self.task is not None and self.connection.poll(timeout):
+                self.connection.recv()
+                self.task = None
+            if self.task is None:
+                self.connection.send(None)
+                self.process.join(timeout)
+        except (OSError, EOFError):
+            pass
+        if self.process.is_alive():
+            self.kill()
+        self.connection.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+
+
 # Scenes and scenarios
 
 
@@ -316,13 +473,77 @@ class Scenario(_ScenarioPickleMixin):
             self._instances + paramDeps + tuple(requirementDeps) + tuple(behaviorDeps)
         )
 
+        # By default, sample all dependencies at once (see setRequirementStaging)
+        self._samplingStages = [(self.dependencies, [])]
+        self._stagedRequirements = ()
+
         # Setup the default checker
         self.defaultRequirements = self.generateDefaultRequirements()
         self.setSampleChecker(WeightedAcceptanceChecker(bufferSize=100))
+        self.samplingBatchSize = 1
 
     def setSampleChecker(self, checker):
+        """Set the `SampleChecker` used to check the requirements of sampled scenes.
+
+        The checker is given the built-in requirements (e.g. that objects do not
+        intersect) and the user's :keyword:`require` statements, except for those
+        checked during sampling if requirement staging is enabled (see
+        `setRequirementStaging`): a checker which orders requirements, such as
+        `AdaptiveOrderingChecker`, does not see or order those.
+        """
         self.checker = checker
-        self.checker.setRequirements(self.defaultRequirements + self.userRequirements)
+        # requirements checked during sampling need not be checked again
+        lateRequirements = tuple(
+            req for req in self.userRequirements if req not in self._stagedRequirements
+        )
+        self.checker.setRequirements(self.defaultRequirements + lateRequirements)
+
+    def setRequirementStaging(self, enabled):
+        """Set whether to check user requirements while sampling scenes.
+
+        With staging enabled, the random values a scenario depends on are sampled in
+        stages, and each :keyword:`require` statement is checked as soon as everything
+        it depends on has been sampled, so that doomed candidates are rejected without
+        sampling the rest of the scenario. Requirements which depend on everything are
+        still left to the sample checker.
+
+        Staging changes the order in which random values are drawn, so scenes
+        generated from a given random seed differ from those generated without it.
+        Staged requirements are checked by the scenario itself rather than by its
+        sample checker (see `setSampleChecker`). Staging is disabled by default.
+
+        .. versionadded:: 3.1
+        """
+        if enabled:
+            self._samplingStages = self._scheduleRequirements()
+        else:
+            self._samplingStages = [(self.dependencies, [])]
+        self._stagedRequirements = tuple(
+            req for _, reqs in self._samplingStages for req in reqs
+        )
+        # Give the checker the requirements it now needs to check from scratch
+        self.checker.requirements = None
+        self.setSampleChecker(self.checker)
+
+    def setSamplingBatchSize(self, size):
+        """Set how many candidate samples to draw at once during rejection sampling.
+
+        With a batch size greater than 1, primitive distributions are sampled for many
+        candidates at once using `Samplable.sampleAllBatch`, which can substantially
+        reduce the overhead of sampling scenarios with many random values. The
+        candidates are then checked against the requirements one at a time as usual.
+        Only the primitive values are sampled for all candidates up front, so little
+        work is wasted on candidates left over once a scene is accepted.
+
+        Batch sampling uses NumPy's random number generator, so the generated scenes
+        differ from those generated without batching even for the same random seeds.
+        It is not used for scenarios with external samplers.
+
+        .. versionadded:: 3.1
+        """
+        if size < 1:
+            raise ValueError("sampling batch size must be positive")
+        self.samplingBatchSize = size
 
     def containerOfObject(self, obj):
         if hasattr(obj, "regionContainedIn") and obj.regionContainedIn is not None:
@@ -404,7 +625,12 @@ class Scenario(_ScenarioPickleMixin):
         return scenes[0], iterations
 
     def generateBatch(
-        self, numScenes, maxIterations=float("inf"), verbosity=0, feedback=None
+        self,
+        numScenes,
+        maxIterations=float("inf"),
+        verbosity=0,
+        feedback=None,
+        workers=None,
     ):
         """Sample several `Scene` objects from this scenario.
 
@@ -416,6 +642,9 @@ class Scenario(_ScenarioPickleMixin):
             verbosity (int): Verbosity level.
             feedback (float): Feedback to pass to external samplers doing active sampling.
                 See :mod:`scenic.core.external_params`.
+            workers (int): If greater than 1, generate scenes in parallel using this
+                many worker processes (see below). Default `None`, meaning to generate
+                all scenes in the current process.
 
         Returns:
             A pair with a list of the sampled `Scene` objects and the total number
@@ -423,7 +652,26 @@ class Scenario(_ScenarioPickleMixin):
 
         Raises:
             `RejectionException`: if not enough valid samples are found in **maxIterations** iterations.
+
+        When using multiple **workers**, the scenario is pickled (which requires the
+        `dill` package) and sent to each worker process, which generates its share of
+        the scenes using its own random seed. The seeds are drawn from the `random`
+        module in the current process, so that for a fixed seed and number of workers
+        the generated scenes are the same on every run (but they will generally differ
+        from the scenes generated serially). Each worker may use a share of
+        **maxIterations** proportional to the number of scenes it generates, and if
+        any worker fails to generate its scenes, the others are stopped. Parallel
+        generation is not supported for scenarios using external samplers, since those
+        may depend on feedback from previous samples.
+
+        .. versionchanged:: 3.1
+            Added the **workers** option.
         """
+        if workers is not None and workers > 1 and numScenes > 1:
+            return self._generateBatchParallel(
+                numScenes, maxIterations, verbosity, workers
+            )
+
         totalIterations = 0
         scenes = []
 
@@ -440,6 +688,326 @@ class Scenario(_ScenarioPickleMixin):
 
         return scenes, totalIterations
 
+    def iterScenes(self, maxIterations=2000, count=None, verbosity=0, feedback=None):
+        """Lazily sample `Scene` objects from this scenario.
+
+        Unlike `generateBatch`, this method returns an iterator which yields each scene
+        as soon as it has been generated, so that scenes can be processed (and
+        discarded) one at a time without keeping the whole batch in memory.
+
+        For a description of how scene generation is done, see `scene generation`.
+
+        Args:
+            maxIterations (int): Maximum number of rejection sampling iterations
+                (for each scene).
+            count (int): Number of scenes to generate, or `None` (the default) to
+                generate scenes indefinitely.
+            verbosity (int): Verbosity level.
+            feedback (float): Feedback to pass to external samplers doing active sampling.
+                See :mod:`scenic.core.external_params`.
+
+        Yields:
+            Pairs consisting of a sampled `Scene` and the number of iterations used
+            to generate it.
+
+        Raises:
+            `RejectionException`: if no valid sample is found for some scene in
+                **maxIterations** iterations.
+
+        .. versionadded:: 3.1
+        """
+        generated = 0
+        while count is None or generated < count:
+            yield self._generateInner(maxIterations, verbosity, feedback)
+            generated += 1
+
+    def simulateBatch(
+        self,
+        count,
+        simulatorFactory=None,
+        *,
+        workers=None,
+        maxSceneIterations=2000,
+        workerTimeout=None,
+        **kwargs,
+    ):
+        """Generate scenes from this scenario and run a simulation from each.
+
+        Each simulation is seeded separately, using a seed drawn from the `random`
+        module in the current process: for a fixed seed, the results are the same on
+        every run, regardless of the number of **workers**.
+
+        Args:
+            count (int): Number of simulations to run.
+            simulatorFactory: Function (or `Simulator` class) called with no arguments
+                to create a `Simulator`, or `None` (the default) to use the simulator
+                specified by the scenario (see `getSimulator`). One simulator is created
+                for each worker, and used for all of its simulations.
+            workers (int): If greater than 1, run the simulations in parallel using
+                this many worker processes (see `generateBatch` for details, including
+                the requirement of the `dill` package). Default `None`, meaning to run
+                all simulations in the current process.
+            maxSceneIterations (int): Maximum number of rejection sampling iterations
+                used to generate each scene.
+            workerTimeout (float): If not `None`, a hard bound on the wall-clock time
+                a worker process may take to generate a scene and run a simulation from
+                it, in seconds. A worker exceeding it is killed and replaced, and the
+                simulation is given a `TimeoutError` as its **error**. Unlike the
+                **timeout** argument of `Simulator.simulate`, this also interrupts
+                simulators which hang during a time step; it only applies when using
+                multiple **workers**.
+            kwargs: All additional keyword arguments are passed through to
+                `Simulator.simulate`; for example, **maxSteps** and **timeout** bound
+                the length of each simulation.
+
+        Returns:
+            A list of `BatchSimulation` objects, one for each simulation in order,
+            giving the result of the simulation or the reason it could not be run.
+
+        .. versionadded:: 3.1
+        """
+        return list(
+            self.iterSimulations(
+                count,
+                simulatorFactory,
+                workers=workers,
+                maxSceneIterations=maxSceneIterations,
+                workerTimeout=workerTimeout,
+                **kwargs,
+            )
+        )
+
+    def iterSimulations(
+        self,
+        count,
+        simulatorFactory=None,
+        *,
+        workers=None,
+        ordered=True,
+        maxSceneIterations=2000,
+        workerTimeout=None,
+        **kwargs,
+    ):
+        """Lazily run a batch of simulations from this scenario.
+
+        Like `simulateBatch`, but returns an iterator which yields each
+        `BatchSimulation` as soon as it has completed.
+
+        Args:
+            ordered (bool): Whether to yield the simulations in order (the default),
+                or in the order in which they complete when using multiple **workers**.
+
+        The other arguments are as in `simulateBatch`.
+
+        .. versionadded:: 3.1
+        """
+        seeds = [random.getrandbits(32) for _ in range(count)]
+        if workers is not None and workers > 1 and count > 1:
+            yield from self._iterSimulationsParallel(
+                seeds,
+                simulatorFactory,
+                workers,
+                ordered,
+                maxSceneIterations,
+                workerTimeout,
+                kwargs,
+            )
+            return
+
+        simulator = self._makeBatchSimulator(simulatorFactory)
+        try:
+            for index, seed in enumerate(seeds):
+                # Leave the caller's random state as it would be after a parallel run
+                state = random.getstate(), numpy.random.get_state()
+                try:
+                    scene, simulation, error = self._simulateOne(
+                        simulator, seed, maxSceneIterations, kwargs
+                    )
+                finally:
+                    random.setstate(state[0])
+                    numpy.random.set_state(state[1])
+                if simulation is None:
+                    yield BatchSimulation(index, scene, None, error=error)
+                else:
+                    replay = simulation.getReplay() if simulation._replayOut else None
+                    yield BatchSimulation(index, scene, simulation.result, replay)
+        finally:
+            simulator.destroy()
+
+    def _iterSimulationsParallel(
+        self,
+        seeds,
+        simulatorFactory,
+        workers,
+        ordered,
+        maxSceneIterations,
+        workerTimeout,
+        options,
+    ):
+        if self.externalSampler is not None:
+            raise RuntimeError(
+                "parallel simulation is not supported with external samplers"
+            )
+        try:
+            import dill
+        except ModuleNotFoundError as e:
+            raise ImportError("need the 'dill' package to simulate in parallel") from e
+
+        context = multiprocessing.get_context()
+        data, factoryData = dill.dumps(self), dill.dumps(simulatorFactory)
+        workers = [
+            _SimulationWorker(context, data, factoryData)
+            for _ in range(min(workers, len(seeds)))
+        ]
+        tasks = list(enumerate(seeds))
+        tasks.reverse()
+        finished = {}
+        nextIndex = 0  # next simulation to yield, if ordered
+        try:
+            while tasks or any(worker.task for worker in workers):
+                for worker in workers:
+                    if worker.ready and worker.task is None and tasks:
+                        index, seed = tasks.pop()
+                        worker.submit(
+                            index, seed, maxSceneIterations, options, workerTimeout
+                        )
+
+                # Wait for a worker to become ready or finish its simulation
+                waiting = {
+                    worker.connection: worker
+                    for worker in workers
+                    if not worker.ready or worker.task
+                }
+                deadlines = [w.deadline for w in workers if w.deadline is not None]
+                timeout = None
+                if deadlines:
+                    timeout = max(0, min(deadlines) - time.monotonic())
+                for connection in multiprocessing.connection.wait(waiting, timeout):
+                    worker = waiting[connection]
+                    if worker.ready:
+                        result = self._decodeBatchSimulation(*worker.receive())
+                        finished[result.index] = result
+                    else:
+                        worker.receive()
+
+                # Replace any workers which have taken too long
+                now = time.monotonic()
+                for i, worker in enumerate(workers):
+                    if worker.deadline is not None and now >= worker.deadline:
+                        index, _ = worker.task
+                        worker.kill()
+                        worker.connection.close()
+                        workers[i] = _SimulationWorker(context, data, factoryData)
+                        error = TimeoutError(
+                            f"simulation did not finish within {workerTimeout} seconds"
+                        )
+                        finished[index] = BatchSimulation(index, None, None, error=error)
+
+                if ordered:
+                    while nextIndex in finished:
+                        yield finished.pop(nextIndex)
+                        nextIndex += 1
+                else:
+                    while finished:
+                        yield finished.pop(next(iter(finished)))
+        finally:
+            # If the caller stopped early, don't start the remaining simulations
+            for worker in workers:
+                remaining = None
+                if worker.deadline is not None:
+                    remaining = max(0, worker.deadline - time.monotonic())
+                worker.stop(remaining)
+
+    def _decodeBatchSimulation(self, index, scene, encoded, replay, error):
+        if scene is not None:
+            scene = self.sceneFromBytes(scene, allowPickle=True)
+        if encoded is None:
+            return BatchSimulation(index, scene, None, error=error)
+
+        import dill
+
+        trajectory, actions, terminationType, reason, records = dill.loads(encoded)
+        objects = scene.objects
+        actions = (
+            {
+                (agent if isinstance(agent, SpawnedAgent) else objects[agent]): acts
+                for agent, acts in step.items()
+            }
+            for step in actions
+        )
+        result = SimulationResult(trajectory, actions, terminationType, reason, records)
+        return BatchSimulation(index, scene, result, replay)
+
+    def _makeBatchSimulator(self, simulatorFactory):
+        if simulatorFactory is None:
+            return self.getSimulator()
+        return simulatorFactory()
+
+    def _simulateOne(self, simulator, seed, maxSceneIterations, options):
+        random.seed(seed)
+        numpy.random.seed(seed)
+        try:
+            scene, _ = self.generate(maxIterations=maxSceneIterations)
+        except RejectionException as e:
+            return None, None, e
+        try:
+            simulation = simulator.simulate(scene, **options)
+        except SimulationCreationError as e:
+            return scene, None, e
+        return scene, simulation, None
+
+    def _generateBatchParallel(self, numScenes, maxIterations, verbosity, workers):
+        if self.externalSampler is not None:
+            raise RuntimeError(
+                "parallel scene generation is not supported with external samplers"
+            )
+        try:
+            import dill
+        except ModuleNotFoundError as e:
+            raise ImportError(
+                "need the 'dill' package to generate scenes in parallel"
+            ) from e
+
+        # Split the scenes evenly among the workers, giving each chunk its own seed
+        # (drawn in a fixed order so that the results are reproducible) and a share of
+        # the iteration budget proportional to its number of scenes.
+        workers = min(workers, numScenes)
+        base, extra = divmod(numScenes, workers)
+        counts = [base + (1 if i < extra else 0) for i in range(workers)]
+        seeds = [random.getrandbits(32) for _ in counts]
+        if math.isinf(maxIterations):
+            budgets = [maxIterations] * workers
+        else:
+            budgets = [maxIterations * count // numScenes for count in counts]
+        data = dill.dumps(self)
+        tasks = [
+            (index, data, seed, count, budget, verbosity)
+            for index, (seed, count, budget) in enumerate(zip(seeds, counts, budgets))
+        ]
+
+        # Collect the results as they complete; if any worker fails, leaving the pool
+        # terminates the others rather than letting them use up their budgets.
+        results = [None] * workers
+        with multiprocessing.Pool(workers) as pool:
+            try:
+                for index, encodedScenes, iterations in pool.imap_unordered(
+                    _generateBatchInWorker, tasks
+                ):
+                    results[index] = (encodedScenes, iterations)
+            except RejectionException as e:
+                raise RejectionException(
+                    f"failed to generate scenario in {maxIterations} iterations"
+                ) from e
+
+        # Merge the results, in worker order
+        scenes = []
+        totalIterations = 0
+        for encodedScenes, iterations in results:
+            for encoded in encodedScenes:
+                scenes.append(self.sceneFromBytes(encoded, allowPickle=True))
+            totalIterations += iterations
+        return scenes, totalIterations
+
     def _generateInner(self, maxIterations, verbosity, feedback):
         # choose which custom requirements will be enforced for this sample
         for req in self.userRequirements:
@@ -451,6 +1019,7 @@ class Scenario(_ScenarioPickleMixin):
         # do rejection sampling until requirements are satisfied
         rejection = True
         iterations = 0
+        candidates = self._candidateSamples()
         while rejection is not None:
             if iterations > 0:  # rejected the last sample
                 if verbosity >= 2:
@@ -465,12 +1034,16 @@ class Scenario(_ScenarioPickleMixin):
             try:
                 if self.externalSampler is not None:
                     self.externalSampler.sample(feedback)
-                sample = Samplable.sampleAll(self.dependencies)
+                sample, rejection = next(candidates)
+                if isinstance(rejection, RejectionException):
+                    raise rejection
             except RejectionException as e:
                 optionallyDebugRejection(e)
                 rejection = e
                 continue
-            rejection = None
+            if rejection is not None:  # requirement falsified during sampling
+                optionallyDebugRejection()
+                continue
 
             # Ensure nothing else is lazy
             for obj in self.objects:
@@ -491,6 +1064,94 @@ class Scenario(_ScenarioPickleMixin):
         scene = self._makeSceneFromSample(sample)
         return scene, iterations
 
+    def _candidateSamples(self):
+        # Generate candidate samples for rejection sampling, each paired with the
+        # reason it was rejected early (a RejectionException raised while sampling or
+        # the violation message of a requirement), or None.
+        while True:
+            if self.samplingBatchSize > 1 and self.externalSampler is None:
+                samples = Samplable.sampleAllBatch(
+                    self.dependencies, self.samplingBatchSize
+                )
+                for sample in samples:
+                    if isinstance(sample, RejectionException):
+                        yield None, sample
+                    else:
+                        rejection = self._checkStagedRequirements(
+                            self._stagedRequirements, sample
+                        )
+                        yield sample, rejection
+            else:
+                yield self._sampleIncrementally()
+
+    def _sampleIncrementally(self):
+        # Sample the dependencies stage by stage, checking the requirements of each
+        # stage as soon as their dependencies are available so that doomed samples
+        # can be rejected without sampling everything else.
+        sample = DefaultIdentityDict()
+        try:
+            for quantities, requirements in self._samplingStages:
+                Samplable.sampleAll(quantities, sample)
+                rejection = self._checkStagedRequirements(requirements, sample)
+                if rejection is not None:
+                    return None, rejection
+        except RejectionException as e:
+            return None, e
+        return sample, None
+
+    @staticmethod
+    def _checkStagedRequirements(requirements, sample):
+        if not requirements:
+            return None
+        # Store the random state as when using the sample checker (see _generateInner)
+        rand_state, np_state = random.getstate(), numpy.random.get_state()
+        try:
+            for req in requirements:
+                if req.active and req.falsifiedBy(sample):
+                    return req.violationMsg
+            return None
+        finally:
+            random.setstate(rand_state)
+            numpy.random.set_state(np_state)
+
+    def _scheduleRequirements(self):
+        """Plan the order in which to sample dependencies and check user requirements.
+
+        Returns a list of stages, each consisting of a list of quantities to sample and
+        a list of requirements which can be checked once they have been sampled. The
+        requirements are scheduled greedily, each time picking the one needing the
+        fewest quantities not yet sampled. Requirements which can only be checked once
+        everything has been sampled are left to the sample checker, and the last stage
+        samples all remaining dependencies.
+        """
+        # dependencies must use fixed order for reproducibility
+        positions = {}
+        for i, dep in enumerate(self.dependencies):
+            positions.setdefault(id(dep), i)
+
+        sampled = set()
+
+        def missing(req):
+            return [dep for dep in req.dependencies if id(dep) not in sampled]
+
+        pending = list(self.userRequirements)
+        stages = []
+        while pending:
+            req = min(pending, key=lambda req: len(missing(req)))
+            quantities = sorted(
+                missing(req), key=lambda dep: positions.get(id(dep), len(positions))
+            )
+            sampled.update(id(dep) for dep in quantities)
+            if sampled.issuperset(positions):
+                break
+            pending.remove(req)
+            if stages and not quantities:
+                stages[-1][1].append(req)
+            else:
+                stages.append((quantities, [req]))
+        stages.append((self.dependencies, []))
+        return stages
+
     def generateDefaultRequirements(self):
         requirements = []
 
@@ -539,6 +1200,9 @@ class Scenario(_ScenarioPickleMixin):
                 )
             requirements.append(VisibilityRequirement(self.egoObject, obj, self.objects))
 
+        # Check visibility requirements sharing a source together
+        batchVisibilityRequirements(requirements)
+
         return tuple(requirements)
 
     def _makeSceneFromSample(self, sample):
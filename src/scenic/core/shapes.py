@@ -1,9 +1,11 @@
 """ Module containing the Shape class and its subclasses, which represent shapes of Objects"""
 
 from abc import ABC, abstractmethod
+import functools
 
 import numpy
 import trimesh
+import trimesh.collision
 from trimesh.transformations import (
     concatenate_matrices,
     quaternion_matrix,
@@ -59,12 +61,35 @@ class Shape(ABC):
     def mesh(self):
         pass
 
+    def collisionGeometry(self, dimensions):
+        """FCL collision geometry for this shape, scaled to the given dimensions.
+
+        The geometry is centered at the origin and unrotated; it can be placed using an
+        ``fcl.Transform``. It is cached, so that all objects with the same shape and
+        dimensions share a single BVH (or convex hull, for convex shapes), and only a
+        rigid transform needs to be computed for each sample.
+
+        Args:
+            dimensions: A 3-tuple giving the width, length, and height to scale to.
+        """
+        return _collisionGeometry(self, tuple(dimensions))
+
     @property
     @abstractmethod
     def isConvex(self):
         pass
 
 
+@functools.lru_cache(maxsize=256)
+def _collisionGeometry(shape, dimensions):
+    mesh = shape.mesh.copy()
+    mesh.apply_scale(dimensions)
+    if shape.isConvex:
+        return trimesh.collision.mesh_to_convex(mesh)
+    else:
+        return trimesh.collision.mesh_to_BVH(mesh)
+
+
 ###################################################################################################
 # 3D Shape Classes
 ###################################################################################################
@@ -12,12 +12,15 @@ simulation as a `SimulationResult` object).
 
 import abc
 from collections import defaultdict
+from collections.abc import Sequence
 import enum
 import math
 import numbers
 import time
 import types
 
+import numpy
+
 from scenic.core.distributions import RejectionException
 from scenic.core.dynamics import GuardViolation, RejectSimulationException
 from scenic.core.dynamics.actions import Action, _EndScenarioAction, _EndSimulationAction
@@ -88,6 +91,7 @@ class Simulator(abc.ABC):
         divergenceTolerance=0,
         continueAfterDivergence=False,
         allowPickle=False,
+        timeout=None,
     ):
         """Run a simulation for a given scene.
 
@@ -133,6 +137,11 @@ class Simulator(abc.ABC):
             allowPickle (bool): Whether to use `pickle` to (de)serialize custom object
                 types. See `sceneFromBytes` for a discussion of when this may be needed
                 (rarely) and its security implications.
+            timeout (float): If not `None`, a bound on the wall-clock time taken by each
+                simulation, in seconds. The simulation is ended (with termination type
+                `TerminationType.timeout`) after the first time step which finishes once
+                this much time has elapsed. Since the bound is checked between time steps,
+                it cannot interrupt a simulator which hangs during a step.
 
         Returns:
             A `Simulation` object representing the completed simulation, or `None` if no
@@ -160,6 +169,10 @@ class Simulator(abc.ABC):
         .. versionadded:: 3.0
 
             The **timestep** argument.
+
+        .. versionadded:: 3.1
+
+            The **timeout** argument.
         """
 
         if self._destroyed:
@@ -188,6 +201,7 @@ class Simulator(abc.ABC):
                 divergenceTolerance=divergenceTolerance,
                 continueAfterDivergence=continueAfterDivergence,
                 allowPickle=allowPickle,
+                timeout=timeout,
             )
         return simulation
 
@@ -330,19 +344,23 @@ class Simulation(abc.ABC):
         divergenceTolerance=0,
         continueAfterDivergence=False,
         verbosity=0,
+        timeout=None,
     ):
         self.result = None
         self.scene = scene
         self.objects = []
-        self.trajectory = []
+        self.trajectory = Trajectory()
         self.records = defaultdict(list)
         self.currentTime = 0
         self.timestep = 1 if timestep is None else float(timestep)
         self.verbosity = verbosity
         self.name = name
         self.worker_num = 0
+        self.timeout = timeout
+        self._deadline = None if timeout is None else time.monotonic() + timeout
 
         self.actionSequence = []
+        self._syncedValues = {}  # values of dynamic properties assigned at last update
 
         # Prepare to save or load a replay.
         self.initializeReplay(replay, enableReplay, enableDivergenceCheck, allowPickle)
@@ -442,6 +460,11 @@ class Simulation(abc.ABC):
                 return TerminationType.simulationTerminationCondition, terminationReason
             if maxSteps and self.currentTime >= maxSteps:
                 return TerminationType.timeLimit, f"reached time limit ({maxSteps} steps)"
+            if self._deadline is not None and time.monotonic() >= self._deadline:
+                return (
+                    TerminationType.timeout,
+                    f"reached wall-clock time limit ({self.timeout} seconds)",
+                )
 
             # Clear lastActions for all objects
             for obj in self.objects:
@@ -665,46 +688,64 @@ class Simulation(abc.ABC):
         """Update the positions and other properties of objects from the simulation.
 
         Subclasses likely do not need to override this method: they should implement its
-        subroutine `getProperties` below.
+        subroutine `getProperties` below (and optionally `getPropertiesBatch`).
+
+        Only the cached derived values of objects (e.g. their ``visibleRegion``)
+        depending on properties which have changed since the last update are cleared.
+
+        .. versionchanged:: 3.1
+
+            Properties are read and type-checked for batches of objects at a time;
+            caches are only cleared as needed for the properties which changed.
         """
-        for obj in self.objects:
-            # Get latest values of dynamic properties from simulation and assign them
-            dynTypes = obj._simulatorProvidedProperties
-            properties = set(dynTypes)
-            values = self.getProperties(obj, properties)
-            assert properties == set(values), properties ^ set(values)
-            for prop, value in values.items():
-                # Check new value has the expected type
-                ty = dynTypes[prop]
-                if ty is float and isinstance(value, numbers.Real):
-                    # Special case for scalars so that we don't penalize simulator interfaces
-                    # for returning ints, NumPy scalar types, etc.
-                    value = float(value)
-                elif ty is type(None):
-                    # Special case for properties with initial value None: the simulator sets
-                    # their actual initial value, so we'll assume the type is correct here.
-                    ty = type(value)
-                    dynTypes[prop] = ty
-                if not isinstance(value, ty):
-                    actual = type(value).__name__
-                    expected = ty.__name__
-                    raise RuntimeError(
-                        f'simulator provided value for property "{prop}" '
-                        f"with type {actual} instead of expected {expected}"
-                    )
+        objects = self.objects
+        if not objects:
+            return
 
-                # Assign the new value
-                setattr(obj, prop, value)
+        # Read the latest values of dynamic properties from the simulation, in batches
+        # of objects having the same properties (i.e. of the same class)
+        groups = {}
+        for obj in objects:
+            dynTypes = obj._simulatorProvidedProperties
+            group = groups.get(id(dynTypes))
+            if group is None:
+                groups[id(dynTypes)] = group = (dynTypes, [])
+            group[1].append(obj)
+        rows = {}
+        for dynTypes, members in groups.values():
+            columns = self._readPropertyColumns(members, dynTypes)
+            for obj, values in zip(members, zip(*columns)):
+                rows[obj] = values
+
+        synced = self._syncedValues
+        replayOut = self._replayOut if self._writeDivergenceData else None
+        for obj in objects:
+            dynTypes = obj._simulatorProvidedProperties
+            values = rows[obj]
+
+            # Assign the new values of properties which have changed since we last
+            # assigned them (whether in the simulator or not)
+            previous = synced.get(obj)
+            if previous is None:
+                changed = None  # assume all properties changed
+                for prop, value in zip(dynTypes, values):
+                    setattr(obj, prop, value)
+            else:
+                changed = set()
+                for prop, old, new in zip(dynTypes, previous, values):
+                    if getattr(obj, prop) is not old or old != new:
+                        changed.add(prop)
+                        setattr(obj, prop, new)
+            synced[obj] = values
 
             # If saving a replay with divergence-checking support, save all the new values;
             # if running a replay with such support, check for divergence.
-            if self._replayOut and self._writeDivergenceData:
-                for prop, ty in dynTypes.items():
-                    self._replayOut.writeValue(values[prop], ty)
+            if replayOut:
+                for value, ty in zip(values, dynTypes.values()):
+                    replayOut.writeValue(value, ty)
             if self.replayCanContinue() and self._checkDivergence:
-                for prop, ty in dynTypes.items():
+                for (prop, ty), actual in zip(dynTypes.items(), values):
                     expected = self._replayIn.readValue(ty)
-                    actual = values[prop]
                     if self.valuesHaveDiverged(obj, prop, expected, actual):
                         msg = (
                             f'expected "{prop}" of {obj} to have value '
@@ -721,12 +762,61 @@ class Simulation(abc.ABC):
                         else:
                             raise DivergenceError(msg)
 
-            # Recompute dynamic final properties
-            obj._recomputeDynamicFinals()
-
-            # Clear caches to ensure that cached properties like visibleRegion, etc.
-            # are recomputed
-            obj._clearCaches()
+            if changed is None or changed:
+                # Recompute dynamic final properties depending on the changed ones
+                obj._recomputeDynamicFinals(changed)
+
+                # Clear caches depending on the changed properties to ensure that
+                # cached properties like visibleRegion, etc. are recomputed
+                obj._clearCaches(changed)
+
+    def _readPropertyColumns(self, objects, dynTypes):
+        # Get the values of the given properties of the objects as a list of columns,
+        # in the order of dynTypes, checking their types.
+        properties = set(dynTypes)
+        batch = self.getPropertiesBatch(objects, properties)
+        if batch is None:
+            rows = []
+            for obj in objects:
+                values = self.getProperties(obj, set(properties))
+                assert values.keys() == properties, properties ^ set(values)
+                rows.append(values)
+            batch = {prop: [values[prop] for values in rows] for prop in dynTypes}
+        else:
+            assert batch.keys() == properties, properties ^ set(batch)
+        return [
+            self._checkPropertyColumn(prop, batch[prop], dynTypes) for prop in dynTypes
+        ]
+
+    @staticmethod
+    def _checkPropertyColumn(prop, column, dynTypes):
+        # Check that new values of a property have the expected type, converting them
+        # to Python objects as needed.
+        ty = dynTypes[prop]
+        if isinstance(column, numpy.ndarray):
+            numeric = column.dtype.kind in "biuf"
+            if ty is float and numeric and column.ndim == 1:
+                return column.astype(float).tolist()
+            elif ty is Vector and numeric and column.ndim == 2:
+                return [Vector(*row) for row in column.astype(float).tolist()]
+            column = list(column)
+        if ty is float:
+            # Special case for scalars so that we don't penalize simulator interfaces
+            # for returning ints, NumPy scalar types, etc.
+            if all(isinstance(value, numbers.Real) for value in column):
+                return [float(value) for value in column]
+        elif ty is type(None) and column:
+            # Special case for properties with initial value None: the simulator sets
+            # their actual initial value, so we'll assume the type is correct here.
+            ty = type(column[0])
+            dynTypes[prop] = ty
+        for actual in set(map(type, column)):
+            if not issubclass(actual, ty):
+                raise RuntimeError(
+                    f'simulator provided value for property "{prop}" '
+                    f"with type {actual.__name__} instead of expected {ty.__name__}"
+                )
+        return column
 
     def valuesHaveDiverged(self, obj, prop, expected, actual):
         """Decide whether the value of a dynamic property has diverged from the replay.
@@ -775,13 +865,36 @@ class Simulation(abc.ABC):
         """
         raise NotImplementedError
 
+    def getPropertiesBatch(self, objects, properties):
+        """Read the values of the given properties of several objects at once.
+
+        Simulator interfaces which can read back the state of many objects more
+        efficiently than by calling `getProperties` for each one may override this
+        method. The default implementation returns `None`, meaning to use
+        `getProperties` instead.
+
+        Args:
+            objects (list): Scenic objects in question, all having the same
+                :term:`dynamic properties <dynamic property>`.
+            properties (set): Set of names of properties to read from the simulator.
+
+        Returns:
+            A `dict` mapping each of the given properties to a sequence of its values
+            for the objects, in order. Scalar properties may be given as 1D NumPy
+            arrays and vector properties as 2D arrays with one row per object.
+
+        .. versionadded:: 3.1
+        """
+        return None
+
     def currentState(self):
         """Return the current state of the simulation.
 
         The definition of 'state' is up to the simulator; the 'state' is simply saved
         at each time step to define the 'trajectory' of the simulation.
 
-        The default implementation returns a tuple of the positions of all objects.
+        The default implementation returns a tuple of the positions of all objects;
+        trajectories of such states are stored compactly (see `Trajectory`).
         """
         return tuple(obj.position for obj in self.objects)
 
@@ -844,8 +957,9 @@ class DummySimulation(Simulation):
         pass
 
     def step(self):
-        for obj in self.objects:
-            obj.position += Vector(0, self.drift)
+        if self.drift:
+            for obj in self.objects:
+                obj.position += Vector(0, self.drift)
 
     def getProperties(self, obj, properties):
         vals = dict(
@@ -871,6 +985,11 @@ class TerminationType(enum.Enum):
     #: Simulation reached the specified time limit.
     timeLimit = "reached simulation time limit"
 
+    #: Simulation reached the specified wall-clock time limit.
+    #:
+    #: (See the **timeout** argument of `Simulator.simulate`.)
+    timeout = "reached wall-clock time limit"
+
     #: The top-level scenario finished executing.
     #:
     #: (Either its :keyword:`compose` block completed, one of its termination
@@ -891,8 +1010,9 @@ class SimulationResult:
     """Result of running a simulation.
 
     Attributes:
-        trajectory: A tuple giving for each time step the simulation's 'state': by
-            default the positions of every object. See `Simulation.currentState`.
+        trajectory (`Trajectory`): A sequence giving for each time step the
+            simulation's 'state': by default the positions of every object. See
+            `Simulation.currentState`.
         finalState: The last 'state' of the simulation, as above.
         actions: A tuple giving for each time step a dict specifying for each agent the
             (possibly-empty) tuple of actions it took at that time step.
@@ -901,13 +1021,268 @@ class SimulationResult:
             simulation ended, possibly including debugging info.
         records (dict): For each :keyword:`record` statement, the value or time series of
             values its expression took during the simulation.
+
+    .. versionchanged:: 3.1
+
+        The **trajectory** is now a `Trajectory` rather than a `tuple`. It supports
+        the same operations on sequences, but code checking for a `tuple` (e.g. with
+        `isinstance`) needs to be updated.
     """
 
     def __init__(self, trajectory, actions, terminationType, terminationReason, records):
-        self.trajectory = tuple(trajectory)
+        if not isinstance(trajectory, Trajectory):
+            trajectory = Trajectory(trajectory)
+        self.trajectory = trajectory._finished()
         assert self.trajectory
         self.finalState = self.trajectory[-1]
         self.actions = tuple(actions)
         self.terminationType = terminationType
         self.terminationReason = str(terminationReason)
         self.records = dict(records)
+
+
+class Trajectory(Sequence):
+    """The states of a simulation at each time step.
+
+    Behaves like a tuple of states (see `Simulation.currentState`): it supports
+    indexing, slicing, iteration, comparison for equality with tuples of states, and
+    concatenation and repetition (which produce tuples). It is not itself a `tuple`,
+    however, and only the trajectory of a finished simulation (as in
+    `SimulationResult`) can be hashed.
+
+    When the states are tuples of object positions, as by default, they are stored in
+    a compact columnar form rather than as `Vector` objects: the positions of all
+    objects at all time steps are available as a single NumPy array through
+    `positions`, and can be saved to and loaded from a file with `save` and `load`.
+    Only positions are stored this way: a simulator which overrides `currentState` to
+    record other properties of objects gets a trajectory storing its states as they
+    are, without `positions` or the other columnar methods.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self, states=()):
+        self._length = 0
+        self._numObjects = 0
+        # Storage for positions, allocated with spare capacity in both dimensions;
+        # positions of objects not yet created at a time step are NaN.
+        self._positions = numpy.full((16, 4, 3), numpy.nan)
+        self._counts = numpy.zeros(16, dtype=int)
+        self._states = None  # list of states, if they aren't positions
+        self._frozen = False
+        for state in states:
+            self.append(state)
+
+    def append(self, state):
+        """Add the state at the next time step."""
+        if self._frozen:
+            raise TypeError("cannot modify the trajectory of a finished simulation")
+        if self._states is not None:
+            self._states.append(state)
+        elif type(state) is tuple and all(type(pos) is Vector for pos in state):
+            step, count = self._length, len(state)
+            self._reserve(step + 1, count)
+            if count:
+                self._positions[step, :count] = [pos.coordinates for pos in state]
+            self._counts[step] = count
+            self._numObjects = max(self._numObjects, count)
+        else:
+            self._states = list(self)
+            self._states.append(state)
+            self._positions = self._counts = None
+        self._length += 1
+
+    def _reserve(self, steps, objects):
+        capacity, width, _ = self._positions.shape
+        if steps <= capacity and objects <= width:
+            return
+        capacity, width = max(capacity, 1), max(width, 1)
+        while capacity < steps:
+            capacity *= 2
+        while width < objects:
+            width *= 2
+        positions = numpy.full((capacity, width, 3), numpy.nan)
+        positions[: self._length, : self._numObjects] = self.positions
+        counts = numpy.zeros(capacity, dtype=int)
+        counts[: self._length] = self.objectCounts
+        self._positions, self._counts = positions, counts
+
+    @property
+    def positions(self):
+        """The positions of all objects at each time step, as a NumPy array.
+
+        The array has shape ``(steps, objects, 3)``; the positions of objects created
+        during the simulation are NaN at time steps before their creation. The array
+        is a view of the trajectory's storage (without copying) and should not be
+        modified.
+
+        Raises:
+            TypeError: if the states of the simulation aren't object positions.
+        """
+        if self._states is not None:
+            raise TypeError("simulation states are not tuples of object positions")
+        return self._positions[: self._length, : self._numObjects]
+
+    @property
+    def objectCounts(self):
+        """The number of objects at each time step, as a NumPy array.
+
+        Raises:
+            TypeError: if the states of the simulation aren't object positions.
+        """
+        if self._states is not None:
+            raise TypeError("simulation states are not tuples of object positions")
+        return self._counts[: self._length]
+
+    def save(self, path):
+        """Save the positions of all objects to a NumPy ``.npz`` file.
+
+        Raises:
+            TypeError: if the states of the simulation aren't object positions.
+        """
+        numpy.savez(path, positions=self.positions, objectCounts=self.objectCounts)
+
+    @classmethod
+    def load(cls, path):
+        """Load a trajectory saved with `save`."""
+        with numpy.load(path) as data:
+            positions, counts = data["positions"], data["objectCounts"]
+        trajectory = cls()
+        trajectory._length, trajectory._numObjects = positions.shape[:2]
+        trajectory._positions, trajectory._counts = positions, counts
+        return trajectory
+
+    def _finished(self):
+        """Get a copy of this trajectory which cannot be modified."""
+        if self._frozen:
+            return self
+        trajectory = type(self).__new__(type(self))
+        trajectory.__dict__.update(self.__getstate__())
+        if self._states is not None:
+            trajectory._states = list(self._states)
+        trajectory._frozen = True
+        return trajectory
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._length)))
+        if self._states is not None:
+            return self._states[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("trajectory index out of range")
+        count = self._counts[index]
+        return tuple(Vector(*pos) for pos in self._positions[index, :count].tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, (Trajectory, tuple, list)):
+            return NotImplemented
+        if isinstance(other, Trajectory) and self._states is other._states is None:
+            if not numpy.array_equal(self.objectCounts, other.objectCounts):
+                return False
+            return numpy.array_equal(self.positions, other.positions, equal_nan=True)
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self):
+        if not self._frozen:
+            raise TypeError("the trajectory of an unfinished simulation is unhashable")
+        return hash(tuple(self))  # consistent with equality with tuples
+
+    def __add__(self, other):
+        if not isinstance(other, (Trajectory, tuple)):
+            return NotImplemented
+        return tuple(self) + tuple(other)
+
+    def __radd__(self, other):
+        if not isinstance(other, tuple):
+            return NotImplemented
+        return other + tuple(self)
+
+    def __mul__(self, count):
+        return tuple(self) * count
+
+    __rmul__ = __mul__
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._states is None:
+            # Don't save the spare capacity
+            state["_positions"] = self.positions.copy()
+            state["_counts"] = self.objectCounts.copy()
+        return state
+
+    def __repr__(self):
+        return f"<Trajectory of {self._length} states>"
+
+
+class BatchSimulation:
+    """A simulation run as part of a batch by `Scenario.simulateBatch`.
+
+    Attributes:
+        index (int): Position of this simulation in the batch.
+        scene (`Scene`): Scene from which the simulation was started, or `None` if no
+            scene could be generated (in which case **error** is the resulting
+            `RejectionException`) or the worker process running the simulation was
+            stopped by the **workerTimeout** of `Scenario.simulateBatch`.
+        result (`SimulationResult`): Result of the simulation, or `None` if it was
+            rejected or could not be run. If the simulation was run in a worker
+            process, the actions in ``result.actions`` are keyed by the corresponding
+            objects of **scene**, except that any agents created during the
+            simulation are represented by `SpawnedAgent` placeholders.
+        replay (bytes): Replay data for the simulation (see `Simulation.getReplay`),
+            or `None` if there is no result or replay support was disabled. The
+            simulation can be reconstructed with ``simulator.replay(scene, replay)``.
+        error (Exception): Exception which prevented the simulation from being run
+            (e.g. a `SimulationCreationError`), or `None`.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self, index, scene, result, replay=None, error=None):
+        self.index = index
+        self.scene = scene
+        self.result = result
+        self.replay = replay
+        self.error = error
+
+    def __repr__(self):
+        if self.result is not None:
+            status = self.result.terminationType.name
+        elif self.error is not None:
+            status = f"failed ({type(self.error).__name__})"
+        else:
+            status = "rejected"
+        return f"<BatchSimulation {self.index}: {status}>"
+
+
+class SpawnedAgent:
+    """Placeholder for an agent created during a simulation run in a worker process.
+
+    Such agents only exist in the worker process, so in the actions of a
+    `BatchSimulation` they are replaced by instances of this class.
+
+    Attributes:
+        index (int): Position of the agent in `Simulation.objects`.
+        className (str): Name of the class of the agent.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self, index, className):
+        self.index = index
+        self.className = className
+
+    def __eq__(self, other):
+        if not isinstance(other, SpawnedAgent):
+            return NotImplemented
+        return (self.index, self.className) == (other.index, other.className)
+
+    def __hash__(self):
+        return hash((self.index, self.className))
+
+    def __repr__(self):
+        return f"<SpawnedAgent {self.index}: {self.className}>"
@@ -31,8 +31,22 @@ else:
             yield batch
 
 
-def cached(oldMethod):
-    """Decorator for making a method with no arguments cache its result"""
+def cached(oldMethod=None, *, dependencies=None):
+    """Decorator for making a method with no arguments cache its result
+
+    Args:
+        dependencies: Names of the properties (or other cached values) of the object
+            which the result depends on, if known. When only some properties of an
+            object change, only caches depending on them need to be cleared (see
+            `Constructible._clearCaches`); caches with unknown dependencies are
+            always cleared.
+
+    .. versionchanged:: 3.1
+
+        Added the **dependencies** argument.
+    """
+    if oldMethod is None:
+        return functools.partial(cached, dependencies=dependencies)
     storageName = f"_cached_{oldMethod.__name__}"
 
     @functools.wraps(oldMethod)
@@ -46,12 +60,12 @@ def cached(oldMethod):
             return value
 
     def clearer(self):
-        try:
-            delattr(self, storageName)
-        except AttributeError:
-            pass
+        # Most caches are empty when cleared, so avoid raising AttributeError
+        self.__dict__.pop(storageName, None)
 
     wrapper._scenic_cache_clearer = clearer
+    if dependencies is not None:
+        wrapper._scenic_cache_dependencies = frozenset(dependencies)
 
     return wrapper
 
@@ -88,8 +102,10 @@ def cached_method(oldMethod):
     return wrapper
 
 
-def cached_property(oldMethod):
-    return property(cached(oldMethod))
+def cached_property(oldMethod=None, *, dependencies=None):
+    if oldMethod is None:
+        return functools.partial(cached_property, dependencies=dependencies)
+    return property(cached(oldMethod, dependencies=dependencies))
 
 
 def argsToString(args, kwargs={}):
@@ -215,14 +215,37 @@ def vectorDistributionMethod(method):
 class Orientation:
     """An orientation in 3D space."""
 
+    # Orientations are created in large numbers during sampling and simulation, so
+    # they are stored compactly as a unit quaternion (of the form (x,y,z,w)), and
+    # the corresponding SciPy rotation is only created if needed. The quaternion
+    # arithmetic below uses the same formulas as SciPy so that results agree exactly.
+    __slots__ = (
+        "_quat",
+        "_r",
+        "_q",
+        "_matrix",
+        "_cached_eulerAngles",
+        "_cached_inverse",
+        "_cached__inverseRotation",
+    )
+
     def __init__(self, rotation):
         if not isinstance(rotation, Rotation):
             raise TypeError(
                 "Orientation's 'rotation' parameter must be a SciPy rotation."
                 " Perhaps you want to use a factory method?"
             )
-        self.r = rotation
-        self.q = rotation.as_quat()
+        self._quat = tuple(rotation.as_quat().tolist())
+        self._r = rotation
+        self._q = self._matrix = None
+
+    @classmethod
+    def _fromQuat(cls, quat) -> Orientation:
+        # Fast inner constructor taking a unit quaternion as a tuple of floats.
+        orientation = cls.__new__(cls)
+        orientation._quat = quat
+        orientation._r = orientation._q = orientation._matrix = None
+        return orientation
 
     @classmethod
     def fromQuaternion(cls, quaternion) -> Orientation:
@@ -239,30 +262,53 @@ class Orientation:
     @classmethod
     def _fromEuler(cls, yaw, pitch, roll) -> Orientation:
         # Inner version of `fromEuler` which doesn't accept distributions.
-        r = Rotation.from_euler("ZXY", [yaw, pitch, roll], degrees=False)
-        return cls(r)
+        # Equivalent to Rotation.from_euler("ZXY", [yaw, pitch, roll]).
+        yaw, pitch, roll = float(yaw), float(pitch), float(roll)
+        quat = (0.0, 0.0, sin(yaw / 2), cos(yaw / 2))
+        quat = _composeQuaternions(quat, (sin(pitch / 2), 0.0, 0.0, cos(pitch / 2)))
+        quat = _composeQuaternions(quat, (0.0, sin(roll / 2), 0.0, cos(roll / 2)))
+        return cls._fromQuat(quat)
 
     @classmethod
     def _fromHeading(cls, heading) -> Orientation:
         # This method is faster than `from_euler` if we only have 1 angle.
-        r = Rotation.from_rotvec([0, 0, heading], degrees=False)
-        return cls(r)
+        # Equivalent to Rotation.from_rotvec([0, 0, heading]).
+        heading = float(heading)
+        angle = math.sqrt(heading * heading)
+        if angle <= 1e-3:
+            angle2 = angle * angle
+            scale = 0.5 - angle2 / 48 + angle2 * angle2 / 3840
+        else:
+            scale = sin(angle / 2) / angle
+        return cls._fromQuat((0.0, 0.0, heading * scale, cos(angle / 2)))
+
+    @property
+    def r(self) -> Rotation:
+        if self._r is None:
+            self._r = Rotation(self._quat, normalize=False)
+        return self._r
+
+    @property
+    def q(self) -> numpy.ndarray:
+        if self._q is None:
+            self._q = numpy.array(self._quat)
+        return self._q
 
     @property
     def w(self) -> float:
-        return self.q[3]
+        return self._quat[3]
 
     @property
     def x(self) -> float:
-        return self.q[0]
+        return self._quat[0]
 
     @property
     def y(self) -> float:
-        return self.q[1]
+        return self._quat[1]
 
     @property
     def z(self) -> float:
-        return self.q[2]
+        return self._quat[2]
 
     @property
     def yaw(self) -> float:
@@ -319,11 +365,46 @@ class Orientation:
 
     @cached_property
     def inverse(self) -> Orientation:
-        return Orientation(self.r.inv())
+        x, y, z, w = self._quat
+        return Orientation._fromQuat(_normalizeQuaternion((-x, -y, -z, w)))
 
     @cached_property
     def _inverseRotation(self):
-        return self.r.inv()
+        return self.inverse.getRotation()
+
+    @property
+    def _rotationMatrix(self):
+        # Same as self.r.as_matrix(), but as nested tuples.
+        if self._matrix is None:
+            x, y, z, w = self._quat
+            x2, y2, z2, w2 = x * x, y * y, z * z, w * w
+            xy, zw, xz, yw, yz, xw = x * y, z * w, x * z, y * w, y * z, x * w
+            self._matrix = (
+                (x2 - y2 - z2 + w2, 2 * (xy - zw), 2 * (xz + yw)),
+                (2 * (xy + zw), -x2 + y2 - z2 + w2, 2 * (yz - xw)),
+                (2 * (xz - yw), 2 * (yz + xw), -x2 - y2 + z2 + w2),
+            )
+        return self._matrix
+
+    def _rotate(self, vec):
+        """Rotate a single 3D vector, given as a sequence of floats.
+
+        Equivalent to ``self.getRotation().apply(vec)``, without creating any arrays.
+        """
+        vx, vy, vz = vec
+        # N.B. Terms are summed in the same order as NumPy uses in Rotation.apply.
+        return tuple((r0 * vx + r2 * vz) + r1 * vy for r0, r1, r2 in self._rotationMatrix)
+
+    def _rotateMany(self, vecs):
+        """Rotate an array of 3D vectors (one per row), returning a new array.
+
+        Gives exactly the same results as applying `_rotate` to each row.
+        """
+        vecs = numpy.asarray(vecs, dtype=float)
+        vx, vy, vz = vecs[:, 0], vecs[:, 1], vecs[:, 2]
+        return numpy.column_stack(
+            [(r0 * vx + r2 * vz) + r1 * vy for r0, r1, r2 in self._rotationMatrix]
+        )
 
     # will be converted to a distributionMethod after the class definition
     def __mul__(self, other) -> Orientation:
@@ -342,7 +423,9 @@ class Orientation:
             return other
         if other == globalOrientation:
             return self
-        return Orientation(self.r * other.r)
+        return Orientation._fromQuat(
+            _normalizeQuaternion(_composeQuaternions(self._quat, other._quat))
+        )
 
     @distributionMethod
     def __add__(self, other) -> Orientation:
@@ -364,7 +447,7 @@ class Orientation:
         return f"Orientation.fromEuler{tuple(self.eulerAngles)!r}"
 
     def __hash__(self):
-        return hash(tuple(self.q)) + hash(tuple(-self.q))
+        return hash(self._quat) + hash(tuple(-c for c in self._quat))
 
     @distributionFunction
     def localAnglesFor(self, orientation) -> typing.Tuple[float, float, float]:
@@ -388,24 +471,43 @@ class Orientation:
     def __eq__(self, other):
         if not isinstance(other, Orientation):
             return NotImplemented
-        return numpy.array_equal(self.q, other.q) or numpy.array_equal(self.q, -other.q)
+        return self._quat == other._quat or self._quat == tuple(-c for c in other._quat)
 
     def approxEq(self, other, tol=1e-10):
         if not isinstance(other, Orientation):
             return NotImplemented
-        return abs(numpy.dot(self.q, other.q)) > 1 - tol
+        return abs(sum(a * b for a, b in zip(self._quat, other._quat))) > 1 - tol
 
     @classmethod
     def encodeTo(cls, orientation, stream):
-        stream.write(struct.pack("<dddd", *orientation.q))
+        stream.write(struct.pack("<dddd", *orientation._quat))
 
     @classmethod
     def decodeFrom(cls, stream):
-        # Quaternion constructor does not roundtrip so we manually
-        # construct a rotation and pass that in.
+        # Quaternion constructor does not roundtrip so we bypass it.
         quaternion = struct.unpack("<dddd", stream.read(32))
-        rotation = Rotation(quaternion, normalize=False)
-        return cls(rotation)
+        return cls._fromQuat(quaternion)
+
+
+def _composeQuaternions(p, q):
+    # Hamilton product of quaternions, as computed by SciPy.
+    px, py, pz, pw = p
+    qx, qy, qz, qw = q
+    cx = py * qz - pz * qy
+    cy = pz * qx - px * qz
+    cz = px * qy - py * qx
+    return (
+        pw * qx + qw * px + cx,
+        pw * qy + qw * py + cy,
+        pw * qz + qw * pz + cz,
+        pw * qw - (px * qx + py * qy + pz * qz),
+    )
+
+
+def _normalizeQuaternion(q):
+    x, y, z, w = q
+    norm = math.sqrt(x * x + y * y + z * z + w * w)
+    return (x / norm, y / norm, z / norm, w / norm)
 
 
 globalOrientation = Orientation.fromEuler(0, 0, 0)
@@ -427,7 +529,14 @@ class Vector(Samplable, collections.abc.Sequence):
 
     def __init__(self, x, y, z=0):
         self.coordinates = (x, y, z)
-        super().__init__(self.coordinates)
+        if isLazy(x) or isLazy(y) or isLazy(z):
+            super().__init__(self.coordinates)
+        else:
+            # Fast path for concrete vectors, equivalent to calling the superclass
+            # initializer with no lazy dependencies.
+            self._dependencies = self._requiredProperties = ()
+            self._needsSampling = self._needsLazyEval = self._isLazy = False
+            self._conditioned = self
 
     @property
     def x(self) -> float:
@@ -470,8 +579,7 @@ class Vector(Samplable, collections.abc.Sequence):
     def applyRotation(self, rotation):
         if not isinstance(rotation, Orientation):
             return TypeError("rotation must be an Orientation")
-        r = rotation.getRotation()
-        return Vector(*r.apply(self.coordinates))
+        return Vector(*rotation._rotate(self.coordinates))
 
     @vectorOperator
     def sphericalCoordinates(self):
@@ -498,8 +606,7 @@ class Vector(Samplable, collections.abc.Sequence):
     @vectorOperator
     def offsetLocally(self, orientation, offset) -> Vector:
         # Faster version of `offsetRotated` that only accepts Orientations.
-        r = orientation.getRotation()
-        ro = r.apply(offset)
+        ro = orientation._rotate(offset)
         x, y, z = self
         ox, oy, oz = ro
         return Vector(x + ox, y + oy, z + oz)
@@ -603,6 +710,9 @@ class Vector(Samplable, collections.abc.Sequence):
     def __getitem__(self, index):
         return self.coordinates[index]
 
+    def __iter__(self):
+        return iter(self.coordinates)
+
     def __repr__(self):
         return f"Vector({self.x}, {self.y}, {self.z})"
 
@@ -690,6 +800,9 @@ class VectorField:
 
     @distributionMethod
     def __getitem__(self, pos) -> Orientation:
+        return self._orientationAt(pos)
+
+    def _orientationAt(self, pos):
         val = self.value(pos)
         if isinstance(val, numbers.Real):  # fast path
             return Orientation._fromHeading(val)
@@ -722,12 +835,12 @@ class VectorField:
                 steps = max(steps, math.ceil(dist / stepSize))
 
         stepSize = dist / steps
-        step = numpy.array([0, stepSize, 0])
+        step = (0, stepSize, 0)
+        pos = Vector(*pos)
         for i in range(steps):
-            rot = self[pos].getRotation()
-            pos += rot.apply(step)
+            pos += self._orientationAt(pos)._rotate(step)
 
-        return Vector(*pos)
+        return pos
 
     @staticmethod
     def forUnionOf(regions, tolerance=0):
@@ -781,6 +894,17 @@ class PolygonalVectorField(VectorField):
             return self.defaultHeading
         raise RejectionException(f"evaluated PolygonalVectorField at undefined point")
 
+    def cellHeadingBounds(self):
+        """Get the cells of the field together with bounds on the headings in them.
+
+        Returns a sequence of triples ``(cell, lower, upper)`` such that the heading at
+        every point of the cell lies between **lower** and **upper** (both being
+        :obj:`None` if nothing is known about the heading). Used for pruning.
+
+        .. versionadded:: 3.1
+        """
+        return tuple((cell, heading, heading) for cell, heading in self.cells)
+
 
 class PiecewiseVectorField(VectorField):
     """A vector field defined by patching together several regions.
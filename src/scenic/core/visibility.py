@@ -93,21 +93,9 @@ def canSee(
         obj for obj in occludingObjects if position.distanceTo(obj) <= visibleDistance
     ]
 
-    if rayCount is None:
-        rayCount = (
-            math.degrees(viewAngles[0]) * rayDensity,
-            math.degrees(viewAngles[1]) * rayDensity,
-        )
-
-        if distanceScaling:
-            target_distance = target.position.distanceTo(position)
-
-            rayCount = (rayCount[0] * target_distance, rayCount[1] * target_distance)
-
-        altitudeScaling = True
-    else:
-        # Do not scale ray counts with altitude or distance if explicitly given
-        altitudeScaling = False
+    rayCount, altitudeScaling = _rayCounts(
+        position, viewAngles, rayCount, rayDensity, distanceScaling, target
+    )
 
     if isinstance(target, (Region, Object)):
         # Extract the target region from the object or region.
@@ -134,224 +122,12 @@ def canSee(
         if target.distanceTo(position) > visibleDistance:
             return False
 
-        # Orient the object so that it has the same relative position and orientation to the
-        # origin as it did to the viewer
-        target_vertices = target_region.mesh.vertices - np.array(position.coordinates)
-
-        if orientation is not None:
-            target_vertices = orientation._inverseRotation.apply(target_vertices)
-
-        # Add additional points along each edge that could potentially have a higher altitude
-        # than the endpoints.
-        vec_1s = np.asarray(target_vertices[target_region.mesh.edges[:, 0], :])
-        vec_2s = np.asarray(target_vertices[target_region.mesh.edges[:, 1], :])
-        x1, y1, z1 = vec_1s[:, 0], vec_1s[:, 1], vec_1s[:, 2]
-        x2, y2, z2 = vec_2s[:, 0], vec_2s[:, 1], vec_2s[:, 2]
-        D = x1 * x2 + y1 * y2
-        N = (x1**2 + y1**2) * z2 - D * z1
-        M = (x2**2 + y2**2) * z1 - D * z2
-        with np.errstate(divide="ignore", invalid="ignore"):
-            t_vals = N / (N + M)  # t values that can be an altitude local optimum
-
-        # Keep only points where the t_value is between 0 and 1
-        t_mask = np.logical_and(t_vals > 0, t_vals < 1)
-        interpolated_points = vec_1s[t_mask] + t_vals[t_mask][:, None] * (
-            vec_2s[t_mask] - vec_1s[t_mask]
-        )
-
-        target_vertices = np.concatenate((target_vertices, interpolated_points), axis=0)
-
-        ## Check if the object crosses the y axis ahead and/or behind the viewer
-
-        # Extract the two vectors that are part of each edge crossing the y axis.
-        with np.errstate(divide="ignore", invalid="ignore"):
-            y_cross_edges = (vec_1s[:, 0] / vec_2s[:, 0]) < 0
-        vec_1s = vec_1s[y_cross_edges]
-        vec_2s = vec_2s[y_cross_edges]
-
-        # Figure out for which t value the vectors cross the y axis
-        t = (-vec_1s[:, 0]) / (vec_2s[:, 0] - vec_1s[:, 0])
-
-        # Figure out what the y value is when the y axis is crossed
-        y_intercept_points = t * (vec_2s[:, 1] - vec_1s[:, 1]) + vec_1s[:, 1]
-
-        # If the object crosses ahead and behind the object, or through 0,
-        # we will not optimize ray casting.
-        target_crosses_ahead = np.any(y_intercept_points >= 0)
-        target_crosses_behind = np.any(y_intercept_points <= 0)
-
-        ## Compute the horizontal/vertical angle ranges which bound the object
-        ## (from the origin facing forwards)
-        spherical_angles = np.zeros((len(target_vertices[:, 0]), 2))
-
-        spherical_angles[:, 0] = np.arctan2(target_vertices[:, 1], target_vertices[:, 0])
-        spherical_angles[:, 1] = np.arcsin(
-            target_vertices[:, 2] / (np.linalg.norm(target_vertices, axis=1))
+        ray_vectors = _candidateRays(
+            position, orientation, viewAngles, rayCount, altitudeScaling, target_region
         )
-
-        # Align azimuthal angle with y axis.
-        spherical_angles[:, 0] = spherical_angles[:, 0] - math.pi / 2
-
-        # Normalize angles between (-Pi,Pi)
-        spherical_angles[:, 0] = np.mod(spherical_angles[:, 0] + np.pi, 2 * np.pi) - np.pi
-        spherical_angles[:, 1] = np.mod(spherical_angles[:, 1] + np.pi, 2 * np.pi) - np.pi
-
-        # First we check if the vertical angles overlap with the vertical view angles.
-        # If not, then the object cannot be visible.
-        if (
-            np.min(spherical_angles[:, 1]) > viewAngles[1] / 2
-            or np.max(spherical_angles[:, 1]) < -viewAngles[1] / 2
-        ):
+        if ray_vectors is None:
             return False
 
-        ## Compute which horizontal/vertical angle ranges to cast rays in
-        if target_crosses_ahead and target_crosses_behind:
-            # No optimizations feasible here. Just send all rays.
-            h_range = (-viewAngles[0] / 2, viewAngles[0] / 2)
-            v_range = (-viewAngles[1] / 2, viewAngles[1] / 2)
-
-            view_ranges = [(h_range, v_range)]
-
-        elif target_crosses_behind:
-            # We can keep the view angles oriented around the front of the object and
-            # consider the spherical angles oriented around the back of the object.
-            # We can then check for impossible visibility/optimize which rays will be cast.
-
-            # Extract the viewAngle ranges
-            va_h_range = (-viewAngles[0] / 2, viewAngles[0] / 2)
-            va_v_range = (-viewAngles[1] / 2, viewAngles[1] / 2)
-
-            # Convert spherical angles to be centered around the back of the viewing object.
-            left_points = spherical_angles[:, 0] >= 0
-            right_points = spherical_angles[:, 0] < 0
-
-            spherical_angles[:, 0][left_points] = (
-                spherical_angles[:, 0][left_points] - np.pi
-            )
-            spherical_angles[:, 0][right_points] = (
-                spherical_angles[:, 0][right_points] + np.pi
-            )
-
-            sphere_h_range = (
-                np.min(spherical_angles[:, 0]),
-                np.max(spherical_angles[:, 0]),
-            )
-            sphere_v_range = (
-                np.min(spherical_angles[:, 1]),
-                np.max(spherical_angles[:, 1]),
-            )
-
-            # Extract the overlapping ranges in the horizontal and vertical view angles.
-            # Note that the spherical range must cross the back plane and the view angles
-            # must cross the front plane (and are centered on these points),
-            # which means we can just add up each side of the ranges and see if they add up to
-            # greater than or equal to Pi. If none do, then it's impossible for object to overlap
-            # with the viewAngle range.
-
-            # Otherwise we can extract the overlapping v_ranges and use those going forwards.
-            overlapping_v_range = (
-                np.clip(sphere_v_range[0], va_v_range[0], va_v_range[1]),
-                np.clip(sphere_v_range[1], va_v_range[0], va_v_range[1]),
-            )
-            view_ranges = []
-
-            if abs(va_h_range[0]) + abs(sphere_h_range[1]) > math.pi:
-                h_range = (va_h_range[0], -math.pi + sphere_h_range[1])
-                view_ranges.append((h_range, overlapping_v_range))
-
-            if abs(va_h_range[1]) + abs(sphere_h_range[0]) > math.pi:
-                h_range = (math.pi + sphere_h_range[0], va_h_range[1])
-                view_ranges.append((h_range, overlapping_v_range))
-
-            if len(view_ranges) == 0:
-                return False
-
-        else:
-            # We can immediately check for impossible visbility/optimize which rays
-            # will be cast.
-
-            # Check if view range and spherical angles overlap in horizontal or
-            # vertical dimensions. If not, return False
-            if (np.max(spherical_angles[:, 0]) < -viewAngles[0] / 2) or (
-                np.min(spherical_angles[:, 0]) > viewAngles[0] / 2
-            ):
-                return False
-
-            # Compute trimmed view angles
-            h_min = np.clip(
-                np.min(spherical_angles[:, 0]), -viewAngles[0] / 2, viewAngles[0] / 2
-            )
-            h_max = np.clip(
-                np.max(spherical_angles[:, 0]), -viewAngles[0] / 2, viewAngles[0] / 2
-            )
-            v_min = np.clip(
-                np.min(spherical_angles[:, 1]), -viewAngles[1] / 2, viewAngles[1] / 2
-            )
-            v_max = np.clip(
-                np.max(spherical_angles[:, 1]), -viewAngles[1] / 2, viewAngles[1] / 2
-            )
-
-            h_range = (h_min, h_max)
-            v_range = (v_min, v_max)
-
-            view_ranges = [(h_range, v_range)]
-
-        ## Generate candidate rays
-        candidate_ray_list = []
-
-        for h_range, v_range in view_ranges:
-            h_size = h_range[1] - h_range[0]
-            v_size = v_range[1] - v_range[0]
-
-            assert h_size > 0
-            assert v_size > 0
-
-            scaled_v_ray_count = math.ceil(v_size / (viewAngles[1]) * rayCount[1])
-            v_angles = np.linspace(v_range[0], v_range[1], scaled_v_ray_count)
-
-            # If altitudeScaling is true, we will scale the number of rays by the cosine of the altitude
-            # to get a uniform spread.
-            if altitudeScaling:
-                h_ray_counts = np.maximum(
-                    np.ceil(np.cos(v_angles) * h_size / (viewAngles[0]) * rayCount[0]), 1
-                ).astype(int)
-                h_angles_list = [
-                    np.linspace(h_range[0], h_range[1], h_ray_count)
-                    for h_ray_count in h_ray_counts
-                ]
-                angle_matrices = [
-                    np.column_stack(
-                        [
-                            h_angles_list[i],
-                            np.repeat([v_angles[i]], len(h_angles_list[i])),
-                        ]
-                    )
-                    for i in range(len(v_angles))
-                ]
-                angle_matrix = np.concatenate(angle_matrices, axis=0)
-            else:
-                scaled_h_ray_count = math.ceil(h_size / (viewAngles[0]) * rayCount[0])
-                h_angles = np.linspace(h_range[0], h_range[1], scaled_h_ray_count)
-                angle_matrix = np.column_stack(
-                    [np.repeat(h_angles, len(v_angles)), np.tile(v_angles, len(h_angles))]
-                )
-
-            ray_vectors = np.zeros((len(angle_matrix[:, 0]), 3))
-
-            ray_vectors[:, 0] = -np.sin(angle_matrix[:, 0])
-            ray_vectors[:, 1] = np.cos(angle_matrix[:, 0])
-            ray_vectors[:, 2] = np.tan(
-                angle_matrix[:, 1]
-            )  # At 90 deg, np returns super large number
-
-            ray_vectors /= np.linalg.norm(ray_vectors, axis=1)[:, np.newaxis]
-            candidate_ray_list.append(ray_vectors)
-
-        ray_vectors = np.concatenate(candidate_ray_list, axis=0)
-
-        if orientation is not None:
-            ray_vectors = orientation.getRotation().apply(ray_vectors)
-
         ## DEBUG ##
         # Show all original candidate rays
         if debug:
@@ -532,22 +308,9 @@ def canSee(
             return False
 
         # Create the single candidate ray and check that it's within viewAngles.
-        if orientation is not None:
-            target_loc = orientation._inverseRotation.apply([target_loc])[0]
-
-        target_vertex = target_loc - position
-        candidate_ray = target_vertex / np.linalg.norm(target_vertex)
-
-        candidate_ray_list = np.array([candidate_ray])
-
-        azimuth = (
-            np.mod(
-                np.arctan2(candidate_ray[1], candidate_ray[0]) - math.pi / 2 + np.pi,
-                2 * np.pi,
-            )
-            - np.pi
-        )
-        altitude = np.arcsin(candidate_ray[2])
+        candidate_ray_list = _pointRay(position, orientation, viewAngles, target_loc)
+        if candidate_ray_list is None:
+            return False
 
         ## DEBUG ##
         # Show all original candidate rays
@@ -572,16 +335,7 @@ def canSee(
                 render_scene.add_geometry(i.occupiedSpace.mesh)
             render_scene.show()
 
-        # Check if this ray is within our view cone.
-        if not (-viewAngles[0] / 2 <= azimuth <= viewAngles[0] / 2) or not (
-            -viewAngles[1] / 2 <= altitude <= viewAngles[1] / 2
-        ):
-            return False
-
         # Now check if occluding objects block sight to target
-        if orientation is not None:
-            candidate_ray_list = orientation.getRotation().apply(candidate_ray_list)
-
         for occ_obj in occludingObjects:
             # Test all candidate rays against this occluding object
             object_hit_info = occ_obj.occupiedSpace.mesh.ray.intersects_location(
@@ -602,3 +356,544 @@ def canSee(
         return True
     else:
         assert False, target
+
+
+def batchCanSee(viewers, targets, occludingObjects=()):
+    """Check visibility between many viewers and targets at once.
+
+    This is equivalent to checking each (viewer, target) pair with the ``canSee``
+    method of the viewer, but is much faster when there are many pairs: all
+    occluding objects are combined into a single mesh whose ray intersection
+    structure is built once, and the candidate rays for every pair are traced
+    against the targets and occluders in a few vectorized passes.
+
+    A viewer or target is never considered to occlude itself, so the occluders
+    used for a given pair are those in **occludingObjects** other than the viewer
+    and target of that pair (matching the behavior of `VisibilityRequirement`).
+
+    .. versionadded:: 3.1
+
+    Args:
+        viewers: A sequence of `Point`, `OrientedPoint`, or `Object` viewers.
+        targets: A sequence of `Point`, `OrientedPoint`, `Object`, or `Vector` targets.
+        occludingObjects: Objects which can occlude visibility.
+
+    Returns:
+        A boolean array whose (i, j) entry indicates whether ``viewers[i]`` can see
+        ``targets[j]``.
+    """
+    from scenic.core.object_types import Object, Point, Point2D
+
+    occludingObjects = tuple(occludingObjects)
+    occluders = _CombinedOccluders(occludingObjects)
+    results = np.zeros((len(viewers), len(targets)), dtype=bool)
+
+    pointQueries = []  # (pair, origin, ray, targetDistance, allowed occluders)
+    regionQueries = []  # (pair, viewer parameters..., allowed occluders)
+    for i, viewer in enumerate(viewers):
+        params = viewer._visibilityParameters()
+        position = params["position"]
+        visibleDistance = params["visibleDistance"]
+        viewAngles = params["viewAngles"]
+        orientation = params["orientation"]
+        nearby = np.array(
+            [position.distanceTo(occ) <= visibleDistance for occ in occludingObjects],
+            dtype=bool,
+        )
+        for j, target in enumerate(targets):
+            excluded = np.array(
+                [occ is viewer or occ is target for occ in occludingObjects], dtype=bool
+            )
+            if isinstance(viewer, Point2D) and excluded.all():
+                # 2D viewers use a fast path when there is no occlusion
+                results[i, j] = viewer._canSee2D(target)
+                continue
+            allowed = nearby & ~excluded
+
+            rayCount, altitudeScaling = _rayCounts(
+                position,
+                viewAngles,
+                params["rayCount"],
+                params["rayDensity"],
+                params["distanceScaling"],
+                target,
+            )
+
+            if isinstance(target, (Region, Object)):
+                if isinstance(target, Region):
+                    raise NotImplementedError
+                if target.shape.containsCenter:
+                    pointQueries.append(
+                        _pointQuery(
+                            (i, j),
+                            position,
+                            orientation,
+                            visibleDistance,
+                            viewAngles,
+                            target.position,
+                            allowed,
+                        )
+                    )
+                if target.distanceTo(position) > visibleDistance:
+                    continue
+                regionQueries.append(
+                    (
+                        (i, j),
+                        position,
+                        orientation,
+                        visibleDistance,
+                        viewAngles,
+                        rayCount,
+                        altitudeScaling,
+                        allowed,
+                    )
+                )
+            elif isinstance(target, (Point, Vector)):
+                pointQueries.append(
+                    _pointQuery(
+                        (i, j),
+                        position,
+                        orientation,
+                        visibleDistance,
+                        viewAngles,
+                        toVector(target),
+                        allowed,
+                    )
+                )
+            else:
+                assert False, target
+
+    # Check all single rays to points (including the centers of objects) at once.
+    pointQueries = [query for query in pointQueries if query is not None]
+    if pointQueries:
+        pairs, origins, rays, distances, allowed = zip(*pointQueries)
+        origins, rays = np.array(origins), np.array(rays)
+        locations, rayIndices, occIndices = occluders.intersects(origins, rays)
+        occluded = np.zeros(len(pairs), dtype=bool)
+        for loc, r, k in zip(locations, rayIndices, occIndices):
+            if allowed[r][k] and math.hypot(*(loc - origins[r])) <= distances[r]:
+                occluded[r] = True
+        for pair, isOccluded in zip(pairs, occluded):
+            if not isOccluded:
+                results[pair] = True
+
+    # Generate candidate rays for all remaining object targets, shuffled as in
+    # `canSee` so that visible targets are likely to be found after few rays.
+    pending = []
+    for query in regionQueries:
+        pair, position, orientation, visibleDistance, viewAngles = query[:5]
+        rayCount, altitudeScaling, allowed = query[5:]
+        if results[pair]:
+            continue  # already visible by its center
+        rays = _candidateRays(
+            position,
+            orientation,
+            viewAngles,
+            rayCount,
+            altitudeScaling,
+            targets[pair[1]].occupiedSpace,
+        )
+        if rays is None:
+            continue
+        rng = np.random.default_rng(seed=42)
+        rays = rays[rng.permutation(len(rays))]
+        pending.append((pair, position.coordinates, rays, visibleDistance, allowed))
+
+    # Trace the rays of all pending pairs together, in rounds of increasing size.
+    start, size = 0, BATCH_SIZE
+    while pending:
+        batch = [
+            query[:2] + (query[2][start : start + size],) + query[3:] for query in pending
+        ]
+        visible = _traceRays(batch, targets, occluders)
+        for (pair, *_), isVisible in zip(pending, visible):
+            if isVisible:
+                results[pair] = True
+        start += size
+        size *= 2
+        pending = [
+            query
+            for query, isVisible in zip(pending, visible)
+            if not isVisible and len(query[2]) > start
+        ]
+
+    return results
+
+
+def _traceRays(queries, targets, occluders):
+    """Check whether any ray of each query reaches its target without being occluded."""
+    rayQueries = np.repeat(np.arange(len(queries)), [len(query[2]) for query in queries])
+    origins = np.concatenate(
+        [np.broadcast_to(origin, rays.shape) for _, origin, rays, _, _ in queries]
+    )
+    rays = np.concatenate([rays for _, _, rays, _, _ in queries])
+    ranges = np.array([query[3] for query in queries])[rayQueries]
+    rayTargets = np.array([pair[1] for pair, *_ in queries])[rayQueries]
+
+    # Find the distance at which each ray first hits its target, if any.
+    targetDistances = np.full(len(rays), np.inf)
+    for j in np.unique(rayTargets):
+        indices = np.flatnonzero(rayTargets == j)
+        mesh = targets[j].occupiedSpace.mesh
+        locations, hitRays, _ = mesh.ray.intersects_location(
+            ray_origins=origins[indices], ray_directions=rays[indices]
+        )
+        hitRays = indices[hitRays]
+        locations = np.reshape(locations, (-1, 3))  # empty results may be 1D
+        distances = np.linalg.norm(locations - origins[hitRays], axis=1)
+        inRange = distances <= ranges[hitRays]
+        np.minimum.at(targetDistances, hitRays[inRange], distances[inRange])
+    candidates = np.flatnonzero(np.isfinite(targetDistances))
+
+    # Reject rays blocked by an occluder before they reach their target.
+    allowed = np.array([query[4] for query in queries])
+    locations, hitRays, occIndices = occluders.intersects(
+        origins[candidates], rays[candidates]
+    )
+    hitRays = candidates[hitRays]
+    distances = np.linalg.norm(locations - origins[hitRays], axis=1)
+    blocking = allowed[rayQueries[hitRays], occIndices] & (
+        distances <= targetDistances[hitRays]
+    )
+    occluded = np.zeros(len(rays), dtype=bool)
+    occluded[hitRays[blocking]] = True
+
+    visible = np.zeros(len(queries), dtype=bool)
+    visible[rayQueries[candidates[~occluded[candidates]]]] = True
+    return visible
+
+
+def _pointQuery(
+    pair, position, orientation, visibleDistance, viewAngles, target, allowed
+):
+    target_distance = position.distanceTo(target)
+    if target_distance > visibleDistance:
+        return None
+    ray = _pointRay(position, orientation, viewAngles, target)
+    if ray is None:
+        return None
+    return (pair, position.coordinates, ray[0], target_distance, allowed)
+
+
+class _CombinedOccluders:
+    """A single ray intersection structure covering the meshes of several objects."""
+
+    def __init__(self, objects):
+        meshes = [obj.occupiedSpace.mesh for obj in objects]
+        if not meshes:
+            self.mesh = None
+            return
+        vertexCounts = [len(mesh.vertices) for mesh in meshes]
+        offsets = np.cumsum([0] + vertexCounts[:-1])
+        self.mesh = trimesh.Trimesh(
+            vertices=np.concatenate([mesh.vertices for mesh in meshes]),
+            faces=np.concatenate(
+                [mesh.faces + offset for mesh, offset in zip(meshes, offsets)]
+            ),
+            face_normals=np.concatenate([mesh.face_normals for mesh in meshes]),
+            process=False,
+        )
+        self.faceOwners = np.repeat(
+            np.arange(len(meshes)), [len(mesh.faces) for mesh in meshes]
+        )
+
+    def intersects(self, origins, directions):
+        """Find all hits of the given rays.
+
+        Returns the hit locations, the indices of the rays making the hits, and the
+        indices of the objects which were hit.
+        """
+        if self.mesh is None or len(origins) == 0:
+            return np.empty((0, 3)), np.empty(0, dtype=int), np.empty(0, dtype=int)
+        locations, rayIndices, faceIndices = self.mesh.ray.intersects_location(
+            ray_origins=origins, ray_directions=directions
+        )
+        locations = np.reshape(locations, (-1, 3))  # empty results may be 1D
+        return locations, rayIndices, self.faceOwners[faceIndices]
+
+
+def _rayCounts(position, viewAngles, rayCount, rayDensity, distanceScaling, target):
+    """Compute the number of rays to cast in each dimension.
+
+    Returns the ray counts and whether they should be scaled with altitude.
+    """
+    if rayCount is None:
+        rayCount = (
+            math.degrees(viewAngles[0]) * rayDensity,
+            math.degrees(viewAngles[1]) * rayDensity,
+        )
+
+        if distanceScaling:
+            target_distance = target.position.distanceTo(position)
+
+            rayCount = (rayCount[0] * target_distance, rayCount[1] * target_distance)
+
+        altitudeScaling = True
+    else:
+        # Do not scale ray counts with altitude or distance if explicitly given
+        altitudeScaling = False
+
+    return rayCount, altitudeScaling
+
+
+def _candidateRays(
+    position, orientation, viewAngles, rayCount, altitudeScaling, target_region
+):
+    """Compute the directions of the rays which could hit a target region.
+
+    This implements steps 2-5 of the algorithm described in `canSee`. Returns an
+    array of unit vectors in global coordinates, or None if the target cannot
+    possibly be within the viewer's view angles.
+    """
+    # Orient the object so that it has the same relative position and orientation to the
+    # origin as it did to the viewer
+    target_vertices = target_region.mesh.vertices - np.array(position.coordinates)
+
+    if orientation is not None:
+        target_vertices = orientation._inverseRotation.apply(target_vertices)
+
+    # Add additional points along each edge that could potentially have a higher altitude
+    # than the endpoints.
+    vec_1s = np.asarray(target_vertices[target_region.mesh.edges[:, 0], :])
+    vec_2s = np.asarray(target_vertices[target_region.mesh.edges[:, 1], :])
+    x1, y1, z1 = vec_1s[:, 0], vec_1s[:, 1], vec_1s[:, 2]
+    x2, y2, z2 = vec_2s[:, 0], vec_2s[:, 1], vec_2s[:, 2]
+    D = x1 * x2 + y1 * y2
+    N = (x1**2 + y1**2) * z2 - D * z1
+    M = (x2**2 + y2**2) * z1 - D * z2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_vals = N / (N + M)  # t values that can be an altitude local optimum
+
+    # Keep only points where the t_value is between 0 and 1
+    t_mask = np.logical_and(t_vals > 0, t_vals < 1)
+    interpolated_points = vec_1s[t_mask] + t_vals[t_mask][:, None] * (
+        vec_2s[t_mask] - vec_1s[t_mask]
+    )
+
+    target_vertices = np.concatenate((target_vertices, interpolated_points), axis=0)
+
+    ## Check if the object crosses the y axis ahead and/or behind the viewer
+
+    # Extract the two vectors that are part of each edge crossing the y axis.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y_cross_edges = (vec_1s[:, 0] / vec_2s[:, 0]) < 0
+    vec_1s = vec_1s[y_cross_edges]
+    vec_2s = vec_2s[y_cross_edges]
+
+    # Figure out for which t value the vectors cross the y axis
+    t = (-vec_1s[:, 0]) / (vec_2s[:, 0] - vec_1s[:, 0])
+
+    # Figure out what the y value is when the y axis is crossed
+    y_intercept_points = t * (vec_2s[:, 1] - vec_1s[:, 1]) + vec_1s[:, 1]
+
+    # If the object crosses ahead and behind the object, or through 0,
+    # we will not optimize ray casting.
+    target_crosses_ahead = np.any(y_intercept_points >= 0)
+    target_crosses_behind = np.any(y_intercept_points <= 0)
+
+    ## Compute the horizontal/vertical angle ranges which bound the object
+    ## (from the origin facing forwards)
+    spherical_angles = np.zeros((len(target_vertices[:, 0]), 2))
+
+    spherical_angles[:, 0] = np.arctan2(target_vertices[:, 1], target_vertices[:, 0])
+    spherical_angles[:, 1] = np.arcsin(
+        target_vertices[:, 2] / (np.linalg.norm(target_vertices, axis=1))
+    )
+
+    # Align azimuthal angle with y axis.
+    spherical_angles[:, 0] = spherical_angles[:, 0] - math.pi / 2
+
+    # Normalize angles between (-Pi,Pi)
+    spherical_angles[:, 0] = np.mod(spherical_angles[:, 0] + np.pi, 2 * np.pi) - np.pi
+    spherical_angles[:, 1] = np.mod(spherical_angles[:, 1] + np.pi, 2 * np.pi) - np.pi
+
+    # First we check if the vertical angles overlap with the vertical view angles.
+    # If not, then the object cannot be visible.
+    if (
+        np.min(spherical_angles[:, 1]) > viewAngles[1] / 2
+        or np.max(spherical_angles[:, 1]) < -viewAngles[1] / 2
+    ):
+        return None
+
+    ## Compute which horizontal/vertical angle ranges to cast rays in
+    if target_crosses_ahead and target_crosses_behind:
+        # No optimizations feasible here. Just send all rays.
+        h_range = (-viewAngles[0] / 2, viewAngles[0] / 2)
+        v_range = (-viewAngles[1] / 2, viewAngles[1] / 2)
+
+        view_ranges = [(h_range, v_range)]
+
+    elif target_crosses_behind:
+        # We can keep the view angles oriented around the front of the object and
+        # consider the spherical angles oriented around the back of the object.
+        # We can then check for impossible visibility/optimize which rays will be cast.
+
+        # Extract the viewAngle ranges
+        va_h_range = (-viewAngles[0] / 2, viewAngles[0] / 2)
+        va_v_range = (-viewAngles[1] / 2, viewAngles[1] / 2)
+
+        # Convert spherical angles to be centered around the back of the viewing object.
+        left_points = spherical_angles[:, 0] >= 0
+        right_points = spherical_angles[:, 0] < 0
+
+        spherical_angles[:, 0][left_points] = spherical_angles[:, 0][left_points] - np.pi
+        spherical_angles[:, 0][right_points] = (
+            spherical_angles[:, 0][right_points] + np.pi
+        )
+
+        sphere_h_range = (
+            np.min(spherical_angles[:, 0]),
+            np.max(spherical_angles[:, 0]),
+        )
+        sphere_v_range = (
+            np.min(spherical_angles[:, 1]),
+            np.max(spherical_angles[:, 1]),
+        )
+
+        # Extract the overlapping ranges in the horizontal and vertical view angles.
+        # Note that the spherical range must cross the back plane and the view angles
+        # must cross the front plane (and are centered on these points),
+        # which means we can just add up each side of the ranges and see if they add up to
+        # greater than or equal to Pi. If none do, then it's impossible for object to overlap
+        # with the viewAngle range.
+
+        # Otherwise we can extract the overlapping v_ranges and use those going forwards.
+        overlapping_v_range = (
+            np.clip(sphere_v_range[0], va_v_range[0], va_v_range[1]),
+            np.clip(sphere_v_range[1], va_v_range[0], va_v_range[1]),
+        )
+        view_ranges = []
+
+        if abs(va_h_range[0]) + abs(sphere_h_range[1]) > math.pi:
+            h_range = (va_h_range[0], -math.pi + sphere_h_range[1])
+            view_ranges.append((h_range, overlapping_v_range))
+
+        if abs(va_h_range[1]) + abs(sphere_h_range[0]) > math.pi:
+            h_range = (math.pi + sphere_h_range[0], va_h_range[1])
+            view_ranges.append((h_range, overlapping_v_range))
+
+        if len(view_ranges) == 0:
+            return None
+
+    else:
+        # We can immediately check for impossible visbility/optimize which rays
+        # will be cast.
+
+        # Check if view range and spherical angles overlap in horizontal or
+        # vertical dimensions. If not, return None
+        if (np.max(spherical_angles[:, 0]) < -viewAngles[0] / 2) or (
+            np.min(spherical_angles[:, 0]) > viewAngles[0] / 2
+        ):
+            return None
+
+        # Compute trimmed view angles
+        h_min = np.clip(
+            np.min(spherical_angles[:, 0]), -viewAngles[0] / 2, viewAngles[0] / 2
+        )
+        h_max = np.clip(
+            np.max(spherical_angles[:, 0]), -viewAngles[0] / 2, viewAngles[0] / 2
+        )
+        v_min = np.clip(
+            np.min(spherical_angles[:, 1]), -viewAngles[1] / 2, viewAngles[1] / 2
+        )
+        v_max = np.clip(
+            np.max(spherical_angles[:, 1]), -viewAngles[1] / 2, viewAngles[1] / 2
+        )
+
+        h_range = (h_min, h_max)
+        v_range = (v_min, v_max)
+
+        view_ranges = [(h_range, v_range)]
+
+    ## Generate candidate rays
+    candidate_ray_list = []
+
+    for h_range, v_range in view_ranges:
+        h_size = h_range[1] - h_range[0]
+        v_size = v_range[1] - v_range[0]
+
+        assert h_size > 0
+        assert v_size > 0
+
+        scaled_v_ray_count = math.ceil(v_size / (viewAngles[1]) * rayCount[1])
+        v_angles = np.linspace(v_range[0], v_range[1], scaled_v_ray_count)
+
+        # If altitudeScaling is true, we will scale the number of rays by the cosine of the altitude
+        # to get a uniform spread.
+        if altitudeScaling:
+            h_ray_counts = np.maximum(
+                np.ceil(np.cos(v_angles) * h_size / (viewAngles[0]) * rayCount[0]), 1
+            ).astype(int)
+            h_angles_list = [
+                np.linspace(h_range[0], h_range[1], h_ray_count)
+                for h_ray_count in h_ray_counts
+            ]
+            angle_matrices = [
+                np.column_stack(
+                    [
+                        h_angles_list[i],
+                        np.repeat([v_angles[i]], len(h_angles_list[i])),
+                    ]
+                )
+                for i in range(len(v_angles))
+            ]
+            angle_matrix = np.concatenate(angle_matrices, axis=0)
+        else:
+            scaled_h_ray_count = math.ceil(h_size / (viewAngles[0]) * rayCount[0])
+            h_angles = np.linspace(h_range[0], h_range[1], scaled_h_ray_count)
+            angle_matrix = np.column_stack(
+                [np.repeat(h_angles, len(v_angles)), np.tile(v_angles, len(h_angles))]
+            )
+
+        ray_vectors = np.zeros((len(angle_matrix[:, 0]), 3))
+
+        ray_vectors[:, 0] = -np.sin(angle_matrix[:, 0])
+        ray_vectors[:, 1] = np.cos(angle_matrix[:, 0])
+        ray_vectors[:, 2] = np.tan(
+            angle_matrix[:, 1]
+        )  # At 90 deg, np returns super large number
+
+        ray_vectors /= np.linalg.norm(ray_vectors, axis=1)[:, np.newaxis]
+        candidate_ray_list.append(ray_vectors)
+
+    ray_vectors = np.concatenate(candidate_ray_list, axis=0)
+
+    if orientation is not None:
+        ray_vectors = orientation.getRotation().apply(ray_vectors)
+
+    return ray_vectors
+
+
+def _pointRay(position, orientation, viewAngles, target_loc):
+    """Compute the single ray from a viewer to a target point.
+
+    Returns an array containing the unit vector pointing at the target, in global
+    coordinates, or None if the target is outside the viewer's view angles.
+    """
+    if orientation is not None:
+        target_loc = orientation._inverseRotation.apply([target_loc])[0]
+
+    target_vertex = target_loc - position
+    candidate_ray = target_vertex / np.linalg.norm(target_vertex)
+
+    candidate_ray_list = np.array([candidate_ray])
+
+    azimuth = (
+        np.mod(
+            np.arctan2(candidate_ray[1], candidate_ray[0]) - math.pi / 2 + np.pi,
+            2 * np.pi,
+        )
+        - np.pi
+    )
+    altitude = np.arcsin(candidate_ray[2])
+
+    # Check if this ray is within our view cone.
+    if not (-viewAngles[0] / 2 <= azimuth <= viewAngles[0] / 2) or not (
+        -viewAngles[1] / 2 <= altitude <= viewAngles[1] / 2
+    ):
+        return None
+
+    if orientation is not None:
+        candidate_ray_list = orientation.getRotation().apply(candidate_ray_list)
+
+    return candidate_ray_list
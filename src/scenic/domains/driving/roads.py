@@ -11,21 +11,28 @@ be created from a map file using :obj:`Network.fromFile`.
 
 from __future__ import annotations  # allow forward references for type annotations
 
+import collections
+import contextlib
 import enum
 import gzip
 import hashlib
 import io
 import itertools
 import math
+import mmap
+from multiprocessing import resource_tracker, shared_memory
 import numbers
+import os
 import pathlib
 import pickle
 import struct
+import sys
 import time
 from typing import FrozenSet, List, Optional, Sequence, Tuple, Union
 import weakref
 
 import attr
+import numpy as np
 import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
@@ -36,10 +43,10 @@ from scenic.core.distributions import (
 )
 import scenic.core.geometry as geometry
 from scenic.core.object_types import Point
-from scenic.core.regions import PolygonalRegion, PolylineRegion
+from scenic.core.regions import PolygonalRegion, PolylineRegion, _toPointArray
 import scenic.core.type_support as type_support
 import scenic.core.utils as utils
-from scenic.core.vectors import Orientation, Vector, VectorField
+from scenic.core.vectors import Orientation, PolygonalVectorField, Vector, VectorField
 import scenic.syntax.veneer as veneer
 from scenic.syntax.veneer import verbosePrint
 
@@ -831,6 +838,339 @@ class Signal:
         return self.type == "1000001"
 
 
+class _ColumnarPickler(pickle.Pickler):
+    """Pickler for the columnar network format (see `Network.dumpColumnar`).
+
+    Shapely geometries are replaced by indices into a table of geometries, which is
+    saved separately, and NumPy arrays are saved out-of-band.
+    """
+
+    def __init__(self, file, geometries, buffer_callback):
+        super().__init__(file, protocol=5, buffer_callback=buffer_callback)
+        self.geometries = geometries
+        self.geometryIndices = {}
+
+    def reducer_override(self, obj):
+        if not isinstance(obj, shapely.Geometry):
+            return NotImplemented
+        index = self.geometryIndices.get(id(obj))
+        if index is None:
+            index = self.geometryIndices[id(obj)] = len(self.geometries)
+            self.geometries.append(obj)
+        return _GeometryTable.lookup, (index,)
+
+
+class _GeometryTable:
+    """Table of shapely geometries stored as columns of coordinates.
+
+    Geometries of each type are stored together as a ragged array (see
+    `shapely.to_ragged_array`), and all geometries of a type are built in one call
+    when the first of them is looked up. Since a network refers to all of its
+    geometries, every type is built while the network is unpickled. Types which cannot
+    be stored this way (e.g. empty geometries) fall back to WKB.
+    """
+
+    _current = None
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.geometries = {}
+
+    @staticmethod
+    def columnsFor(geometries):
+        groups = collections.defaultdict(list)
+        for index, geometry in enumerate(geometries):
+            if geometry.is_empty or isinstance(geometry, shapely.GeometryCollection):
+                key = None
+            else:
+                key = (shapely.get_type_id(geometry), shapely.has_z(geometry))
+            groups[key].append(index)
+        columns = []
+        for key, indices in groups.items():
+            group = [geometries[index] for index in indices]
+            if key is None:
+                data = ("wkb", shapely.to_wkb(group))
+            else:
+                geomType, coords, offsets = shapely.to_ragged_array(
+                    group, include_z=key[1]
+                )
+                data = ("ragged", (geomType, coords, offsets))
+            columns.append((np.array(indices), data))
+        return columns
+
+    @classmethod
+    @contextlib.contextmanager
+    def loading(cls, table):
+        old = cls._current
+        cls._current = table
+        try:
+            yield
+        finally:
+            cls._current = old
+
+    @classmethod
+    def lookup(cls, index):
+        table = cls._current
+        geometry = table.geometries.get(index)
+        if geometry is None:
+            table._buildGroupOf(index)
+            geometry = table.geometries[index]
+        return geometry
+
+    def _buildGroupOf(self, index):
+        for i, (indices, (kind, data)) in enumerate(self.columns):
+            if index in indices:
+                break
+        else:
+            raise pickle.UnpicklingError("geometry missing from columnar network file")
+        if kind == "wkb":
+            built = shapely.from_wkb(data)
+        else:
+            built = shapely.from_ragged_array(*data)
+        self.geometries.update(zip(indices.tolist(), built))
+
+
+#: Shared memory blocks created by this process with `Network.toSharedMemory`.
+_createdBlocks = weakref.WeakValueDictionary()
+
+
+def _attachSharedMemory(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    block = shared_memory.SharedMemory(name)
+    # Older versions of Python register attached blocks with the resource tracker,
+    # which would destroy them when this process exits even though they belong to the
+    # process which created them (unless that is this process).
+    if os.name == "posix" and name not in _createdBlocks:
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+class RoadDirectionField(PolygonalVectorField):
+    """The default `roadDirection` vector field of a `Network`.
+
+    The heading at a point is that of the `Road` passing through it (as given by its
+    orientation), or 0 if there is no such road. Instead of evaluating the
+    orientations of the road, lane group, and lane in turn, the field precomputes the
+    headings of all their centerline segments, so that a lookup only needs R-tree
+    queries and a search along a single centerline. Elements with a custom
+    orientation (rather than the default one following their centerline) are not
+    precomputed, and their orientation is evaluated directly. Many points can be
+    looked up at once using `headingsAt`.
+
+    For pruning, the field is divided into polygonal cells, one for each lane group of
+    each road (plus cells for parts of roads outside their lane groups and for the area
+    outside all roads), with bounds on the headings in each cell available from
+    `cellHeadingBounds`.
+
+    .. versionadded:: 3.1
+
+    Args:
+        network: The `Network` whose roads define the field.
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.defaultHeading = 0
+        VectorField.__init__(self, "roadDirection", self.valueAt)
+
+    def valueAt(self, pos):
+        point = _toVector(pos)
+        point = shapely.Point(point.x, point.y)
+        network = self.network
+        contained = network._rtree.query(point, predicate="intersects")
+        nearby = None
+
+        # Descend from roads to lane groups to lanes, as in findPointIn.
+        element = None
+        while children := self._childrenOf(element):
+            notFound = len(children)
+            ranks = self._ranksOf(element, children)
+            rank = ranks[contained].min(initial=notFound)
+            if rank == notFound and network.tolerance > 0:
+                if nearby is None:
+                    target = point.buffer(network.tolerance)
+                    nearby = network._rtree.query(target, predicate="intersects")
+                rank = ranks[nearby].min(initial=notFound)
+            if rank == notFound:
+                break
+            element = children[rank]
+            if element.uid in self._customOrientations:
+                return element.orientation[_toVector(pos)]
+        if element is None:
+            return 0
+
+        centerline, segmentHeadings = self._segmentTable[element.uid]
+        segment, _ = centerline._nearestSegment(point)
+        return float(segmentHeadings[segment])
+
+    def headingsAt(self, points) -> np.ndarray:
+        """Get the headings of the field at many points at once.
+
+        Args:
+            points: An array of shape (N, 2) or (N, 3), or a sequence of points.
+
+        Returns:
+            An array of shape (N,) of headings, exactly matching those given by
+            evaluating the field at each point in turn (or their yaws, where an
+            element has a custom orientation which is not purely a heading).
+        """
+        points = _toPointArray(points, dim=2)
+        headings = np.zeros(len(points))
+        self._fillHeadings(None, points, np.arange(len(points)), headings)
+        return headings
+
+    def _fillHeadings(self, element, points, subset, headings):
+        # Find which child of the element (or which road, at the top level) each
+        # point lies in, then recurse; points in no child use the element's own
+        # centerline, as in LinearElement._defaultHeadingAt.
+        if element is not None and element.uid in self._customOrientations:
+            orientation = element.orientation
+            for index in subset.tolist():
+                headings[index] = orientation[Vector(*points[index])].yaw
+            return
+        children = self._childrenOf(element)
+        if children:
+            ranks = self._ranksOf(element, children)
+            indices = self.network._findPointsInIndices(points[subset], children, ranks)
+            for index in np.unique(indices).tolist():
+                within = subset[indices == index]
+                if index >= 0:
+                    self._fillHeadings(children[index], points, within, headings)
+                elif element is not None:
+                    self._fillFromCenterline(element, points, within, headings)
+        else:
+            self._fillFromCenterline(element, points, subset, headings)
+
+    def _fillFromCenterline(self, element, points, subset, headings):
+        # Equivalent to PolylineRegion.nearestSegmentTo followed by Vector.angleTo.
+        centerline, segmentHeadings = self._segmentTable[element.uid]
+        headings[subset] = segmentHeadings[centerline._nearestSegments(points[subset])]
+
+    def _childrenOf(self, element):
+        if element is None:
+            return self.network.allRoads
+        elif isinstance(element, Road):
+            return element.laneGroups
+        elif isinstance(element, LaneGroup):
+            return element.lanes
+        else:
+            return ()
+
+    def _ranksOf(self, element, children):
+        key = None if element is None else element.uid
+        ranks = self._childRanks.get(key)
+        if ranks is None:
+            ranks = self._childRanks[key] = self.network._elementRanks(children)
+        return ranks
+
+    @utils.cached_property
+    def _childRanks(self):
+        return {}
+
+    @utils.cached_property
+    def _customOrientations(self):
+        custom = set()
+        for road in self.network.allRoads:
+            groups = road.laneGroups
+            lanes = (lane for group in groups for lane in group.lanes)
+            for element in itertools.chain((road,), groups, lanes):
+                orientation = element.orientation
+                if not (
+                    isinstance(orientation, VectorField)
+                    and getattr(orientation, "value", None) == element._defaultHeadingAt
+                ):
+                    custom.add(element.uid)
+        return custom
+
+    @utils.cached_property
+    def _segmentTable(self):
+        table = {}
+        for road in self.network.allRoads:
+            groups = road.laneGroups
+            lanes = (lane for group in groups for lane in group.lanes)
+            for element in itertools.chain((road,), groups, lanes):
+                centerline = element.centerline
+                segmentHeadings = [
+                    geometry.normalizeAngle(
+                        math.atan2(end[1] - start[1], end[0] - start[0]) - (math.pi / 2)
+                    )
+                    for start, end in centerline.segments
+                ]
+                table[element.uid] = (centerline, np.array(segmentHeadings))
+        return table
+
+    @utils.cached_property
+    def _cellBounds(self):
+        tolerance = self.network.tolerance
+
+        def cellOf(element):
+            polygon = element.polygons
+            return polygon.buffer(tolerance) if tolerance > 0 else polygon
+
+        def boundsOf(*elements):
+            if any(element.uid in self._customOrientations for element in elements):
+                return None, None
+            headings = np.concatenate(
+                [self._segmentTable[element.uid][1] for element in elements]
+            )
+            return _headingBounds(headings)
+
+        # Points are assigned to the first road within tolerance, then to the first of
+        # its lane groups within tolerance (if any), so these cells cover every point
+        # lying on some road, with bounds valid regardless of any overlaps.
+        cells = []
+        roadCells = []
+        for road in self.network.allRoads:
+            roadCell = cellOf(road)
+            roadCells.append(roadCell)
+            groupCells = []
+            for group in road.laneGroups:
+                groupCell = cellOf(group)
+                groupCells.append(groupCell)
+                cell = roadCell & groupCell
+                if not cell.is_empty:
+                    if road.uid in self._customOrientations:
+                        cells.append((cell, None, None))
+                    else:
+                        cells.append((cell, *boundsOf(group, *group.lanes)))
+            rest = roadCell.difference(shapely.union_all(groupCells))
+            if not rest.is_empty:
+                cells.append((rest, *boundsOf(road)))
+
+        # Points outside all roads have heading 0.
+        covered = shapely.union_all(roadCells)
+        minx, miny, maxx, maxy = covered.bounds
+        margin = 10 * max(maxx - minx, maxy - miny, 1)
+        outside = shapely.box(minx - margin, miny - margin, maxx + margin, maxy + margin)
+        cells.append((outside.difference(covered), 0, 0))
+        return tuple(cells)
+
+    @property
+    def cells(self):
+        return tuple(
+            (cell, lower if lower == upper else None)
+            for cell, lower, upper in self._cellBounds
+        )
+
+    def cellHeadingBounds(self):
+        return self._cellBounds
+
+
+def _headingBounds(headings, slack=1e-9):
+    """Find the smallest arc of headings containing all the given ones.
+
+    Returns a pair (lower, upper) with upper >= lower, padded by **slack** to allow for
+    rounding error.
+    """
+    angles = np.sort(np.mod(headings, math.tau))
+    gaps = np.diff(angles, append=angles[0] + math.tau)
+    widest = gaps.argmax()
+    lower = geometry.normalizeAngle(float(angles[(widest + 1) % len(angles)]))
+    width = math.tau - float(gaps[widest])
+    return lower - slack, lower + width + slack
+
+
 @attr.s(auto_attribs=True, kw_only=True, repr=False, eq=False)
 class Network:
     """Network()
@@ -891,6 +1231,9 @@ class Network:
     #: Traffic flow vector field aggregated over all roads (0 elsewhere).
     roadDirection: VectorField = None
 
+    # memory the network was loaded from, if its arrays are views of it
+    _sourceMemory = None
+
     def __attrs_post_init__(self):
         proxy = weakref.proxy(self)
         for uid, elem in self.elements.items():
@@ -950,24 +1293,16 @@ class Network:
             self.curbRegion = PolylineRegion.unionAll(edges)
 
         if self.roadDirection is None:
-            # TODO replace with a PolygonalVectorField for better pruning
-            self.roadDirection = VectorField("roadDirection", self._defaultRoadDirection)
+            self.roadDirection = RoadDirectionField(self)
 
         # Build R-tree for faster lookup of roads, etc. at given points
         self._uidForIndex = tuple(self.elements)
         self._rtree = shapely.STRtree([elem.polygons for elem in self.elements.values()])
 
-    def _defaultRoadDirection(self, point):
-        """Default value for the `roadDirection` vector field.
-
-        :meta private:
-        """
-        point = _toVector(point)
-        road = self.roadAt(point)
-        return 0 if road is None else road.orientation[point]
-
     #: File extension for cached versions of processed networks.
     pickledExt = ".snet"
+    #: File extension for cached networks in the memory-mappable columnar format.
+    columnarExt = ".snetc"
 
     @classmethod
     def _currentFormatVersion(cls):
@@ -981,7 +1316,7 @@ class Network:
 
         :meta private:
         """
-        return 33
+        return 35
 
     class DigestMismatchError(Exception):
         """Exception raised when loading a cached map not matching the original file."""
@@ -989,7 +1324,14 @@ class Network:
         pass
 
     @classmethod
-    def fromFile(cls, path, useCache: bool = True, writeCache: bool = True, **kwargs):
+    def fromFile(
+        cls,
+        path,
+        useCache: bool = True,
+        writeCache: bool = True,
+        columnarCache: bool = False,
+        **kwargs,
+    ):
         """Create a `Network` from a map file.
 
         This function calls an appropriate parsing routine based on the extension of the
@@ -1010,8 +1352,14 @@ class Network:
                 changes, the cached version will still not be used).
             writeCache: Whether to save a cached version of the processed map
                 after parsing has finished (default true).
+            columnarCache: Whether the cached version should use the memory-mappable
+                columnar format (see `dumpColumnar`) instead of a pickle (default
+                false).
             kwargs: Additional keyword arguments specific to particular map formats.
 
+        .. versionchanged:: 3.1
+            Added the **columnarCache** option.
+
         Raises:
             FileNotFoundError: no readable map was found at the given path.
             ValueError: the given map is of an unknown format.
@@ -1025,6 +1373,7 @@ class Network:
             # maps should take precedence, but if the pickled version exists and matches
             # the original, we'll use it.
             cls.pickledExt: cls.fromPickle,
+            cls.columnarExt: cls.fromColumnar,
         }
 
         if not ext:  # no extension was given; search through possible formats
@@ -1043,6 +1392,8 @@ class Network:
         # If we don't have an underlying map file, return the pickled version directly
         if ext == cls.pickledExt:
             return cls.fromPickle(path)
+        if ext == cls.columnarExt:
+            return cls.fromColumnar(path)
 
         # Otherwise, hash the underlying file to detect when the pickle is outdated
         with open(path, "rb") as f:
@@ -1050,10 +1401,14 @@ class Network:
         digest = hashlib.blake2b(data).digest()
 
         # By default, use the pickled version if it exists and is not outdated
-        pickledPath = path.with_suffix(cls.pickledExt)
+        if columnarCache:
+            cacheExt, loader, dumper = cls.columnarExt, cls.fromColumnar, cls.dumpColumnar
+        else:
+            cacheExt, loader, dumper = cls.pickledExt, cls.fromPickle, cls.dumpPickle
+        pickledPath = path.with_suffix(cacheExt)
         if useCache and pickledPath.exists():
             try:
-                return cls.fromPickle(pickledPath, originalDigest=digest)
+                return loader(pickledPath, originalDigest=digest)
             except pickle.UnpicklingError:
                 verbosePrint("Unable to load cached network (old format or corrupted).")
             except cls.DigestMismatchError:
@@ -1062,8 +1417,8 @@ class Network:
         # Not using the pickled version; parse the original file based on its extension
         network = handlers[ext](path, **kwargs)
         if writeCache:
-            verbosePrint(f"Caching road network in {cls.pickledExt} file.")
-            network.dumpPickle(path.with_suffix(cls.pickledExt), digest)
+            verbosePrint(f"Caching road network in {cacheExt} file.")
+            dumper(network, pickledPath, digest)
         return network
 
     @classmethod
@@ -1075,6 +1430,8 @@ class Network:
         fill_gaps: bool = True,
         fill_intersections: bool = True,
         elide_short_roads: bool = False,
+        processes: int = 1,
+        geometry_cache=None,
     ):
         """Create a `Network` from an OpenDRIVE file.
 
@@ -1088,6 +1445,15 @@ class Network:
                 intersections.
             elide_short_roads: Whether to attempt to fix geometry artifacts by
                 eliding roads with length less than **tolerance**.
+            processes: Number of worker processes to use when computing the geometry
+                of individual roads (default 1, i.e. no worker processes).
+            geometry_cache: Optional path to a directory in which to cache the
+                geometry of individual roads and intersections. When the map is
+                edited, only the geometry of roads whose XML has changed (and the
+                intersections containing them) is recomputed.
+
+        .. versionchanged:: 3.1
+            Added the **processes** and **geometry_cache** options.
         """
         import scenic.formats.opendrive.xodr_parser as xodr_parser
 
@@ -1096,11 +1462,20 @@ class Network:
             fill_intersections=fill_intersections,
             elide_short_roads=elide_short_roads,
         )
+        cache = None
+        if geometry_cache is not None:
+            cache = xodr_parser.GeometryCache(geometry_cache)
         startTime = time.time()
         verbosePrint("Parsing OpenDRIVE file...")
         road_map.parse(path)
         verbosePrint("Computing road geometry... (this may take a while)")
-        road_map.calculate_geometry(ref_points, calc_gap=fill_gaps, calc_intersect=True)
+        road_map.calculate_geometry(
+            ref_points,
+            calc_gap=fill_gaps,
+            calc_intersect=True,
+            processes=processes,
+            cache=cache,
+        )
         network = road_map.toScenicNetwork()
         totalTime = time.time() - startTime
         verbosePrint(f"Finished loading OpenDRIVE map in {totalTime:.2f} seconds.")
@@ -1143,6 +1518,11 @@ class Network:
         verbosePrint(f"Loaded cached network in {totalTime:.2f} seconds.")
         return network
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_sourceMemory", None)  # copies do not share our memory
+        return state
+
     def __setstate__(self, state):
         # Restore our attributes (default behavior when __setstate__ isn't defined)
         self.__dict__.update(state)
@@ -1174,6 +1554,197 @@ class Network:
             with gzip.open(f, "wb") as gf:
                 gf.write(data)
 
+    @classmethod
+    def fromColumnar(cls, path, originalDigest=None):
+        """Load a network saved in the columnar format by `dumpColumnar`.
+
+        The file is memory-mapped rather than read, and the geometry of the network is
+        rebuilt from the mapped coordinate arrays in bulk, one geometry type at a time.
+        NumPy arrays in the network are read-only views of the mapped file, so
+        processes loading the same file share their memory. The file stays mapped
+        while the network (or any array taken from it) is alive, and is unmapped once
+        they have been collected.
+
+        .. versionadded:: 3.1
+        """
+        startTime = time.time()
+        verbosePrint("Loading cached version of road network...")
+
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise pickle.UnpicklingError(
+                    f"{cls.columnarExt} file is corrupted"
+                ) from e
+        network = cls._fromColumnarBuffer(
+            memoryview(mapped), originalDigest, f"{cls.columnarExt} file"
+        )
+        network._sourceMemory = mapped
+
+        totalTime = time.time() - startTime
+        verbosePrint(f"Loaded cached network in {totalTime:.2f} seconds.")
+        return network
+
+    @classmethod
+    def _fromColumnarBuffer(cls, view, originalDigest, source):
+        header = struct.Struct("<I64sQQQ")
+        if len(view) < header.size:
+            raise pickle.UnpicklingError(f"{source} is corrupted")
+        version, digest, tableLength, dataLength, numBuffers = header.unpack_from(view)
+        if version != cls._currentFormatVersion():
+            raise pickle.UnpicklingError(
+                f"{source} is too old; regenerate it from the original map"
+            )
+        if originalDigest and originalDigest != digest:
+            raise cls.DigestMismatchError(
+                f"{source} does not correspond to the original map; regenerate it"
+            )
+        try:
+            position = header.size
+            extents = struct.unpack_from(f"<{2 * numBuffers}Q", view, position)
+            position += 16 * numBuffers
+            buffers = [
+                view[offset : offset + length]
+                for offset, length in zip(extents[::2], extents[1::2])
+            ]
+            tableData = view[position : position + tableLength]
+            data = view[position + tableLength : position + tableLength + dataLength]
+            numTableBuffers, table = pickle.loads(tableData)
+            table = _GeometryTable(pickle.loads(table, buffers=buffers[:numTableBuffers]))
+            with _GeometryTable.loading(table):
+                return pickle.loads(data, buffers=buffers[numTableBuffers:])
+        except pickle.UnpicklingError:
+            raise
+        except Exception as e:
+            raise pickle.UnpicklingError("unpickling failed") from e
+
+    def dumpColumnar(self, path, digest):
+        """Save this network in the memory-mappable columnar format.
+
+        Instead of pickling each shapely geometry separately, the coordinates of all
+        geometries of each type are stored in contiguous arrays; these, together with
+        any other NumPy arrays in the network, are written uncompressed and aligned,
+        so that `fromColumnar` can memory-map them.
+
+        .. versionadded:: 3.1
+        """
+        path = pathlib.Path(path)
+        if not path.suffix:
+            path = path.with_suffix(self.columnarExt)
+        size, chunks = self._columnarChunks(digest)
+        with open(path, "wb") as f:
+            for offset, chunk in chunks:
+                f.write(bytes(offset - f.tell()))
+                f.write(chunk)
+
+    def _columnarChunks(self, digest):
+        """Serialize this network in the columnar format.
+
+        Returns the total size of the serialized network and a list of its pieces,
+        as pairs of offsets and bytes-like objects.
+        """
+        geometries = []
+        dataBuffers = []
+        stream = io.BytesIO()
+        _ColumnarPickler(stream, geometries, dataBuffers.append).dump(self)
+        data = stream.getvalue()
+        tableBuffers = []
+        table = pickle.dumps(
+            _GeometryTable.columnsFor(geometries),
+            protocol=5,
+            buffer_callback=tableBuffers.append,
+        )
+        table = pickle.dumps((len(tableBuffers), table))
+        buffers = [buffer.raw() for buffer in tableBuffers + dataBuffers]
+
+        header = struct.Struct("<I64sQQQ")
+        position = header.size + 16 * len(buffers) + len(table) + len(data)
+        extents = []
+        for buffer in buffers:
+            position += -position % 64  # align buffers for efficient access
+            extents.extend((position, buffer.nbytes))
+            position += buffer.nbytes
+        prefix = b"".join(
+            (
+                header.pack(
+                    self._currentFormatVersion(),
+                    digest,
+                    len(table),
+                    len(data),
+                    len(buffers),
+                ),
+                struct.pack(f"<{len(extents)}Q", *extents),
+                table,
+                data,
+            )
+        )
+        return position, [(0, prefix)] + list(zip(extents[::2], buffers))
+
+    def toSharedMemory(self, name=None) -> shared_memory.SharedMemory:
+        """Publish this network in a block of shared memory.
+
+        The network is stored in the columnar format used by `dumpColumnar`, so that
+        other processes on the same host can load it with `fromSharedMemory` without
+        parsing the original map or reading a cached file. This is useful when scene
+        generation is fanned out over many worker processes: the parent process loads
+        the network once and passes the name of the block to the workers.
+
+        The calling process owns the block: it should call its
+        :meth:`~multiprocessing.shared_memory.SharedMemory.close` and
+        :meth:`~multiprocessing.shared_memory.SharedMemory.unlink` methods once no
+        more workers need to load the network.
+
+        .. versionadded:: 3.1
+
+        Args:
+            name: Name to use for the block (default: a random unique name).
+
+        Returns:
+            The `multiprocessing.shared_memory.SharedMemory` block holding the network.
+        """
+        size, chunks = self._columnarChunks(bytes(64))
+        block = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        try:
+            for offset, chunk in chunks:
+                chunk = memoryview(chunk).cast("B")
+                block.buf[offset : offset + len(chunk)] = chunk
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+        _createdBlocks[block.name] = block
+        return block
+
+    @classmethod
+    def fromSharedMemory(cls, name) -> Network:
+        """Load a network published by `toSharedMemory` in another process.
+
+        The block is attached read-only, and the network is rebuilt from it as in
+        `fromColumnar`; the block itself is not modified or destroyed, and may be
+        loaded by any number of processes. This process stays attached to the block
+        until the network has been collected.
+
+        .. versionadded:: 3.1
+
+        Args:
+            name: The name of the shared memory block (or the block itself).
+        """
+        if isinstance(name, shared_memory.SharedMemory):
+            name = name.name
+        startTime = time.time()
+        verbosePrint("Loading road network from shared memory...")
+
+        block = _attachSharedMemory(name)
+        network = cls._fromColumnarBuffer(block.buf.toreadonly(), None, "shared network")
+        # Arrays in the network are views of the block, so it stays attached as long as
+        # the network is alive, and is closed when the network is collected.
+        network._sourceMemory = block
+
+        totalTime = time.time() - startTime
+        verbosePrint(f"Loaded shared network in {totalTime:.2f} seconds.")
+        return network
+
     @distributionMethod
     def findPointIn(
         self, point: Vectorlike, elems: Sequence[NetworkElement], reject: Union[bool, str]
@@ -1214,6 +1785,75 @@ class Network:
             raise RejectionException(message)
         return None
 
+    def findPointsIn(
+        self, points, elems: Sequence[NetworkElement], reject: Union[bool, str]
+    ) -> List[Union[NetworkElement, None]]:
+        """Find the first of the given elements containing each of several points.
+
+        This is a vectorized version of `findPointIn`, giving the same results as
+        calling it on each point in turn, but querying the R-tree for all points at
+        once. If **reject** is true and any point lies in none of the elements, the
+        current sample is rejected.
+
+        .. versionadded:: 3.1
+
+        Args:
+            points: An array of shape (N, 2) or (N, 3), or a sequence of points.
+            elems: The elements to search, in order of priority.
+            reject: Whether to reject the sample if some point has no matching element
+                (or a string to use as the rejection message).
+
+        Returns:
+            A list of the matching elements, with `None` for points lying in none of
+            them.
+        """
+        indices = self._findPointsInIndices(points, elems)
+        if reject and (indices < 0).any():
+            if isinstance(reject, str):
+                message = reject
+            else:
+                message = "requested element does not exist"
+            raise RejectionException(message)
+        return [None if index < 0 else elems[index] for index in indices.tolist()]
+
+    def _findPointsInIndices(self, points, elems, ranks=None):
+        points = _toPointArray(points, dim=2)
+        if ranks is None:
+            ranks = self._elementRanks(elems)
+        notFound = len(elems)
+
+        geoms = shapely.points(points[:, :2])
+        best = np.full(len(points), notFound)
+
+        def findElementsWithin(subset, targets):
+            inputs, found = self._rtree.query(targets, predicate="intersects")
+            np.minimum.at(best, subset[inputs], ranks[found])
+
+        # First pass: check for elements containing the points.
+        findElementsWithin(np.arange(len(points)), geoms)
+
+        # Second pass: check for elements within tolerance of the unmatched points.
+        unmatched = np.flatnonzero(best == notFound)
+        if self.tolerance > 0 and len(unmatched) > 0:
+            targets = shapely.buffer(geoms[unmatched], self.tolerance)
+            findElementsWithin(unmatched, targets)
+
+        return np.where(best == notFound, -1, best)
+
+    def _elementRanks(self, elems):
+        """Rank each element of the R-tree by its priority in elems."""
+        notFound = len(elems)
+        ranks = np.full(len(self._uidForIndex), notFound)
+        for rank in reversed(range(len(elems))):
+            index = self._indexForUid.get(elems[rank].uid)
+            if index is not None:
+                ranks[index] = rank
+        return ranks
+
+    @utils.cached_property
+    def _indexForUid(self):
+        return {uid: index for index, uid in enumerate(self._uidForIndex)}
+
     def _findPointInAll(self, point, things, key=lambda e: e):
         point = _toVector(point)
         found = []
@@ -1280,6 +1920,49 @@ class Network:
         """Get the `Intersection` at a given point."""
         return self.findPointIn(point, self.intersections, reject)
 
+    def elementsAt(self, points, reject=False) -> List[Union[NetworkElement, None]]:
+        """Get the highest-level `NetworkElement` at each of several points.
+
+        Vectorized version of `elementAt`; see `findPointsIn` for details.
+
+        .. versionadded:: 3.1
+        """
+        points = _toPointArray(points, dim=2)
+        elements = self.intersectionsAt(points)
+        missing = [i for i, elem in enumerate(elements) if elem is None]
+        if missing:
+            points = points[missing]
+            for i, road in zip(missing, self.roadsAt(points, reject=reject)):
+                elements[i] = road
+        return elements
+
+    def roadsAt(self, points, reject=False) -> List[Union[Road, None]]:
+        """Get the `Road` passing through each of several points.
+
+        Vectorized version of `roadAt`; see `findPointsIn` for details.
+
+        .. versionadded:: 3.1
+        """
+        return self.findPointsIn(points, self.allRoads, reject)
+
+    def lanesAt(self, points, reject=False) -> List[Union[Lane, None]]:
+        """Get the `Lane` passing through each of several points.
+
+        Vectorized version of `laneAt`; see `findPointsIn` for details.
+
+        .. versionadded:: 3.1
+        """
+        return self.findPointsIn(points, self.lanes, reject)
+
+    def intersectionsAt(self, points, reject=False) -> List[Union[Intersection, None]]:
+        """Get the `Intersection` at each of several points.
+
+        Vectorized version of `intersectionAt`; see `findPointsIn` for details.
+
+        .. versionadded:: 3.1
+        """
+        return self.findPointsIn(points, self.intersections, reject)
+
     @distributionMethod
     def nominalDirectionsAt(self, point: Vectorlike, reject=False) -> Tuple[Orientation]:
         """Get the nominal traffic direction(s) at a given point, if any.
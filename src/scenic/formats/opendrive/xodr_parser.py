@@ -2,8 +2,15 @@
 
 import abc
 from collections import defaultdict
+import concurrent.futures
+import gzip
+import hashlib
 import itertools
 import math
+import os
+import pathlib
+import pickle
+import tempfile
 import warnings
 import xml.etree.ElementTree as ET
 
@@ -38,6 +45,56 @@ def buffer_union(polys, tolerance=0.01):
     return polygonUnion(polys, buf=tolerance, tolerance=tolerance)
 
 
+class GeometryCache:
+    """Directory caching the computed geometry of individual roads and junctions.
+
+    Entries are keyed by a hash of everything the geometry depends on (e.g. the XML
+    of a road and the parameters of the computation), so that when a map is edited
+    only the geometry of the changed roads (and the junctions containing them) needs
+    to be recomputed. Unreadable entries are ignored, and entries are written
+    atomically so that several processes can safely share a cache.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(*parts):
+        """Compute a cache key from strings, bytes, or other values with stable reprs."""
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(repr(roadDomain.Network._currentFormatVersion()).encode())
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = repr(part).encode()
+            hasher.update(len(part).to_bytes(8, "little"))
+            hasher.update(part)
+        return hasher.hexdigest()
+
+    def get(self, key):
+        try:
+            with gzip.open(self.path / f"{key}.pickle.gz", "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def put(self, key, value):
+        fd, temp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, gzip.open(f, "wb") as gf:
+                pickle.dump(value, gf)
+            os.replace(temp, self.path / f"{key}.pickle.gz")
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+
+def _calculate_road_geometry(road, num, options):
+    """Compute the geometry of a road in a worker process, returning its new state."""
+    road.calculate_geometry(num, **options)
+    return road.geometry_state()
+
+
 class Poly3:
     """Cubic polynomial."""
 
@@ -212,6 +269,24 @@ class Line(Curve):
         return self.rel_to_abs((s, 0, s))
 
 
+def _pack_points(points):
+    # Only pack lists of points whose coordinates are all NumPy floats, so that
+    # unpacking restores exactly the same values.
+    if (
+        points
+        and all(type(point) is list and len(point) == 2 for point in points)
+        and all(type(coord) is np.float64 for point in points for coord in point)
+    ):
+        return np.array(points)
+    return points
+
+
+def _unpack_points(points):
+    if isinstance(points, np.ndarray):
+        return [list(point) for point in points]
+    return points
+
+
 class Lane:
     def __init__(self, id_, type_, pred=None, succ=None):
         self.id_ = id_
@@ -224,6 +299,21 @@ class Lane:
         self.centerline = []
         self.parent_lane_poly = None
 
+    # Lists of points to pack into arrays when pickling (to speed up transferring
+    # geometry from worker processes and storing it in a GeometryCache).
+    _point_lists = ("left_bounds", "right_bounds", "centerline")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._point_lists:
+            state[attr] = _pack_points(state[attr])
+        return state
+
+    def __setstate__(self, state):
+        for attr in self._point_lists:
+            state[attr] = _unpack_points(state[attr])
+        self.__dict__.update(state)
+
     def width_at(self, s):
         # S here is relative to start of LaneSection this lane is in.
         ind = 0
@@ -349,6 +439,36 @@ class Road:
 
         self.remappedStartLanes = None  # hack for handling spurious initial lane sections
 
+        # Digest of the XML defining this road, if known (used for caching geometry).
+        self.source_digest = None
+        # Key of this road's geometry in a GeometryCache, if one is used.
+        self.geometry_key = None
+
+    #: Attributes set or modified by calculate_geometry (including the lane sections,
+    #: whose lanes get their boundaries filled in).
+    geometry_attributes = (
+        "lane_secs",
+        "ref_line_points",
+        "sec_points",
+        "sec_polys",
+        "sec_lane_polys",
+        "lane_polys",
+        "drivable_region",
+        "sidewalk_region",
+        "shoulder_region",
+        "start_bounds_left",
+        "start_bounds_right",
+        "end_bounds_left",
+        "end_bounds_right",
+    )
+
+    def geometry_state(self):
+        return {attr: getattr(self, attr) for attr in self.geometry_attributes}
+
+    def restore_geometry(self, state):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def get_ref_line_offset(self, s):
         if not self.offset:
             return 0
@@ -1159,19 +1279,54 @@ class RoadMap:
         self.shoulder_lane_types = shoulder_lane_types
         self.elide_short_roads = elide_short_roads
 
-    def calculate_geometry(self, num, calc_gap=False, calc_intersect=True):
+    def calculate_geometry(
+        self, num, calc_gap=False, calc_intersect=True, processes=1, cache=None
+    ):
         # If calc_gap=True, fills in gaps between connected roads.
         # If calc_intersect=True, calculates intersection regions.
         # These are fairly expensive.
+        # The geometry of individual roads can be computed using a pool of several
+        # processes, and looked up in/saved to a GeometryCache if one is given.
+        options = dict(
+            calc_gap=calc_gap,
+            tolerance=self.tolerance,
+            drivable_lane_types=self.drivable_lane_types,
+            sidewalk_lane_types=self.sidewalk_lane_types,
+            shoulder_lane_types=self.shoulder_lane_types,
+        )
+        pending = []
+        for road in self.roads.values():
+            if cache is not None and road.source_digest is not None:
+                road.geometry_key = cache.key_for(
+                    "road", road.source_digest, num, sorted(options.items())
+                )
+                state = cache.get(road.geometry_key)
+                if state is not None:
+                    road.restore_geometry(state)
+                    continue
+            pending.append(road)
+
+        if processes > 1 and len(pending) > 1:
+            with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+                chunksize = max(1, len(pending) // (4 * processes))
+                states = executor.map(
+                    _calculate_road_geometry,
+                    pending,
+                    itertools.repeat(num),
+                    itertools.repeat(options),
+                    chunksize=chunksize,
+                )
+                for road, state in zip(pending, states):
+                    road.restore_geometry(state)
+        else:
+            for road in pending:
+                road.calculate_geometry(num, **options)
+        if cache is not None:
+            for road in pending:
+                if road.geometry_key is not None:
+                    cache.put(road.geometry_key, road.geometry_state())
+
         for road in self.roads.values():
-            road.calculate_geometry(
-                num,
-                calc_gap=calc_gap,
-                tolerance=self.tolerance,
-                drivable_lane_types=self.drivable_lane_types,
-                sidewalk_lane_types=self.sidewalk_lane_types,
-                shoulder_lane_types=self.shoulder_lane_types,
-            )
             self.sec_lane_polys.extend(road.sec_lane_polys)
             self.lane_polys.extend(road.lane_polys)
 
@@ -1247,16 +1402,29 @@ class RoadMap:
         self.shoulder_region = buffer_union(shoulder_polys, tolerance=self.tolerance)
 
         if calc_intersect:
-            self.calculate_intersections()
+            self.calculate_intersections(cache=cache)
 
-    def calculate_intersections(self):
+    def calculate_intersections(self, cache=None):
         intersect_polys = []
         for junc in self.junctions.values():
-            junc_polys = [self.roads[i].drivable_region for i in junc.paths]
-            assert junc_polys, junc
-            union = buffer_union(junc_polys, tolerance=self.tolerance)
-            if self.fill_intersections:
-                union = removeHoles(union)
+            paths = [self.roads[i] for i in junc.paths]
+            assert paths, junc
+            key = None
+            if cache is not None and all(road.geometry_key for road in paths):
+                key = cache.key_for(
+                    "junction",
+                    [road.geometry_key for road in paths],
+                    self.tolerance,
+                    self.fill_intersections,
+                )
+                union = cache.get(key)
+            if key is None or union is None:
+                junc_polys = [road.drivable_region for road in paths]
+                union = buffer_union(junc_polys, tolerance=self.tolerance)
+                if self.fill_intersections:
+                    union = removeHoles(union)
+                if key is not None:
+                    cache.put(key, union)
             assert union.is_valid
             junc.poly = union
             intersect_polys.append(union)
@@ -1394,6 +1562,7 @@ class RoadMap:
             road = Road(
                 r.get("name"), int(r.get("id")), float(r.get("length")), r.get("junction")
             )
+            road.source_digest = hashlib.blake2b(ET.tostring(r)).digest()
             link = r.find("link")
             if link is not None:
                 pred_elem = link.find("predecessor")
@@ -7,20 +7,20 @@ import os
 import pathlib
 import time
 
-from PIL import Image
 import numpy as np
+from scipy.spatial.transform import Rotation
+import shapely
 
 import scenic.core.errors as errors  # isort: skip
 
+# N.B. pygame and PIL are only imported when rendering, since they are slow to load
 if errors.verbosityLevel == 0:  # suppress pygame advertisement at zero verbosity
     os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
-import pygame
-import shapely
 
 from scenic.core.geometry import allChains, findMinMax
 from scenic.core.regions import toPolygon
 from scenic.core.simulators import SimulationCreationError
-from scenic.core.vectors import Orientation, Vector
+from scenic.core.vectors import Orientation, Vector, globalOrientation
 from scenic.domains.driving.controllers import (
     PIDLateralController,
     PIDLongitudinalController,
@@ -74,13 +74,27 @@ class NewtonianSimulator(DrivingSimulator):
 
 
 class NewtonianSimulation(DrivingSimulation):
-    """Implementation of `Simulation` for the Newtonian simulator."""
+    """Implementation of `Simulation` for the Newtonian simulator.
+
+    The physics of all objects are integrated together in each time step, using NumPy
+    arrays holding the positions, velocities, headings and controls of the objects.
+    The new state is only written back to the Scenic objects once, when the simulation
+    calls `getProperties` at the end of the step.
+
+    .. versionchanged:: 3.1
+
+        The physics update is vectorized over all objects.
+    """
 
     def __init__(self, scene, network, render, export_gif, timestep, **kwargs):
         self.export_gif = export_gif
         self.render = render
         self.network = network
         self.frames = []
+        self._state = None  # state computed by the last time step (see step)
+        self._stateIndices = {}
+        self._actors = []  # indices of objects with controls (throttle, etc.)
+        self._numClassified = 0
 
         if timestep is None:
             timestep = 0.1
@@ -95,6 +109,8 @@ class NewtonianSimulation(DrivingSimulation):
             min_x, max_x = findMinMax(obj.x for obj in self.objects)
             min_y, max_y = findMinMax(obj.y for obj in self.objects)
 
+            import pygame
+
             pygame.init()
             pygame.font.init()
             self.screen = pygame.display.set_mode(
@@ -164,43 +180,116 @@ class NewtonianSimulation(DrivingSimulation):
         return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
 
     def step(self):
-        for obj in self.objects:
-            current_speed = obj.velocity.norm()
-            if hasattr(obj, "hand_brake"):
-                forward = obj.velocity.dot(Vector(0, 1).rotatedBy(obj.heading)) >= 0
-                signed_speed = current_speed if forward else -current_speed
-                if obj.hand_brake or obj.brake > 0:
-                    braking = MAX_BRAKING * max(obj.hand_brake, obj.brake)
-                    acceleration = braking * self.timestep
-                    if acceleration >= current_speed:
-                        signed_speed = 0
-                    elif forward:
-                        signed_speed -= acceleration
-                    else:
-                        signed_speed += acceleration
-                else:
-                    acceleration = obj.throttle * MAX_ACCELERATION
-                    if obj.reverse:
-                        acceleration *= -1
-                    signed_speed += acceleration * self.timestep
-
-                obj.velocity = Vector(0, signed_speed).rotatedBy(obj.heading)
-                if obj.steer:
-                    turning_radius = obj.length / sin(obj.steer * math.pi / 2)
-                    obj.angularSpeed = -signed_speed / turning_radius
-                else:
-                    obj.angularSpeed = 0
-                obj.speed = abs(signed_speed)
+        objects = self.objects
+        dt = self.timestep
+
+        # Gather the current state of all objects, which may have been changed by
+        # actions since the last time step.
+        position = np.array([obj.position.coordinates for obj in objects], dtype=float)
+        velocity = np.array([obj.velocity.coordinates for obj in objects], dtype=float)
+        heading = np.array([obj.heading for obj in objects], dtype=float)
+        angularSpeed = np.array([obj.angularSpeed for obj in objects], dtype=float)
+        speed = np.linalg.norm(velocity, axis=1)
+
+        # Apply the controls of actors (objects with throttle, steering, etc.)
+        for i in range(self._numClassified, len(objects)):
+            if hasattr(objects[i], "hand_brake"):
+                self._actors.append(i)
+        self._numClassified = len(objects)
+        if self._actors:
+            self._applyControls(self._actors, velocity, heading, angularSpeed, speed)
+
+        # Integrate
+        position += velocity * dt
+        heading += angularSpeed * dt
+
+        self._state = (
+            position.tolist(),
+            velocity.tolist(),
+            speed.tolist(),
+            angularSpeed.tolist(),
+            self._localYaws(objects, heading),
+        )
+        self._stateIndices = {obj: i for i, obj in enumerate(objects)}
+
+    def _applyControls(self, actors, velocity, heading, angularSpeed, speed):
+        dt = self.timestep
+        controls = np.array(
+            [
+                (
+                    obj.throttle,
+                    obj.steer,
+                    obj.brake,
+                    obj.hand_brake,
+                    obj.reverse,
+                    obj.length,
+                )
+                for obj in (self.objects[i] for i in actors)
+            ],
+            dtype=float,
+        )
+        throttle, steer, brake, handBrake, reverse, length = controls.T
+        sin, cos = np.sin(heading[actors]), np.cos(heading[actors])
+        vel = velocity[actors]
+        currentSpeed = speed[actors]
+
+        # Speed along the heading, negative if moving backward
+        forward = vel[:, 0] * -sin + vel[:, 1] * cos >= 0
+        signedSpeed = np.where(forward, currentSpeed, -currentSpeed)
+
+        # Braking slows toward zero; otherwise accelerate according to the throttle
+        braking = (handBrake != 0) | (brake > 0)
+        deceleration = MAX_BRAKING * np.maximum(handBrake, brake) * dt
+        braked = np.where(
+            deceleration >= currentSpeed,
+            0.0,
+            np.where(forward, signedSpeed - deceleration, signedSpeed + deceleration),
+        )
+        acceleration = np.where(reverse != 0, -throttle, throttle) * MAX_ACCELERATION
+        signedSpeed = np.where(braking, braked, signedSpeed + acceleration * dt)
+
+        velocity[actors] = np.column_stack(
+            (-sin * signedSpeed, cos * signedSpeed, np.zeros(len(actors)))
+        )
+        with np.errstate(divide="ignore"):
+            turningRadius = length / np.sin(steer * math.pi / 2)
+        angularSpeed[actors] = np.where(steer != 0, -signedSpeed / turningRadius, 0.0)
+        speed[actors] = np.abs(signedSpeed)
+
+    @staticmethod
+    def _localYaws(objects, heading):
+        # Yaws of objects with the given (global) headings, relative to their parent
+        # orientations; computed for all objects at once when their parent orientation
+        # is the global one, as is usual.
+        yaw = [None] * len(objects)
+        simple = []
+        for i, obj in enumerate(objects):
+            parent = obj.parentOrientation
+            if parent is globalOrientation or parent == globalOrientation:
+                simple.append(i)
             else:
-                obj.speed = current_speed
-            obj.position += obj.velocity * self.timestep
-            obj.heading += obj.angularSpeed * self.timestep
+                yaw[i] = parent.globalToLocalAngles(heading[i], 0, 0)[0]
+        if simple:
+            half = heading[simple] / 2
+            zeros = np.zeros(len(simple))
+            quats = np.column_stack((zeros, zeros, np.sin(half), np.cos(half)))
+            angles = Rotation(quats, normalize=False).as_euler("ZXY")
+            for i, angle in zip(simple, angles[:, 0].tolist()):
+                yaw[i] = angle
+        return yaw
+
+    def updateObjects(self):
+        super().updateObjects()
+
+        if self.render and self._state is not None:
+            import pygame
 
-        if self.render:
             self.draw_objects()
             pygame.event.pump()
 
     def draw_objects(self):
+        import pygame
+
         self.screen.fill((255, 255, 255))
         for screenPoints, color, width in self.network_polygons:
             pygame.draw.lines(self.screen, color, False, screenPoints, width=width)
@@ -233,28 +322,62 @@ class NewtonianSimulation(DrivingSimulation):
         time.sleep(self.timestep)
 
     def generate_gif(self, filename="simulation.gif"):
+        from PIL import Image
+
         imgs = [Image.fromarray(frame) for frame in self.frames]
         imgs[0].save(filename, save_all=True, append_images=imgs[1:], duration=50, loop=0)
 
     def getProperties(self, obj, properties):
-        yaw, _, _ = obj.parentOrientation.globalToLocalAngles(obj.heading, 0, 0)
+        index = self._stateIndices.get(obj)
+        if index is None:
+            # No time step has been run yet: use the initial state of the object
+            yaw, _, _ = obj.parentOrientation.globalToLocalAngles(obj.heading, 0, 0)
+            position, velocity = obj.position, obj.velocity
+            speed, angularSpeed = obj.speed, obj.angularSpeed
+        else:
+            positions, velocities, speeds, angularSpeeds, yaws = self._state
+            position = Vector(*positions[index])
+            velocity = Vector(*velocities[index])
+            speed, angularSpeed, yaw = speeds[index], angularSpeeds[index], yaws[index]
 
         values = dict(
-            position=obj.position,
+            position=position,
             yaw=yaw,
             pitch=0,
             roll=0,
-            velocity=obj.velocity,
-            speed=obj.speed,
-            angularSpeed=obj.angularSpeed,
+            velocity=velocity,
+            speed=speed,
+            angularSpeed=angularSpeed,
             angularVelocity=obj.angularVelocity,
         )
         if "elevation" in properties:
             values["elevation"] = obj.elevation
         return values
 
+    def getPropertiesBatch(self, objects, properties):
+        indices = self._stateIndices
+        if not all(obj in indices for obj in objects):
+            return None  # no time step has been run yet
+        rows = [indices[obj] for obj in objects]
+        positions, velocities, speeds, angularSpeeds, yaws = self._state
+        values = dict(
+            position=[Vector(*positions[i]) for i in rows],
+            yaw=[yaws[i] for i in rows],
+            pitch=[0.0] * len(rows),
+            roll=[0.0] * len(rows),
+            velocity=[Vector(*velocities[i]) for i in rows],
+            speed=[speeds[i] for i in rows],
+            angularSpeed=[angularSpeeds[i] for i in rows],
+            angularVelocity=[obj.angularVelocity for obj in objects],
+        )
+        if "elevation" in properties:
+            values["elevation"] = [obj.elevation for obj in objects]
+        return values
+
     def destroy(self):
         if self.render:
+            import pygame
+
             pygame.quit()
 
     def getLaneFollowingControllers(self, agent):
@@ -23,13 +23,16 @@ import ast
 import builtins
 from contextlib import contextmanager
 import dataclasses
+import functools
 import hashlib
 import importlib
 import importlib.abc
 import importlib.util
 import inspect
 import io
+import marshal
 import os
+import pickle
 import sys
 import time
 import types
@@ -42,8 +45,6 @@ from scenic.core.errors import InvalidScenarioError, PythonCompileError
 from scenic.core.lazy_eval import needsLazyEvaluation
 import scenic.core.pruning as pruning
 from scenic.core.utils import cached_property
-from scenic.syntax.compiler import compileScenicAST
-from scenic.syntax.parser import parse_string
 import scenic.syntax.veneer as veneer
 
 ### THE TOP LEVEL: compiling a Scenic program
@@ -169,7 +170,9 @@ def _scenarioFromStream(
     oldModules = list(sys.modules.keys())
     try:
         with topLevelNamespace(path) as namespace:
-            compileStream(stream, namespace, compileOptions, filename)
+            compileStream(
+                stream, namespace, compileOptions, filename, cacheable=path is not None
+            )
     finally:
         if not _cacheImports:
             purgeModulesUnsafeToCache(oldModules)
@@ -262,7 +265,7 @@ def purgeModulesUnsafeToCache(oldModules):
         del sys.modules[name]
 
 
-def compileStream(stream, namespace, compileOptions, filename):
+def compileStream(stream, namespace, compileOptions, filename, *, cacheable=False):
     """Compile a stream of Scenic code and execute it in a namespace.
 
     The compilation procedure consists of the following main steps:
@@ -274,6 +277,14 @@ def compileStream(stream, namespace, compileOptions, filename):
         3. Compile and execute the Python AST.
         4. Extract the global state (e.g. objects).
            This is done by the `storeScenarioStateIn` function.
+
+    If **cacheable** is true, **filename** should be the path of the file being
+    compiled, and the results of steps 1-3 (prior to execution) are saved in a
+    :file:`__pycache__` directory next to it so that they can be reused if the same
+    file is compiled again. See `useCompiledCache`.
+
+    .. versionchanged:: 3.1
+        Added the **cacheable** argument.
     """
     if errors.verbosityLevel >= 2:
         veneer.verbosePrint(f"  Compiling Scenic module from {filename}...")
@@ -284,44 +295,26 @@ def compileStream(stream, namespace, compileOptions, filename):
         exec(compile(preamble, "<veneer>", "exec"), namespace)
         namespace[namespaceReference] = namespace
 
-        # Parse the source
+        # Translate the source, or load the translation from the cache
         source = stream.read().decode("utf-8")
-        scenic_tree = parse_string(source, "exec", filename=filename)
-
-        if dumpScenicAST:
-            print(f"### Begin Scenic AST of {filename}")
-            print(dump(scenic_tree, include_attributes=False, indent=4))
-            print("### End Scenic AST")
-
-        # Compile the Scenic AST into a Python AST
-        tree, requirements = compileScenicAST(scenic_tree, filename=filename)
-        astHasher = hashlib.blake2b(digest_size=4)
-        astHasher.update(ast.dump(tree).encode())
-
-        if dumpFinalAST:
-            print(f"### Begin final AST of {filename}")
-            print(dump(tree, include_attributes=True, indent=4))
-            print("### End final AST")
-
-        pythonSource = astToSource(tree)
-        if dumpASTPython:
-            if pythonSource is None:
-                raise RuntimeError(
-                    "dumping the Python equivalent of the AST"
-                    " requires the astor package"
-                )
-            print(f"### Begin Python equivalent of final AST of {filename}")
-            print(pythonSource)
-            print("### End Python equivalent of final AST")
-
-        # Compile the Python AST tree
-        code = compileTranslatedTree(tree, filename)
+        cachePath = compiledCachePath(filename) if cacheable else None
+        if cachePath:
+            cacheKey = compiledCacheKey(source, filename, compileOptions)
+            translation = loadCompiledModule(cachePath, cacheKey)
+        else:
+            translation = None
+        if translation is None:
+            translation = translateSource(source, filename)
+            if cachePath:
+                saveCompiledModule(cachePath, cacheKey, translation)
+        elif errors.verbosityLevel >= 2:
+            veneer.verbosePrint(f"    Using cached translation from {cachePath}")
+        code, requirements, astHash, pythonSource = translation
 
         # Execute it
         executeCodeIn(code, namespace)
 
         # Extract scenario state from veneer and store it
-        astHash = astHasher.digest()
         storeScenarioStateIn(namespace, requirements, astHash, compileOptions)
     finally:
         veneer.deactivate()
@@ -331,6 +324,138 @@ def compileStream(stream, namespace, compileOptions, filename):
     return code, pythonSource
 
 
+def translateSource(source, filename):
+    """Translate Scenic source code into a Python code object.
+
+    This performs steps 1-3 of the procedure described in `compileStream`, returning
+    the code object, the syntax of the requirements in the module, a hash of the
+    final Python AST, and the Python source equivalent to it (if available).
+    """
+    # The parser and compiler are imported here since they are slow to load and not
+    # needed when the translation is cached (or to load pickled scenarios)
+    from scenic.syntax.compiler import compileScenicAST
+    from scenic.syntax.parser import parse_string
+
+    # Parse the source
+    scenic_tree = parse_string(source, "exec", filename=filename)
+
+    if dumpScenicAST:
+        print(f"### Begin Scenic AST of {filename}")
+        print(dump(scenic_tree, include_attributes=False, indent=4))
+        print("### End Scenic AST")
+
+    # Compile the Scenic AST into a Python AST
+    tree, requirements = compileScenicAST(scenic_tree, filename=filename)
+    astHasher = hashlib.blake2b(digest_size=4)
+    astHasher.update(ast.dump(tree).encode())
+
+    if dumpFinalAST:
+        print(f"### Begin final AST of {filename}")
+        print(dump(tree, include_attributes=True, indent=4))
+        print("### End final AST")
+
+    pythonSource = astToSource(tree)
+    if dumpASTPython:
+        if pythonSource is None:
+            raise RuntimeError(
+                "dumping the Python equivalent of the AST requires the astor package"
+            )
+        print(f"### Begin Python equivalent of final AST of {filename}")
+        print(pythonSource)
+        print("### End Python equivalent of final AST")
+
+    # Compile the Python AST tree
+    code = compileTranslatedTree(tree, filename)
+
+    return code, requirements, astHasher.digest(), pythonSource
+
+
+## Cache of compiled modules
+
+
+def compiledCachePath(filename):
+    """Get the path where the translation of the given Scenic file is cached.
+
+    Returns None if caching is disabled.
+    """
+    if not useCompiledCache or dumpScenicAST or dumpFinalAST or dumpASTPython:
+        return None
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        return None
+    head, tail = os.path.split(filename)
+    return os.path.join(head, "__pycache__", f"{tail}.{tag}.pyc")
+
+
+def compiledCacheKey(source, filename, compileOptions):
+    """Compute the key identifying a particular translation of a Scenic module.
+
+    The key depends on the source code, the version of Scenic (including the
+    modification times of the parser and compiler, in case they are being edited),
+    the version of Python, and the compile options.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(importlib.util.MAGIC_NUMBER)
+    hasher.update(_compilerVersion().encode())
+    hasher.update(filename.encode())
+    hasher.update(compileOptions.hash)
+    hasher.update(source.encode())
+    return hasher.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _compilerVersion():
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version("scenic")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    parts = [version]
+    # N.B. look up the files directly to avoid importing the parser on a cache hit
+    syntaxDir = os.path.dirname(__file__)
+    for name in ("parser.py", "compiler.py", "translator.py"):
+        parts.append(str(os.stat(os.path.join(syntaxDir, name)).st_mtime_ns))
+    return ":".join(parts)
+
+
+def loadCompiledModule(path, key):
+    """Load a cached translation, returning None if it is missing or stale."""
+    try:
+        with open(path, "rb") as stream:
+            if stream.read(len(key)) != key:
+                return None
+            rawCode, requirements, astHash, pythonSource = pickle.load(stream)
+        code = marshal.loads(rawCode)
+    except Exception:
+        # Treat any kind of corrupted or unreadable cache file as a cache miss
+        return None
+    return code, requirements, astHash, pythonSource
+
+
+def saveCompiledModule(path, key, translation):
+    """Save a translation to the cache, silently doing nothing if that fails."""
+    if sys.dont_write_bytecode:
+        return
+    code, requirements, astHash, pythonSource = translation
+    data = (marshal.dumps(code), requirements, astHash, pythonSource)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file and then move it into place, so that concurrent
+        # processes never see a partially-written cache file
+        tempPath = f"{path}.{os.getpid()}"
+        try:
+            with open(tempPath, "wb") as stream:
+                stream.write(key)
+                pickle.dump(data, stream)
+            os.replace(tempPath, path)
+        finally:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
 def dump(
     node: ast.AST,
     annotate_fields: bool = True,
@@ -363,6 +488,9 @@ dumpScenicAST = False
 dumpFinalAST = False
 dumpASTPython = False
 usePruning = True
+#: Whether to cache the translations of Scenic files in :file:`__pycache__`
+#: directories (see `compileStream`).
+useCompiledCache = True
 
 ## Preamble
 # (included at the beginning of every module to be translated;
@@ -396,7 +524,7 @@ class ScenicLoader(importlib.abc.InspectLoader):
             source = stream.read()
         with open(self.filepath, "rb") as stream:
             code, pythonSource = compileStream(
-                stream, module.__dict__, CompileOptions(), self.filepath
+                stream, module.__dict__, CompileOptions(), self.filepath, cacheable=True
             )
         # Save code, source, and translated source for later inspection
         module._code = code
@@ -11,6 +11,8 @@ from scenic.core.distributions import (
     Normal,
     Options,
     Range,
+    RejectionException,
+    Samplable,
     TruncatedNormal,
     distributionFunction,
     distributionMethod,
@@ -89,9 +91,12 @@ def test_support_operators():
 def similarDistributions(pytestconfig):
     samples = 3000 if pytestconfig.getoption("--fast") else 100000
 
-    def checker(d1, d2, p=1e-5):
+    def checker(d1, d2, p=1e-5, batchSampler=None):
         s1 = [d1.sample() for i in range(samples)]
-        s2 = [d2.sample() for i in range(samples)]
+        if batchSampler:
+            s2 = batchSampler(d2, samples)
+        else:
+            s2 = [d2.sample() for i in range(samples)]
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             try:
@@ -280,3 +285,58 @@ def test_attribute_distribution():
     assert all(val == "1" or val == "2" for val in vals)
     assert any(val == "1" for val in vals)
     assert any(val == "2" for val in vals)
+
+
+# Batch sampling
+
+
+def sampleBatch(dist, count):
+    samples = list(Samplable.sampleAllBatch((dist,), count))
+    assert len(samples) == count
+    return [sample[dist] for sample in samples]
+
+
+@pytest.mark.parametrize(
+    "dist",
+    (
+        Range(-3, 7),
+        Normal(22, 5),
+        Normal(0, Range(-1, -0.5)),
+        TruncatedNormal(1, 2, 0, 4),
+        DiscreteRange(-2, 4),
+        Options({1: 1, 2: 4, 3: 9}),
+        Options([Range(0, 1), Normal(5, 1)]),
+        2 * Range(0, 1) - Normal(3, 1) / 4,
+        -Range(-3, 7),
+    ),
+)
+def test_batch_sampling(dist, similarDistributions):
+    vals = sampleBatch(dist, 1000)
+    isFloat = isinstance(dist.sample(), float)
+    assert all(isinstance(val, float) == isFloat for val in vals)
+    similarDistributions(dist, dist, batchSampler=sampleBatch)
+
+
+def test_batch_sampling_dependencies():
+    x = Range(0, 1)
+    y = x + Range(0, 1)
+    samples = list(Samplable.sampleAllBatch((x, y), 100))
+    assert all(0 <= sample[y] - sample[x] <= 1 for sample in samples)
+
+
+def test_batch_sampling_fallback():
+    # Distributions which can't be batched are sampled individually
+    dist = distributionFunction(math.sqrt)(Range(1, 4))
+    vals = sampleBatch(dist, 100)
+    assert all(1 <= val <= 2 for val in vals)
+    assert len(set(vals)) == 100
+
+
+def test_batch_sampling_rejection():
+    dist = DiscreteRange(Range(0, 2), 1)
+    samples = list(Samplable.sampleAllBatch((dist,), 100))
+    assert all(
+        isinstance(sample, RejectionException) or sample[dist] == 1 for sample in samples
+    )
+    assert any(isinstance(sample, RejectionException) for sample in samples)
+    assert not all(isinstance(sample, RejectionException) for sample in samples)
@@ -1,5 +1,8 @@
+import itertools
 import math
+import random
 
+import numpy
 import pytest
 import shapely.geometry
 import shapely.ops
@@ -7,7 +10,9 @@ import trimesh
 
 import scenic.core.geometry as geometry
 from scenic.core.object_types import Object
-from scenic.core.shapes import ConeShape
+from scenic.core.requirements import BlanketCollisionRequirement
+from scenic.core.shapes import BoxShape, ConeShape, MeshShape
+from scenic.core.vectors import Vector
 
 ## Triangulation
 
@@ -93,3 +98,58 @@ def test_object_boundingPolygon_3D():
     )
     for pt in trimesh.sample.volume_mesh(obj.occupiedSpace.mesh, 100):
         assert obj._boundingPolygon.contains(shapely.geometry.Point(pt))
+
+
+## Broad-phase collision detection
+
+
+def test_overlapping_sphere_pairs():
+    rng = numpy.random.default_rng(0)
+    for count in (0, 1, 2, 10, 40):
+        centers = rng.uniform(0, 20, (count, 3))
+        radii = rng.uniform(0, 3, count)
+        first, second = geometry.overlappingSpherePairs(centers, radii)
+        expected = [
+            (i, j)
+            for i, j in itertools.combinations(range(count), 2)
+            if numpy.linalg.norm(centers[i] - centers[j]) <= radii[i] + radii[j]
+        ]
+        assert list(zip(first.tolist(), second.tolist())) == expected
+
+
+def test_blanket_collision_broad_phase():
+    objs = [
+        Object._with(position=(0, 0, 0)),
+        Object._with(position=(10, 0, 0)),
+        Object._with(position=(10.5, 0, 0)),
+    ]
+    req = BlanketCollisionRequirement(objs)
+    sample = {obj: obj for obj in objs}
+    assert req.falsifiedBy(sample)
+    assert req._collidingObjects == (1, 2)
+    objs[2] = Object._with(position=(0, 10, 0))
+    req = BlanketCollisionRequirement(objs)
+    sample = {obj: obj for obj in objs}
+    assert not req.falsifiedBy(sample)
+
+
+def test_object_intersects_collision_geometry():
+    random.seed(0)
+    torus = MeshShape(trimesh.creation.annulus(r_min=0.3, r_max=1, height=0.3))
+    shapes = (BoxShape(), ConeShape(), torus)
+    for _ in range(100):
+        objA, objB = (
+            Object._with(
+                position=Vector(*(random.uniform(-2, 2) for _ in range(3))),
+                yaw=random.uniform(-3, 3),
+                pitch=random.uniform(-1, 1),
+                roll=random.uniform(-1, 1),
+                shape=random.choice(shapes),
+                width=random.uniform(0.5, 3),
+                length=random.uniform(0.5, 3),
+                height=random.uniform(0.5, 3),
+            )
+            for _ in range(2)
+        )
+        expected = objA.occupiedSpace.intersects(objB.occupiedSpace)
+        assert objA.intersects(objB) == expected
@@ -1,6 +1,8 @@
 import math
 from pathlib import Path
+import random
 
+import numpy
 import pytest
 import shapely.geometry
 import trimesh.voxel
@@ -8,7 +10,7 @@ import trimesh.voxel
 from scenic.core.distributions import RandomControlFlowError, Range
 from scenic.core.object_types import Object, OrientedPoint
 from scenic.core.regions import *
-from scenic.core.vectors import VectorField
+from scenic.core.vectors import Orientation, Vector, VectorField
 from tests.utils import deprecationTest, sampleSceneFrom
 
 
@@ -193,6 +195,48 @@ def test_polyline_region():
     assert len(i.points) == 2
 
 
+def test_polyline_region_batch_queries():
+    lines = [[(0, 2), (1, 1), (0, 0)], [(3, 0), (3, 2)]]
+    pl = PolylineRegion(polyline=shapely.geometry.MultiLineString(lines))
+    # Ties between segments are broken in favor of the first segment
+    assert pl.nearestSegmentTo((2, 1)) == ((0, 2, 0), (1, 1, 0))
+    assert pl.nearestSegmentTo((1.5, 1)) == ((0, 2, 0), (1, 1, 0))
+    assert pl.signedDistanceTo((2, 1)) == pytest.approx(1)
+    assert pl.signedDistanceTo((3.5, 1)) == pytest.approx(-0.5)
+    assert pl.signedDistanceTo((2.5, 1)) == pytest.approx(0.5)
+
+    random.seed(0)
+    pts = [(random.uniform(-1, 4), random.uniform(-1, 3)) for i in range(50)]
+    pts += [(2, 1), (1.5, 1), (0, 2), (3, 1)]
+    segments = pl.nearestSegmentsTo(pts)
+    distances = pl.signedDistancesTo(pts)
+    projections = pl.projectAll(pts)
+    assert segments.shape == (len(pts), 2, 2)
+    assert projections.shape == (len(pts), 3)
+    for pt, segment, distance, projection in zip(pts, segments, distances, projections):
+        start, end = pl.nearestSegmentTo(pt)
+        assert segment.tolist() == [[start.x, start.y], [end.x, end.y]]
+        assert distance == pytest.approx(pl.signedDistanceTo(pt))
+        assert abs(distance) == pytest.approx(pl.distanceTo(pt))
+        assert tuple(projection) == pytest.approx(pl.project(pt))
+        nearest = shapely.ops.nearest_points(pl.lineString, shapely.geometry.Point(pt))
+        assert pl.distanceTo(projection) == pytest.approx(0, abs=1e-9)
+        assert pl.distanceTo(pt) == pytest.approx(nearest[0].distance(nearest[1]))
+
+    lengths = [-1, -0.5, 0, 1, 2 * math.sqrt(2), 3, 4.5, 10]
+    points = pl.pointsAlongBy(lengths)
+    for length, point in zip(lengths, points):
+        expected = pl.lineString.interpolate(length)
+        assert tuple(point) == pytest.approx((expected.x, expected.y, 0))
+        assert tuple(point) == pytest.approx(pl.pointAlongBy(length))
+    fractions = [-0.25, 0, 0.3, 1, 1.5]
+    points = pl.pointsAlongBy(fractions, normalized=True)
+    for fraction, point in zip(fractions, points):
+        expected = pl.lineString.interpolate(fraction, normalized=True)
+        assert tuple(point) == pytest.approx((expected.x, expected.y, 0))
+        assert tuple(point) == pytest.approx(pl.pointAlongBy(fraction, normalized=True))
+
+
 def test_polygon_region():
     poly = PolygonalRegion([(1, 1), (3, 1), (2, 2), (1.3, 1.15)])
     assert poly in {poly}
@@ -267,6 +311,32 @@ def test_polygon_sampling():
     assert sum(y >= 1.5 for y in ys) >= 1250
 
 
+def test_polygon_sampling_batch():
+    p = shapely.geometry.Polygon(
+        [(0, 0), (0, 3), (3, 3), (3, 0)], holes=[[(1, 1), (1, 2), (2, 2), (2, 1)]]
+    )
+    r = PolygonalRegion(polygon=p, z=2)
+    pts = r.uniformPoints(3000)
+    assert pts.shape == (3000, 3)
+    for x, y, z in pts:
+        assert 0 <= x <= 3 and 0 <= y <= 3 and z == 2
+        assert not (1 < x < 2 and 1 < y < 2)
+    xs, ys, zs = pts.T
+    assert sum(1 <= x <= 2 for x in xs) <= 870
+    assert sum(1 <= y <= 2 for y in ys) <= 870
+    assert sum(x >= 1.5 for x in xs) >= 1250
+    assert sum(y >= 1.5 for y in ys) >= 1250
+
+    for region in (
+        CircularRegion(Vector(4, 5, 2), 2),
+        SectorRegion(Vector(4, 5, 2), 2, 1, 1),
+        RectangularRegion(Vector(2.5, 4.5, 2), 1, 2, 3),
+    ):
+        pts = region.uniformPoints(100)
+        assert pts.shape == (100, 3)
+        assert all(region.containsPoint(Vector(*pt)) for pt in pts)
+
+
 def test_polygon_trueContainsPoint():
     r = CircularRegion((0, 0), 1, resolution=64)
 
@@ -320,6 +390,51 @@ def test_mesh_volume_region_sampling():
         assert -1 <= z <= 1
 
 
+def test_mesh_volume_region_moved():
+    mesh = trimesh.creation.annulus(2, 5, 3, sections=32)
+    dimensions = (4, 6, 2)
+    region = MeshVolumeRegion(
+        mesh, dimensions=dimensions, position=(1, 2, 3), rotation=(0.3, 0.2, 0.1)
+    )
+    position, rotation = Vector(-4, 5, 1), Orientation.fromEuler(1.3, -0.2, 0.4)
+    moved = region._moved(position, rotation)
+    expected = MeshVolumeRegion(
+        mesh, dimensions=dimensions, position=position, rotation=rotation
+    )
+    assert numpy.allclose(moved.mesh.vertices, expected.mesh.vertices)
+    assert moved.position == position
+    assert moved.rotation == rotation
+    assert moved.dimensions == dimensions
+    assert moved.num_samples == expected.num_samples
+
+
+def test_mesh_volume_region_contains_object_grid():
+    mesh = trimesh.creation.annulus(2, 5, 3, sections=32)
+    exact = MeshVolumeRegion(mesh)
+    exact._containmentGridThreshold = float("inf")
+    fast = MeshVolumeRegion(mesh)
+    fast._containmentGridThreshold = 1
+    grid = fast._containmentGrid
+    decided = 0
+    for _ in range(100):
+        obj = Object._with(
+            position=(
+                random.uniform(-6, 6),
+                random.uniform(-6, 6),
+                random.uniform(-2, 2),
+            ),
+            yaw=random.uniform(0, math.pi),
+        )
+        expected = exact.containsObject(obj)
+        assert fast.containsObject(obj) == expected
+        result = grid.containsObject(obj)
+        if result is not None:
+            assert result == expected
+            decided += 1
+    # most objects should not need an exact check
+    assert decided > 50
+
+
 def test_mesh_surface_region_sampling():
     r = BoxRegion(position=(0, 0, 0), dimensions=(2, 2, 2)).getSurfaceRegion()
     pts = [r.uniformPointInner() for _ in range(100)]
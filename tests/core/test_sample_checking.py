@@ -0,0 +1,91 @@
+import itertools
+import random
+import types
+
+from scenic.core.requirements import SamplingRequirement
+import scenic.core.sample_checking as sample_checking
+from scenic.core.sample_checking import AdaptiveOrderingChecker
+from tests.utils import compileScenic, sampleScene
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def perf_counter(self):
+        return self.now
+
+
+class FakeRequirement(SamplingRequirement):
+    def __init__(self, name, rejects, clock, cost=1, optional=False):
+        super().__init__(optional=optional)
+        self.name = name
+        self.rejects = rejects
+        self.clock = clock
+        self.cost = cost
+        self.checked = 0
+
+    def falsifiedByInner(self, sample):
+        self.checked += 1
+        self.clock.now += self.cost
+        return self.rejects(sample)
+
+    @property
+    def violationMsg(self):
+        return f"{self.name} violated"
+
+
+def test_adaptive_ordering(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(
+        sample_checking, "time", types.SimpleNamespace(perf_counter=clock.perf_counter)
+    )
+    # The first two requirements reject exactly the same samples, so once the first
+    # has been checked, the third is more likely to reject than the second.
+    even = lambda sample: sample % 2 == 0
+    reqs = [
+        FakeRequirement("first", even, clock),
+        FakeRequirement("second", even, clock),
+        FakeRequirement("third", lambda sample: sample % 3 == 0, clock),
+        FakeRequirement("optional", even, clock, optional=True),
+    ]
+    checker = AdaptiveOrderingChecker(explorationInterval=10, replanInterval=10)
+    checker.setRequirements(reqs)
+    rng = random.Random(0)
+    for i in range(200):
+        sample = rng.randrange(1000)
+        rejection = checker.checkRequirements(sample)
+        assert (rejection is None) == (sample % 2 != 0 and sample % 3 != 0)
+    # The optional requirement is never useful once the others have been checked
+    assert checker.plan == (0, 2, 1)
+
+    for req in reqs:
+        req.checked = 0
+    samples = [rng.randrange(1000) for i in range(9)]  # no exploration samples
+    for sample in samples:
+        checker.checkRequirements(sample)
+    odd = [sample for sample in samples if sample % 2 != 0]
+    accepted = [sample for sample in odd if sample % 3 != 0]
+    assert [req.checked for req in reqs] == [len(samples), len(accepted), len(odd), 0]
+
+
+def test_adaptive_ordering_scenario():
+    scenario = compileScenic(
+        """
+        workspace = Workspace(RectangularRegion(0 @ 0, 0, 8, 8))
+        ego = new Object in workspace
+        for i in range(4):
+            new Object in workspace, facing Range(0, 360) deg
+        """,
+        mode2D=True,
+    )
+    checker = AdaptiveOrderingChecker(explorationInterval=5, replanInterval=5)
+    scenario.setSampleChecker(checker)
+    random.seed(0)
+    for i in range(5):
+        scene = sampleScene(scenario, maxIterations=1000)
+        for objA, objB in itertools.combinations(scene.objects, 2):
+            assert not objA.intersects(objB)
+        for obj in scene.objects:
+            assert scene.workspace.region.containsObject(obj)
+    assert checker.samplesChecked > checker.warmup
@@ -1,7 +1,9 @@
+import random
+
 import pytest
 
-from scenic.core.distributions import Range
-from tests.utils import compileScenic
+from scenic.core.distributions import Range, RejectionException, distributionFunction
+from tests.utils import compileScenic, pickle_test
 
 
 def test_nonexistent_scenario_local_1():
@@ -59,3 +61,188 @@ def test_condition_scenario_params_2():
     assert all(0.5 <= x <= 0.51 for x in xs)
     assert any(0.505 <= x for x in xs)
     assert any(x < 0.505 for x in xs)
+
+
+@pickle_test
+def test_generate_batch_parallel():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(1, 2), 0)
+        other = new Object at (Range(1, 2), 5)
+        require ego.x < other.x
+    """
+    )
+
+    def generate():
+        random.seed(12345)
+        scenes, iterations = scenario.generateBatch(5, workers=2)
+        assert len(scenes) == 5
+        assert iterations >= 5
+        for scene in scenes:
+            assert scene.egoObject.x < scene.objects[1].x
+        return [scene.egoObject.x for scene in scenes], iterations
+
+    assert generate() == generate()
+
+
+@pickle_test
+def test_generate_batch_parallel_rejection():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(1, 2), 0)
+        require ego.x > 3
+    """
+    )
+    with pytest.raises(RejectionException) as info:
+        scenario.generateBatch(4, maxIterations=10, workers=2)
+    assert isinstance(info.value.__cause__, RejectionException)
+
+
+@pickle_test
+def test_generate_batch_parallel_budget():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(1, 2), 0)
+        require ego.x > 1.5
+    """
+    )
+    random.seed(12345)
+    scenes, iterations = scenario.generateBatch(4, maxIterations=40, workers=2)
+    assert len(scenes) == 4
+    assert iterations <= 40
+    # The budget is split between the workers, each needing at least 2 iterations
+    with pytest.raises(RejectionException):
+        scenario.generateBatch(4, maxIterations=3, workers=2)
+
+
+def test_iter_scenes():
+    scenario = compileScenic("ego = new Object at (Range(1, 2), 0)")
+    scenes = scenario.iterScenes(maxIterations=1, count=3)
+    results = list(scenes)
+    assert len(results) == 3
+    for scene, iterations in results:
+        assert 1 <= scene.egoObject.x <= 2
+        assert iterations == 1
+
+
+def test_iter_scenes_unbounded():
+    scenario = compileScenic("ego = new Object at (Range(1, 2), 0)")
+    scenes = scenario.iterScenes(maxIterations=1)
+    for _ in range(10):
+        scene, iterations = next(scenes)
+        assert 1 <= scene.egoObject.x <= 2
+
+
+def test_iter_scenes_rejection():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(1, 2), 0)
+        require ego.x > 3
+    """
+    )
+    scenes = scenario.iterScenes(maxIterations=10)
+    with pytest.raises(RejectionException):
+        next(scenes)
+
+
+def test_sampling_batch_size():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(0, 10), Range(0, 10))
+        other = new Object at ego offset by (Range(2, 4), DiscreteRange(-1, 1))
+        require other.x > 6
+    """
+    )
+    scenario.setSamplingBatchSize(20)
+    for _ in range(10):
+        scene, _ = scenario.generate(maxIterations=100)
+        ego, other = scene.objects
+        assert 0 <= ego.x <= 10
+        assert other.x > 6
+        assert 2 <= other.x - ego.x <= 4
+        dy = other.y - ego.y
+        assert round(dy) in (-1, 0, 1)
+        assert dy == pytest.approx(round(dy))
+    with pytest.raises(ValueError):
+        scenario.setSamplingBatchSize(0)
+
+
+def test_sampling_batch_size_regions():
+    scenario = compileScenic(
+        """
+        region = PolygonalRegion([(0, 0), (4, 0), (4, 4), (0, 4)])
+        ego = new Object in region
+        other = new Object in region, with requireVisible False
+        require other.x > 2
+    """
+    )
+    scenario.setSamplingBatchSize(20)
+    for _ in range(10):
+        scene, _ = scenario.generate(maxIterations=100)
+        ego, other = scene.objects
+        assert 0 <= ego.x <= 4 and 0 <= ego.y <= 4
+        assert 2 < other.x <= 4 and 0 <= other.y <= 4
+
+
+def test_early_rejection():
+    samples = []
+
+    @distributionFunction
+    def record(x):
+        samples.append(x)
+        return x
+
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(0, 1), 0)
+        other = new Object at (globalParameters.record(Range(0, 1)), 5)
+        require ego.x < 0.5
+        require other.x < 0.5
+    """,
+        params={"record": record},
+    )
+    scenario.setRequirementStaging(True)
+    totalIterations = 0
+    for _ in range(20):
+        scene, iterations = scenario.generate(maxIterations=1000)
+        ego, other = scene.objects
+        assert ego.x < 0.5
+        assert other.x < 0.5
+        totalIterations += iterations
+    # samples rejected because of the ego never get as far as sampling other
+    assert len(samples) < totalIterations
+
+
+def test_requirement_staging_option():
+    scenario = compileScenic(
+        """
+        ego = new Object at (Range(0, 10), 0)
+        other = new Object at (Range(0, 10), 5)
+        require ego.x > 2
+        require ego.x + other.x > 14
+    """
+    )
+    # Staging is disabled by default, so the checker sees every requirement
+    numDefault = len(scenario.defaultRequirements)
+    assert len(scenario.checker.requirements) == numDefault + 2
+
+    random.seed(1)
+    scenes = [scenario.generate(maxIterations=1000) for _ in range(3)]
+    scenario.setRequirementStaging(True)
+    assert len(scenario.checker.requirements) == numDefault + 1
+    random.seed(1)
+    for _ in range(3):
+        scene, _ = scenario.generate(maxIterations=1000)
+        ego, other = scene.objects
+        assert ego.x > 2 and ego.x + other.x > 14
+
+    # Turning staging off again restores the original seeded results
+    scenario.setRequirementStaging(False)
+    assert len(scenario.checker.requirements) == numDefault + 2
+    random.seed(1)
+    for scene, iterations in scenes:
+        newScene, newIterations = scenario.generate(maxIterations=1000)
+        assert newIterations == iterations
+        assert [obj.position for obj in newScene.objects] == [
+            obj.position for obj in scene.objects
+        ]
@@ -21,3 +21,11 @@ def test_invalid_dimension(badDim):
             BoxShape(dimensions=dims)
     with pytest.raises(ValueError):
         BoxShape(scale=badDim)
+
+
+def test_collision_geometry_cached():
+    shape = BoxShape()
+    geom = shape.collisionGeometry((1, 2, 3))
+    assert shape.collisionGeometry((1, 2, 3)) is geom
+    assert shape.collisionGeometry((1, 2, 4)) is not geom
+    assert BoxShape().collisionGeometry((1, 2, 3)) is not geom
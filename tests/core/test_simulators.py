@@ -1,7 +1,28 @@
+import pickle
+import random
+import time
+
+import numpy
 import pytest
 
-from scenic.core.simulators import DummySimulation, DummySimulator, Simulation
-from tests.utils import compileScenic, sampleResultFromScene, sampleSceneFrom
+from scenic.core.object_types import Object
+from scenic.core.simulators import (
+    DummySimulation,
+    DummySimulator,
+    Simulation,
+    SpawnedAgent,
+    TerminationType,
+    Trajectory,
+)
+from scenic.core.utils import cached_property
+from scenic.core.vectors import Vector
+from tests.utils import (
+    compileScenic,
+    pickle_test,
+    sampleResultFromScene,
+    sampleScene,
+    sampleSceneFrom,
+)
 
 
 def test_old_style_simulator():
@@ -94,3 +115,327 @@ def test_simulator_bad_scheduler():
     simulator = TestSimulator()
     with pytest.raises(RuntimeError):
         result = simulator.simulate(scene, maxSteps=2)
+
+
+def test_simulator_batch_properties():
+    class TestSimulation(DummySimulation):
+        def getProperties(self, obj, properties):
+            assert False
+
+        def getPropertiesBatch(self, objects, properties):
+            values = super().getPropertiesBatch(objects, properties)
+            assert values is None
+            count = len(objects)
+            positions = numpy.array([obj.position for obj in objects])
+            positions[:, 0] += 1
+            return dict(
+                position=positions,
+                yaw=numpy.zeros(count, dtype=int),
+                pitch=numpy.zeros(count, dtype=numpy.float32),
+                roll=[0] * count,
+                velocity=numpy.zeros((count, 3)),
+                angularVelocity=[Vector(0, 0, 0)] * count,
+                speed=numpy.ones(count),
+                angularSpeed=numpy.zeros(count),
+            )
+
+    class TestSimulator(DummySimulator):
+        def createSimulation(self, scene, **kwargs):
+            return TestSimulation(scene, **kwargs)
+
+    scenario = compileScenic(
+        """
+        ego = new Object at (0, 0)
+        other = new Object at (0, 5)
+        record final ego.position as ego
+        record final other.position as other
+        record final ego.speed as speed
+        record final type(ego.yaw) as yawType
+    """
+    )
+    scene = sampleScene(scenario)
+    result = TestSimulator().simulate(scene, maxSteps=2).result
+    assert result.records["ego"] == (3, 0, 0)
+    assert result.records["other"] == (3, 5, 0)
+    assert result.records["speed"] == 1
+    assert result.records["yawType"] is float
+
+
+def test_simulator_bad_property_type():
+    class TestSimulation(DummySimulation):
+        def getProperties(self, obj, properties):
+            values = super().getProperties(obj, properties)
+            values["speed"] = "fast"
+            return values
+
+    class TestSimulator(DummySimulator):
+        def createSimulation(self, scene, **kwargs):
+            return TestSimulation(scene, **kwargs)
+
+    scene = sampleSceneFrom("ego = new Object")
+    with pytest.raises(RuntimeError, match='"speed" with type str'):
+        TestSimulator().simulate(scene, maxSteps=1)
+
+
+def test_simulator_unchanged_objects():
+    regions = []
+
+    class TestSimulation(DummySimulation):
+        def step(self):
+            super().step()
+            regions.append(tuple(obj.occupiedSpace for obj in self.objects))
+
+    class TestSimulator(DummySimulator):
+        def createSimulation(self, scene, **kwargs):
+            return TestSimulation(scene, drift=self.drift, **kwargs)
+
+    scene = sampleSceneFrom(
+        """
+        ego = new Object
+        other = new Object at (0, 5)
+    """
+    )
+    TestSimulator().simulate(scene, maxSteps=3)
+    assert len(regions) == 3
+    # Cached properties of objects which have not moved are not recomputed
+    assert all(step[0] is regions[0][0] for step in regions)
+    assert all(step[1] is regions[0][1] for step in regions)
+
+    regions.clear()
+    TestSimulator(drift=1).simulate(scene, maxSteps=3)
+    assert len(set(id(step[0]) for step in regions)) == 3
+
+
+def test_cache_dependencies():
+    deps = Object._cache_dependencies
+    pose = {"position", "orientation"}
+    box = pose | {"width", "length", "height"}
+    assert deps["corners"] == box
+    assert deps["boundingBox"] == deps["occupiedSpace"] == box | {"shape"}
+    assert deps["inradius"] == {"width", "length", "height", "shape"}
+    assert deps["canSee"] is None
+
+    class CustomObject(Object):
+        @cached_property
+        def occupiedSpace(self):
+            return super().occupiedSpace
+
+    # Values depending on caches with unknown dependencies are always cleared
+    assert CustomObject._cache_dependencies["boundingBox"] is None
+    assert CustomObject._cache_dependencies["inradius"] == deps["inradius"]
+
+
+def test_simulator_cache_invalidation():
+    caches = []
+
+    class TestSimulation(DummySimulation):
+        def step(self):
+            ego, other = self.objects
+            caches.append((ego.occupiedSpace, other.occupiedSpace, other.inradius))
+            other.position += Vector(0, 1)
+
+        def getProperties(self, obj, properties):
+            values = super().getProperties(obj, properties)
+            if obj is self.objects[0]:
+                values["speed"] = float(self.currentTime)
+            return values
+
+    class TestSimulator(DummySimulator):
+        def createSimulation(self, scene, **kwargs):
+            return TestSimulation(scene, **kwargs)
+
+    scene = sampleSceneFrom(
+        """
+        ego = new Object
+        other = new Object at (0, 5)
+    """
+    )
+    TestSimulator().simulate(scene, maxSteps=3)
+    assert len(caches) == 3
+    # Changing the speed of an object doesn't affect its occupied space
+    assert all(cache[0] is caches[0][0] for cache in caches)
+    # Moving an object affects its occupied space but not its inradius
+    assert all(cache[2] is caches[0][2] for cache in caches)
+    for step, (_, space, _) in enumerate(caches):
+        expected = ((-0.5, 4.5 + step, -0.5), (0.5, 5.5 + step, 0.5))
+        assert numpy.allclose(space.mesh.bounds, expected)
+
+
+def test_trajectory(tmp_path):
+    states = [(Vector(0, 0, 0),), (Vector(1, 2, 3), Vector(4, 5, 6))]
+    states += [tuple(Vector(i, j, 0) for j in range(10)) for i in range(20)]
+    trajectory = Trajectory(states)
+    assert len(trajectory) == len(states)
+    assert list(trajectory) == states
+    assert trajectory == tuple(states)
+    assert trajectory[-1] == states[-1]
+    assert trajectory[1:3] == tuple(states[1:3])
+    positions = trajectory.positions
+    assert positions.shape == (22, 10, 3)
+    assert positions[1, 1].tolist() == [4, 5, 6]
+    assert numpy.isnan(positions[0, 1:]).all()
+    assert trajectory.objectCounts[:3].tolist() == [1, 2, 10]
+
+    path = tmp_path / "trajectory.npz"
+    trajectory.save(path)
+    loaded = Trajectory.load(path)
+    assert loaded == trajectory
+    loaded.append(states[0])
+    assert loaded[-1] == states[0]
+    assert pickle.loads(pickle.dumps(trajectory)) == trajectory
+
+    # Other kinds of states are stored as-is
+    trajectory.append("foo")
+    assert trajectory[-1] == "foo"
+    assert trajectory[:-1] == tuple(states)
+    with pytest.raises(TypeError):
+        trajectory.positions
+
+
+def test_simulation_trajectory():
+    scene = sampleSceneFrom(
+        """
+        ego = new Object
+        other = new Object at (5, 0)
+    """
+    )
+    simulation = DummySimulator(drift=1).simulate(scene, maxSteps=2)
+    result = simulation.result
+    assert isinstance(result.trajectory, Trajectory)
+    assert result.finalState == (Vector(0, 2, 0), Vector(5, 2, 0))
+    assert result.trajectory.positions[:, :, 1].tolist() == [[0, 0], [1, 1], [2, 2]]
+
+    # The result has its own copy of the trajectory, usable like a tuple
+    states = tuple(result.trajectory)
+    assert result.trajectory is not simulation.trajectory
+    assert hash(result.trajectory) == hash(states)
+    assert result.trajectory + (None,) == states + (None,)
+    assert () + result.trajectory == states
+    assert result.trajectory * 2 == states * 2
+    with pytest.raises(TypeError):
+        result.trajectory.append(states[0])
+    with pytest.raises(TypeError):
+        hash(simulation.trajectory)
+
+
+def test_simulator_timeout():
+    scenario = compileScenic("ego = new Object")
+    scene = sampleScene(scenario)
+    simulation = DummySimulator().simulate(scene, maxSteps=100, timeout=0)
+    assert simulation.result.terminationType == TerminationType.timeout
+    assert simulation.currentTime == 0
+
+
+batchProgram = """
+    behavior Foo():
+        while True:
+            require self.x > 3
+            take 1
+    ego = new Object at (Range(0, 10), 0), with behavior Foo
+    record final ego.x as x
+"""
+
+
+def checkBatch(simulations, count):
+    assert [simulation.index for simulation in simulations] == list(range(count))
+    for simulation in simulations:
+        assert simulation.error is None
+        ego = simulation.scene.egoObject
+        if ego.x <= 3:
+            assert simulation.result is None
+            continue
+        result = simulation.result
+        assert len(result.trajectory) == 3
+        assert result.records["x"] == ego.x
+        assert result.actions[0] == {ego: (1,)}
+        replay = simulation.replay
+        replayed = DummySimulator().replay(simulation.scene, replay, maxSteps=2)
+        assert replayed.result.trajectory == result.trajectory
+    return [simulation.scene.egoObject.x for simulation in simulations]
+
+
+def test_simulate_batch():
+    scenario = compileScenic(batchProgram)
+    random.seed(0)
+    simulations = scenario.simulateBatch(10, DummySimulator, maxSteps=2)
+    xs = checkBatch(simulations, 10)
+    assert any(x <= 3 for x in xs)
+    random.seed(0)
+    assert checkBatch(scenario.simulateBatch(10, DummySimulator, maxSteps=2), 10) == xs
+
+
+@pickle_test
+def test_simulate_batch_parallel():
+    scenario = compileScenic(batchProgram)
+    random.seed(0)
+    serial = checkBatch(scenario.simulateBatch(10, DummySimulator, maxSteps=2), 10)
+    random.seed(0)
+    simulations = scenario.simulateBatch(10, DummySimulator, workers=3, maxSteps=2)
+    assert checkBatch(simulations, 10) == serial
+
+    random.seed(0)
+    simulations = scenario.iterSimulations(
+        10, DummySimulator, workers=3, ordered=False, maxSteps=2
+    )
+    simulations = sorted(simulations, key=lambda simulation: simulation.index)
+    assert checkBatch(simulations, 10) == serial
+
+
+@pickle_test
+def test_simulate_batch_parallel_spawned_agents():
+    scenario = compileScenic(
+        """
+        behavior Foo():
+            while True:
+                take 1
+        scenario Spawn():
+            setup:
+                new Object at (0, 10), with behavior Foo
+        scenario Main():
+            setup:
+                ego = new Object with behavior Foo
+            compose:
+                wait
+                do Spawn()
+        """,
+        scenario="Main",
+    )
+    simulations = scenario.simulateBatch(2, DummySimulator, workers=2, maxSteps=2)
+    for simulation in simulations:
+        ego = simulation.scene.egoObject
+        assert simulation.result.actions == (
+            {ego: (1,)},
+            {ego: (1,), SpawnedAgent(1, "Object"): (1,)},
+        )
+
+
+class HangingSimulation(DummySimulation):
+    def step(self):
+        if self.objects[0].x > 5:
+            time.sleep(60)
+
+
+class HangingSimulator(DummySimulator):
+    def createSimulation(self, scene, **kwargs):
+        return HangingSimulation(scene, **kwargs)
+
+
+@pickle_test
+def test_simulate_batch_worker_timeout():
+    scenario = compileScenic("ego = new Object at (Range(0, 10), 0)")
+    random.seed(0)
+    start = time.monotonic()
+    simulations = scenario.simulateBatch(
+        6, HangingSimulator, workers=2, workerTimeout=2, maxSteps=2
+    )
+    assert time.monotonic() - start < 30
+    assert [simulation.index for simulation in simulations] == list(range(6))
+    timedOut = [simulation for simulation in simulations if simulation.error]
+    assert 0 < len(timedOut) < 6
+    for simulation in simulations:
+        if simulation.error:
+            assert isinstance(simulation.error, TimeoutError)
+            assert simulation.scene is None and simulation.result is None
+        else:
+            assert simulation.scene.egoObject.x <= 5
+            assert len(simulation.result.trajectory) == 3
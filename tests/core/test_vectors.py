@@ -52,6 +52,26 @@ def test_orientation_localAnglesFor():
         assert target.approxEq(parent * local)
 
 
+def test_orientation_matches_scipy():
+    from scipy.spatial.transform import Rotation
+
+    for i in range(100):
+        angles = [random.uniform(-math.pi, math.pi) for _ in range(3)]
+        heading = random.uniform(-math.pi, math.pi)
+        vec = Vector(*(random.uniform(-10, 10) for _ in range(3)))
+        o = Orientation.fromEuler(*angles)
+        r = Rotation.from_euler("ZXY", angles)
+        h = Orientation._fromHeading(heading)
+        rh = Rotation.from_rotvec([0, 0, heading])
+        assert o == Orientation(r)
+        assert o * h == Orientation(r * rh)
+        assert o.inverse == Orientation(r.inv())
+        assert vec.applyRotation(o) == tuple(r.apply(vec))
+        assert vec.offsetLocally(o, vec) == tuple(vec + r.apply(vec))
+        assert tuple(o._rotateMany([vec, vec])[1]) == tuple(r.apply(vec))
+        assert tuple(o.eulerAngles) == tuple(r.as_euler("ZXY"))
+
+
 def test_distribution_method_encapsulation():
     vf = VectorField("Foo", lambda pos: 0)
     pt = vf.followFrom(Vector(0, 0), Options([1, 2]), steps=1)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from scenic.core.distributions import Samplable
+from scenic.core.requirements import VisibilityRequirement
+from scenic.core.vectors import Vector
+from scenic.core.visibility import batchCanSee
+from tests.utils import compileScenic, sampleScene
+
+
+def test_batch_can_see_occlusion():
+    scenario = compileScenic(
+        """
+        ego = new Object at (0, 0, 0), with viewAngles (90 deg, 60 deg)
+        wall = new Object at (0, 5, 0), with width 4, with height 4
+        hidden = new Object at (0, 10, 0)
+        seen = new Object at (5, 5, 0)
+        behind = new Object at (0, -5, 0)
+        """,
+        mode2D=False,
+    )
+    scene = sampleScene(scenario)
+    ego, wall, hidden, seen, behind = scene.objects
+    targets = (wall, hidden, seen, behind, Vector(0, 10, 0), Vector(-1, 3, 0))
+    results = batchCanSee([ego], targets, scene.objects)
+    assert results.shape == (1, len(targets))
+    assert list(results[0]) == [True, False, True, False, False, True]
+
+
+@pytest.mark.slow
+def test_batch_can_see_matches_canSee():
+    scenario = compileScenic(
+        """
+        workspace = Workspace(BoxRegion(dimensions=(30, 30, 6)))
+        ego = new Object at (0, 0, 0), with visibleDistance 20
+        for i in range(8):
+            new Object in workspace, facing Range(0, 360) deg,
+                with width Range(0.5, 3), with length Range(0.5, 3),
+                with viewAngles (120 deg, 90 deg), with visibleDistance 15,
+                with allowCollisions True
+        """,
+        mode2D=False,
+    )
+    random.seed(0)
+    scene = sampleScene(scenario, maxIterations=100)
+    objects = scene.objects
+    targets = objects + (Vector(1, 2, 0), Vector(-4, 3, 1))
+    results = batchCanSee(objects, targets, objects)
+    for i, viewer in enumerate(objects):
+        for j, target in enumerate(targets):
+            occluders = tuple(
+                obj for obj in objects if obj is not viewer and obj is not target
+            )
+            assert results[i, j] == viewer.canSee(target, occludingObjects=occluders)
+
+
+def test_batched_visibility_requirements():
+    scenario = compileScenic(
+        """
+        workspace = Workspace(BoxRegion(dimensions=(30, 30, 6)))
+        ego = new Object at (0, 0, 0), with visibleDistance 12
+        for i in range(6):
+            new Object in workspace, with width Range(0.5, 3),
+                with requireVisible True, with allowCollisions True
+        """,
+        mode2D=False,
+    )
+    reqs = [
+        req
+        for req in scenario.defaultRequirements
+        if isinstance(req, VisibilityRequirement)
+    ]
+    assert len(reqs) == 6
+    assert all(req._batch is reqs[0]._batch is not None for req in reqs)
+
+    # Checking the requirements together gives the same results as separately
+    random.seed(0)
+    batch = reqs[0]._batch
+    for i in range(10):
+        sample = Samplable.sampleAll(scenario.dependencies)
+        together = [req.falsifiedBy(sample) for req in reqs]
+        for req in reqs:
+            req._batch = None
+        assert together == [req.falsifiedBy(sample) for req in reqs]
+        for req in reqs:
+            req._batch = batch
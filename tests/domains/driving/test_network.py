@@ -1,9 +1,18 @@
+import gc
+import math
+import multiprocessing
 from pathlib import Path
+import random
+import re
+import shutil
+import weakref
 
 import pytest
+import shapely
 
 from scenic.core.distributions import RejectionException
-from scenic.domains.driving.roads import Intersection, Network
+from scenic.core.vectors import Orientation, VectorField
+from scenic.domains.driving.roads import Intersection, Network, RoadDirectionField
 from tests.domains.driving.conftest import mapFolder
 
 # Suppress all warnings from OpenDRIVE parser
@@ -53,6 +62,191 @@ def test_element_tolerance(cached_maps, pytestconfig):
         assert not network.nominalDirectionsAt(pt)
 
 
+def test_element_lookup_batch(cached_maps):
+    path = cached_maps[str(mapFolder / "CARLA" / "Town01.xodr")]
+    network = Network.fromFile(path, tolerance=0.05)
+    drivable = network.drivableRegion
+    nearby = drivable.buffer(0.1).difference(drivable)
+    (minx, miny, _), (maxx, maxy, _) = drivable.AABB
+    pts = [drivable.uniformPointInner() for i in range(50)]
+    pts += [nearby.uniformPointInner() for i in range(50)]
+    pts += [(random.uniform(minx, maxx), random.uniform(miny, maxy)) for i in range(50)]
+    for single, batch in (
+        (network.elementAt, network.elementsAt),
+        (network.roadAt, network.roadsAt),
+        (network.laneAt, network.lanesAt),
+        (network.intersectionAt, network.intersectionsAt),
+    ):
+        assert batch(pts) == [single(pt) for pt in pts]
+    assert network.roadsAt([]) == []
+    with pytest.raises(RejectionException):
+        network.roadsAt([pts[0], (minx - 10, miny - 10)], reject=True)
+
+
+def test_road_direction(cached_maps):
+    path = cached_maps[str(mapFolder / "CARLA" / "Town01.xodr")]
+    network = Network.fromFile(path, tolerance=0.05)
+    field = network.roadDirection
+    drivable = network.drivableRegion
+    nearby = drivable.buffer(0.1).difference(drivable)
+    (minx, miny, _), (maxx, maxy, _) = drivable.AABB
+    pts = [drivable.uniformPointInner() for i in range(50)]
+    pts += [nearby.uniformPointInner() for i in range(50)]
+    pts += [(random.uniform(minx, maxx), random.uniform(miny, maxy)) for i in range(50)]
+
+    def slowDirection(point):
+        road = network.roadAt(point)
+        return Orientation._fromHeading(0) if road is None else road.orientation[point]
+
+    headings = field.headingsAt(pts)
+    cells = field.cellHeadingBounds()
+    for pt, heading in zip(pts, headings):
+        expected = slowDirection(pt)
+        assert field[pt] == expected
+        assert Orientation._fromHeading(heading) == expected
+        point = shapely.geometry.Point(pt[0], pt[1])
+        assert any(
+            cell.intersects(point)
+            and (lower <= heading <= upper or lower <= heading + math.tau <= upper)
+            for cell, lower, upper in cells
+        )
+    slowField = VectorField("slow", slowDirection)
+    for pt in pts[:10]:
+        assert field.followFrom(pt, 10) == slowField.followFrom(pt, 10)
+
+
+def test_road_direction_custom_orientation(cached_maps):
+    path = cached_maps[str(mapFolder / "CARLA" / "Town01.xodr")]
+    network = Network.fromFile(path)
+    # Give one road and one lane of another road custom orientations
+    customRoad, otherRoad = [road for road in network.roads if road.laneGroups][:2]
+    customRoad.orientation = VectorField("custom", lambda pos: 1)
+    customLane = otherRoad.lanes[0]
+    customLane.orientation = VectorField("custom", lambda pos: 1 + pos.x / 1000)
+    field = RoadDirectionField(network)
+
+    def slowDirection(point):
+        road = network.roadAt(point)
+        return Orientation._fromHeading(0) if road is None else road.orientation[point]
+
+    pts = [customRoad.uniformPointInner() for i in range(20)]
+    pts += [customLane.uniformPointInner() for i in range(20)]
+    pts += [otherRoad.uniformPointInner() for i in range(20)]
+    headings = field.headingsAt(pts)
+    for pt, heading in zip(pts, headings):
+        expected = slowDirection(pt)
+        assert field[pt] == expected
+        assert heading == pytest.approx(expected.yaw)
+
+    # No bounds are known for cells with custom orientations
+    point = shapely.geometry.Point(*customLane.uniformPointInner()[:2])
+    for cell, lower, upper in field.cellHeadingBounds():
+        if cell.intersects(point):
+            assert lower is None and upper is None
+
+
+def test_geometry_cache(tmp_path, monkeypatch):
+    import scenic.formats.opendrive.xodr_parser as xodr_parser
+
+    path = tmp_path / "cubetown.xodr"
+    shutil.copyfile(mapFolder / "LGSVL" / "cubetown.xodr", path)
+    cache = tmp_path / "geometry"
+
+    def geometryOf(network):
+        return [(uid, elem.polygons.wkb) for uid, elem in network.elements.items()]
+
+    reference = geometryOf(Network.fromOpenDrive(path))
+    assert geometryOf(Network.fromOpenDrive(path, processes=2)) == reference
+
+    computed = []
+    original = xodr_parser.Road.calculate_geometry
+
+    def calculate_geometry(self, *args, **kwargs):
+        computed.append(self.id_)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(xodr_parser.Road, "calculate_geometry", calculate_geometry)
+
+    def load():
+        computed.clear()
+        return geometryOf(Network.fromOpenDrive(path, geometry_cache=cache))
+
+    assert load() == reference
+    roads = list(computed)
+    assert len(roads) > 1
+    assert load() == reference
+    assert computed == []
+
+    # Editing one road only recomputes the geometry of that road
+    text = path.read_text()
+    pattern = rf'<road\b[^>]*\bid="{roads[0]}"'
+    edited, count = re.subn(pattern, lambda m: m.group(0) + ' edited="true"', text)
+    assert count == 1
+    path.write_text(edited)
+    assert load() == reference
+    assert computed == [roads[0]]
+
+
+def test_columnar_cache(cached_maps):
+    path = cached_maps[str(mapFolder / "CARLA" / "Town01.xodr")]
+    network = Network.fromFile(path)
+    loaded = Network.fromFile(path, columnarCache=True)
+    assert Path(path).with_suffix(Network.columnarExt).exists()
+    loaded = Network.fromFile(path, columnarCache=True)
+    assert set(loaded.elements) == set(network.elements)
+    for uid, elem in network.elements.items():
+        assert loaded.elements[uid].polygons.equals(elem.polygons)
+    for lane in network.lanes:
+        other = loaded.elements[lane.uid]
+        assert other.centerline.cumulativeLengths == lane.centerline.cumulativeLengths
+    pts = [network.drivableRegion.uniformPointInner() for i in range(30)]
+    for pt in pts:
+        assert loaded.roadAt(pt).uid == network.roadAt(pt).uid
+        assert loaded.roadDirection[pt] == network.roadDirection[pt]
+
+    # The mapped file is released along with the loaded network
+    mapped = weakref.ref(loaded._sourceMemory)
+    del loaded
+    gc.collect()
+    assert mapped() is None
+
+    cache = Path(path).with_suffix(Network.columnarExt)
+    with pytest.raises(Network.DigestMismatchError):
+        Network.fromColumnar(cache, originalDigest=bytes(64))
+
+
+def _sharedNetworkSummary(name, point):
+    network = Network.fromSharedMemory(name)
+    return sorted(network.elements), network.roadAt(point).uid
+
+
+def test_shared_memory(network):
+    block = network.toSharedMemory()
+    try:
+        loaded = Network.fromSharedMemory(block)
+        assert set(loaded.elements) == set(network.elements)
+        for uid, elem in network.elements.items():
+            assert loaded.elements[uid].polygons.equals(elem.polygons)
+        for i in range(30):
+            pt = network.drivableRegion.uniformPointInner()
+            assert loaded.laneGroupAt(pt).uid == network.laneGroupAt(pt).uid
+            assert loaded.roadDirection[pt] == network.roadDirection[pt]
+
+        # Load the network in a separate process
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            result = pool.apply(_sharedNetworkSummary, (block.name, tuple(pt)))
+        assert result == (sorted(network.elements), network.roadAt(pt).uid)
+
+        # The attached block is released along with the loaded network
+        attached = weakref.ref(loaded._sourceMemory)
+        del loaded
+        gc.collect()
+        assert attached() is None
+    finally:
+        block.close()
+        block.unlink()
+
+
 def test_orientation_consistency(network):
     for i in range(30):
         pt = network.drivableRegion.uniformPointInner()
@@ -1,3 +1,4 @@
+import math
 import os
 from pathlib import Path
 
@@ -6,7 +7,7 @@ import pytest
 
 from scenic.domains.driving.roads import Network
 from scenic.simulators.newtonian import NewtonianSimulator
-from tests.utils import pickle_test, sampleScene, tryPickling
+from tests.utils import compileScenic, pickle_test, sampleScene, tryPickling
 
 
 def test_basic(loadLocalScenario):
@@ -18,6 +19,53 @@ def test_basic(loadLocalScenario):
     assert egoPos.distanceTo(otherPos) < 1
 
 
+def test_controls():
+    scenario = compileScenic(
+        """
+        model scenic.simulators.newtonian.model
+        class Actor:
+            throttle: 0
+            steer: 0
+            brake: 0
+            hand_brake: 0
+            reverse: 0
+        ego = new Actor with throttle 1, with steer 0.5, with velocity (0, 2)
+        braking = new Actor at (10, 0), with brake 1, with velocity (0, 3)
+        reversing = new Actor at (-10, 0), with throttle 1, with reverse True
+        passive = new Object at (20, 0), with velocity (1, 1)
+        def state(obj):
+            return (obj.position, obj.velocity, obj.speed, obj.angularSpeed, obj.yaw)
+        record final state(ego) as ego
+        record final state(braking) as braking
+        record final state(reversing) as reversing
+        record final state(passive) as passive
+        """,
+        mode2D=True,
+    )
+    scene = sampleScene(scenario)
+    simulation = NewtonianSimulator().simulate(scene, maxSteps=1)
+    records = simulation.result.records
+    # Accelerate at 5.6 m/s^2 for 0.1 s, turning according to the steering
+    position, velocity, speed, angularSpeed, yaw = records["ego"]
+    assert velocity == pytest.approx((0, 2.56, 0))
+    assert position == pytest.approx((0, 0.256, 0))
+    assert angularSpeed == pytest.approx(-2.56 * math.sin(math.pi / 4))
+    assert yaw == pytest.approx(angularSpeed * 0.1)
+    # Brake at 4.6 m/s^2
+    position, velocity, speed, angularSpeed, yaw = records["braking"]
+    assert velocity == pytest.approx((0, 2.54, 0))
+    assert position == pytest.approx((10, 0.254, 0))
+    assert speed == pytest.approx(2.54)
+    position, velocity, speed, angularSpeed, yaw = records["reversing"]
+    assert velocity == pytest.approx((0, -0.56, 0))
+    assert speed == pytest.approx(0.56)
+    # Objects without controls keep their velocity
+    position, velocity, speed, angularSpeed, yaw = records["passive"]
+    assert velocity == (1, 1, 0)
+    assert position == pytest.approx((20.1, 0.1, 0))
+    assert speed == pytest.approx(math.sqrt(2))
+
+
 @pytest.mark.graphical
 def test_render(loadLocalScenario):
     scenario = loadLocalScenario("basic.scenic")
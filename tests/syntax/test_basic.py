@@ -13,6 +13,7 @@ from scenic.core.errors import (
     setDebuggingOptions,
 )
 from scenic.core.object_types import Object
+import scenic.syntax.parser
 from tests.utils import (
     compileScenic,
     sampleEgo,
@@ -202,6 +203,31 @@ def test_dump_final_python():
         scenic.syntax.translator.dumpASTPython = False
 
 
+def test_compiled_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    path = tmp_path / "test.scenic"
+    path.write_text("ego = new Object at (Range(0, 2), 0)\nrequire ego.x > 1")
+    scenic.scenarioFromFile(path)
+    assert len(list((tmp_path / "__pycache__").iterdir())) == 1
+
+    def parse(*args, **kwargs):
+        raise AssertionError("cached module was recompiled")
+
+    # Compiling the file again should use the cached translation
+    monkeypatch.setattr(scenic.syntax.parser, "parse_string", parse)
+    scenario = scenic.scenarioFromFile(path)
+    assert len(scenario.requirements) == 1
+    ego = sampleEgo(scenario, maxIterations=100)
+    assert 1 < ego.x <= 2
+
+    # Changing the source or the compile options invalidates the cache
+    with pytest.raises(AssertionError, match="recompiled"):
+        scenic.scenarioFromFile(path, mode2D=True)
+    path.write_text("ego = new Object at (3, 0)")
+    with pytest.raises(AssertionError, match="recompiled"):
+        scenic.scenarioFromFile(path)
+
+
 @pytest.mark.graphical
 def test_show2D():
     scenario = compileScenic("ego = new Object with color (0.5, 1.0, 0.5)")
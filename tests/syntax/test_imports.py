@@ -6,12 +6,14 @@ system of modular scenarios is tested in 'test_modular.py'.
 """
 
 import os.path
+import shutil
 import sys
 
 import pytest
 
 from scenic import scenarioFromFile
 from scenic.core.errors import ScenicSyntaxError
+import scenic.syntax.parser
 from scenic.syntax.translator import InvalidScenarioError
 from tests.utils import compileScenic, sampleScene, sampleSceneFrom
 
@@ -60,6 +62,28 @@ def test_import_top_relative(request):
         os.chdir(oldDirectory)
 
 
+def test_import_cached(request, monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    # Work on copies of the modules so that the cache is not written into the tree
+    base = os.path.dirname(request.fspath)
+    for name in ("imports.scenic", "helper.scenic", "helper2.py"):
+        shutil.copyfile(os.path.join(base, name), tmp_path / name)
+    path = str(tmp_path / "imports.scenic")
+    scenarioFromFile(path)
+
+    def parse(*args, **kwargs):
+        raise AssertionError("cached module was recompiled")
+
+    # Both the top-level module and the imported one should now be cached
+    monkeypatch.setattr(scenic.syntax.parser, "parse_string", parse)
+    scenario = scenarioFromFile(path)
+    scene, iterations = scenario.generate(maxIterations=1)
+    assert len(scene.objects) == 2
+    assert scene.egoObject.species == "killer"
+    assert scene.objects[1].species == "helpful"
+    assert scene.params["helper_name"] == "helper"
+
+
 def test_module_name_main():
     scenario = compileScenic("param name = __name__\n" "ego = new Object")
     scene, iterations = scenario.generate(maxIterations=1)
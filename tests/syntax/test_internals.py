@@ -1,4 +1,5 @@
 import pkgutil
+import subprocess
 import sys
 
 import pytest
@@ -37,3 +38,17 @@ def test_iter_modules(request, monkeypatch):
     modules = set(info.name for info in pkgutil.iter_modules([""]))
     assert "helper" in modules
     assert "helper2" in modules
+
+
+@pytest.mark.slow
+def test_lazy_imports():
+    # Modules only needed for particular features should not be loaded at startup
+    deferred = ("pdb", "pygame", "scenic.syntax.compiler", "scenic.syntax.parser")
+    code = (
+        "import sys, scenic, scenic.simulators.newtonian\n"
+        f"print([name for name in {deferred!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
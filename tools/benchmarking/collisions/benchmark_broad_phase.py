@@ -0,0 +1,64 @@
+import statistics
+import time
+
+import trimesh
+
+import scenic
+from scenic.core.requirements import BlanketCollisionRequirement
+
+TRIALS_PER = 20
+OBJECT_COUNTS = [5, 10, 25, 50, 100, 200]
+
+
+def falsifiedByWithoutBroadPhase(req, sample):
+    """Original implementation, adding every object to a single CollisionManager."""
+    objects = tuple(sample[obj] for obj in req.objects)
+    cm = trimesh.collision.CollisionManager()
+    for i, obj in enumerate(objects):
+        if not obj.allowCollisions:
+            cm.add_object(str(i), obj.occupiedSpace.mesh)
+    return cm.in_collision_internal()
+
+
+def timeCheck(check, req, sample):
+    start = time.perf_counter()
+    result = check(req, sample)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(numObjects):
+    scenario = scenic.scenarioFromFile(
+        "object_scaling.scenic",
+        params={"numObjects": numObjects, "worldSize": 10 * numObjects},
+    )
+    req = next(
+        r
+        for r in scenario.checker.requirements
+        if isinstance(r, BlanketCollisionRequirement)
+    )
+    results = {"broad phase": [], "no broad phase": []}
+    for _ in range(TRIALS_PER):
+        scene, _ = scenario.generate(maxIterations=float("inf"))
+        # Clear cached meshes so that they are rebuilt for each check, as they
+        # would be for a freshly-generated sample.
+        for obj in scene.objects:
+            obj._clearCaches()
+        sample = scene.sample
+        broad, broadTime = timeCheck(
+            lambda req, sample: req.falsifiedBy(sample), req, sample
+        )
+        for obj in scene.objects:
+            obj._clearCaches()
+        naive, naiveTime = timeCheck(falsifiedByWithoutBroadPhase, req, sample)
+        assert broad == naive
+        results["broad phase"].append(broadTime)
+        results["no broad phase"].append(naiveTime)
+    return {name: statistics.median(times) for name, times in results.items()}
+
+
+if __name__ == "__main__":
+    print(f"{'objects':>8} {'broad phase':>14} {'no broad phase':>16} {'speedup':>8}")
+    for numObjects in OBJECT_COUNTS:
+        times = run_benchmark(numObjects)
+        broad, naive = times["broad phase"], times["no broad phase"]
+        print(f"{numObjects:>8} {broad:>13.5f}s {naive:>15.5f}s {naive / broad:>7.1f}x")
@@ -0,0 +1,366 @@
+"""Run Scenic's benchmarks with a common protocol, tracking regressions.
+
+Each benchmark case is set up once, run a few times to warm up, and then run several
+more times, seeding Python's and NumPy's random number generators before each run;
+the median of each metric over the measured runs is reported. The results of every
+invocation are saved as JSON in the ``results`` directory, giving a history, and are
+compared against a baseline (saved with ``--save-baseline``): the script fails if any
+metric is worse than in the baseline by more than the allowed threshold.
+
+The cases measure the time taken to import Scenic and to compile scenarios, the speed
+of scene generation (scenes/sec and iterations/scene) on scenarios from the
+collisions, sampleChecking and visibility suites, and the number of simulation steps
+per second of the Newtonian simulator.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import json
+import pathlib
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy
+
+import scenic
+from scenic.core.sample_checking import AdaptiveOrderingChecker
+import scenic.syntax.translator as translator
+
+HERE = pathlib.Path(__file__).parent
+RESULTS = HERE / "results"
+BASELINE = HERE / "baseline.json"
+
+WARMUP = 1
+REPEAT = 5
+SEED = 0
+THRESHOLD = 0.1
+
+#: Units of the metrics reported by the benchmarks, and whether higher is better.
+METRICS = {
+    "import_time": ("s", False),
+    "compile_time": ("s", False),
+    "scenes_per_sec": ("scenes/s", True),
+    "iterations_per_scene": ("iterations", False),
+    "steps_per_sec": ("steps/s", True),
+}
+
+
+class Benchmark:
+    """A benchmark case.
+
+    Args:
+        name: Name of the case, of the form ``suite/case``.
+        run: Function performing one run of the case, returning a dict mapping
+            names of metrics (see `METRICS`) to their values. It is passed the value
+            returned by **setup**.
+        setup: Function called once before any runs, e.g. to compile a scenario.
+    """
+
+    def __init__(self, name, run, setup=lambda: None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def importing():
+    def run(_):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import scenic"], check=True)
+        return {"import_time": time.perf_counter() - start}
+
+    return run
+
+
+def compiling(path, **options):
+    def run(_):
+        # Measure the compiler itself rather than loading cached translations
+        useCache = translator.useCompiledCache
+        translator.useCompiledCache = False
+        try:
+            start = time.perf_counter()
+            scenic.scenarioFromFile(HERE / path, **options)
+            return {"compile_time": time.perf_counter() - start}
+        finally:
+            translator.useCompiledCache = useCache
+
+    return run
+
+
+def generating(path, numScenes, checker=None, **options):
+    def setup():
+        scenario = scenic.scenarioFromFile(HERE / path, **options)
+        if checker:
+            scenario.setSampleChecker(checker())
+        return scenario
+
+    def run(scenario):
+        start = time.perf_counter()
+        _, iterations = scenario.generateBatch(numScenes=numScenes)
+        elapsed = time.perf_counter() - start
+        return {
+            "scenes_per_sec": numScenes / elapsed,
+            "iterations_per_scene": iterations / numScenes,
+        }
+
+    return setup, run
+
+
+def simulating(path, maxSteps, **options):
+    def setup():
+        return scenic.scenarioFromFile(HERE / path, **options)
+
+    def run(scenario):
+        from scenic.simulators.newtonian import NewtonianSimulator
+
+        scene, _ = scenario.generate(maxIterations=1000)
+        simulator = NewtonianSimulator()
+        start = time.perf_counter()
+        simulation = simulator.simulate(scene, maxSteps=maxSteps)
+        elapsed = time.perf_counter() - start
+        return {"steps_per_sec": simulation.currentTime / elapsed}
+
+    return setup, run
+
+
+def generation(name, *args, **kwargs):
+    setup, run = generating(*args, **kwargs)
+    return Benchmark(name, run, setup)
+
+
+def simulation(name, *args, **kwargs):
+    setup, run = simulating(*args, **kwargs)
+    return Benchmark(name, run, setup)
+
+
+BENCHMARKS = [
+    Benchmark("startup/import", importing()),
+    Benchmark(
+        "compile/crowdedRoom",
+        compiling("sampleChecking/benchmarks/crowdedRoom.scenic", mode2D=True),
+    ),
+    Benchmark(
+        "compile/vacuum",
+        compiling("sampleChecking/benchmarks/vacuum.scenic", params={"numToys": 2}),
+    ),
+    Benchmark(
+        "compile/carInFront",
+        compiling("sampleChecking/benchmarks/carInFront.scenic", mode2D=True),
+    ),
+    generation(
+        "collisions/object_scaling",
+        "collisions/object_scaling.scenic",
+        10,
+        params={"numObjects": 25, "worldSize": 250},
+    ),
+    generation(
+        "sampleChecking/crowdedRoom",
+        "sampleChecking/benchmarks/crowdedRoom.scenic",
+        3,
+        mode2D=True,
+        params={"numObjects": 12},
+    ),
+    generation(
+        "sampleChecking/crowdedRoom-adaptive",
+        "sampleChecking/benchmarks/crowdedRoom.scenic",
+        3,
+        checker=AdaptiveOrderingChecker,
+        mode2D=True,
+        params={"numObjects": 12},
+    ),
+    generation(
+        "sampleChecking/vacuum",
+        "sampleChecking/benchmarks/vacuum.scenic",
+        2,
+        params={"numToys": 2},
+    ),
+    generation(
+        "visibility/fully_visible",
+        "visibility/fully_visible.scenic",
+        2,
+    ),
+    generation(
+        "visibility/partially_occluded",
+        "visibility/partially_occluded.scenic",
+        1,
+    ),
+    simulation("simulation/newtonian", "simulation/newtonian.scenic", 200, mode2D=True),
+]
+
+
+def measure(benchmark, warmup=WARMUP, repeat=REPEAT, seed=SEED):
+    """Run a benchmark, returning a summary of each of its metrics."""
+    state = benchmark.setup()
+    runs = []
+    for trial in range(warmup + repeat):
+        # Measured runs use the same seeds however many warm-up runs there are
+        trialSeed = seed + (trial - warmup if trial >= warmup else repeat + trial)
+        random.seed(trialSeed)
+        numpy.random.seed(trialSeed)
+        metrics = benchmark.run(state)
+        if trial >= warmup:
+            runs.append(metrics)
+
+    summary = {}
+    for metric in runs[0]:
+        values = [run[metric] for run in runs]
+        unit, higherIsBetter = METRICS[metric]
+        summary[metric] = {
+            "median": statistics.median(values),
+            "min": min(values),
+            "max": max(values),
+            "values": values,
+            "unit": unit,
+            "higherIsBetter": higherIsBetter,
+        }
+    return summary
+
+
+def compare(results, baseline, threshold=THRESHOLD, metricThresholds={}):
+    """Compare results against a baseline.
+
+    Returns a list of comparisons of the medians of each metric present in both,
+    as tuples of the benchmark name, metric name, baseline and new values, relative
+    change, and status (``"ok"``, ``"improved"``, or ``"regressed"``).
+    """
+    comparisons = []
+    for name, metrics in results.items():
+        for metric, summary in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if old is None:
+                continue
+            new, old = summary["median"], old["median"]
+            change = (new - old) / old if old else 0
+            worsening = -change if summary["higherIsBetter"] else change
+            allowed = metricThresholds.get(metric, threshold)
+            if worsening > allowed:
+                status = "regressed"
+            elif worsening < -allowed:
+                status = "improved"
+            else:
+                status = "ok"
+            comparisons.append((name, metric, old, new, change, status))
+    return comparisons
+
+
+def metadata(args):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=HERE,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+
+
+def parseMetricThreshold(text):
+    metric, _, value = text.partition("=")
+    if metric not in METRICS:
+        raise argparse.ArgumentTypeError(f"unknown metric {metric!r}")
+    return metric, float(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        default=["*"],
+        help="only run benchmarks whose names match these glob patterns",
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        help="file to save the results to (default: a new file in results/)",
+    )
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="save the results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"allowed relative worsening of any metric (default {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--metric-threshold",
+        type=parseMetricThreshold,
+        action="append",
+        default=[],
+        metavar="METRIC=VALUE",
+        help="allowed relative worsening of a particular metric",
+    )
+    args = parser.parse_args()
+
+    benchmarks = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if any(fnmatch.fnmatch(benchmark.name, pattern) for pattern in args.patterns)
+    ]
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        sys.exit(0)
+
+    results = {}
+    for benchmark in benchmarks:
+        summary = measure(benchmark, args.warmup, args.repeat, args.seed)
+        results[benchmark.name] = summary
+        for metric, stats in summary.items():
+            print(
+                f"{benchmark.name:40} {metric:22} {stats['median']:12.4f} {stats['unit']}",
+                flush=True,
+            )
+
+    report = {"metadata": metadata(args), "results": results}
+    output = args.output
+    if output is None:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS / f"{timestamp}.json"
+    output.write_text(json.dumps(report, indent=4) + "\n")
+    print(f"Saved results to {output}")
+
+    failed = False
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=4) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+        comparisons = compare(
+            results, baseline, args.threshold, dict(args.metric_threshold)
+        )
+        print(f"Comparison with baseline {args.baseline}:")
+        for name, metric, old, new, change, status in comparisons:
+            print(
+                f"  {name:40} {metric:22} {old:12.4f} -> {new:12.4f} "
+                f"({change:+.1%}) {status}"
+            )
+        regressions = [c for c in comparisons if c[-1] == "regressed"]
+        if regressions:
+            print(f"FAIL: {len(regressions)} metrics regressed")
+            failed = True
+    else:
+        print("No baseline saved; run with --save-baseline to record one")
+
+    sys.exit(1 if failed else 0)
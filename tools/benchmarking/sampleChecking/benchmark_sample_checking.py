@@ -5,11 +5,15 @@ from pathlib import Path
 import statistics
 import time
 
-from multiprocess import Process
+from multiprocess import Process, Queue
 from threadpoolctl import threadpool_limits
 
 import scenic
-from scenic.core.sample_checking import WeightedAcceptanceChecker
+from scenic.core.sample_checking import (
+    AdaptiveOrderingChecker,
+    BasicChecker,
+    WeightedAcceptanceChecker,
+)
 
 MAX_TIME = 20 * 60
 TRIALS_PER = {1: 25, 10: 10, 100: 5}
@@ -34,6 +38,7 @@ BENCHMARKS = [
     ("vacuum.scenic", {"numToys": 4}),
     ("vacuum.scenic", {"numToys": 8}),
     ("vacuum.scenic", {"numToys": 16}),
+    ("crowdedRoom.scenic", {"mode2D": True}),
 ]
 
 SAMPLE_CHECKERS = [
@@ -41,6 +46,7 @@ SAMPLE_CHECKERS = [
     "WeightedAcceptanceChecker_1",
     "WeightedAcceptanceChecker_10",
     "WeightedAcceptanceChecker_100",
+    "AdaptiveOrderingChecker",
 ]
 
 NUM_CORES = 16
@@ -58,18 +64,22 @@ def make_scenario(path, params):
     )
 
 
-def run_benchmark(scenario, sample_checker, num_scenes):
+def run_benchmark(scenario, sample_checker, num_scenes, queue):
     if sample_checker == "BasicChecker":
-        pass
+        scenario.setSampleChecker(BasicChecker(initialCollisionCheck=True))
     elif sample_checker == "WeightedAcceptanceChecker_1":
         scenario.setSampleChecker(WeightedAcceptanceChecker(bufferSize=1))
     elif sample_checker == "WeightedAcceptanceChecker_10":
         scenario.setSampleChecker(WeightedAcceptanceChecker(bufferSize=10))
     elif sample_checker == "WeightedAcceptanceChecker_100":
         scenario.setSampleChecker(WeightedAcceptanceChecker(bufferSize=100))
+    elif sample_checker == "AdaptiveOrderingChecker":
+        scenario.setSampleChecker(AdaptiveOrderingChecker())
 
     with threadpool_limits(limits=NUM_CORES, user_api="blas"):
-        scenario.generateBatch(numScenes=num_scenes)
+        start = time.perf_counter()
+        _, iterations = scenario.generateBatch(numScenes=num_scenes)
+        queue.put((iterations, time.perf_counter() - start))
 
 
 if __name__ == "__main__":
@@ -86,9 +96,12 @@ if __name__ == "__main__":
             benchmark_name, benchmark_params = benchmark
             scenario = scenarios[str(benchmark)]
             times = []
+            rates = []
             for trial_iter in range(TRIALS_PER[num_scenes]):
+                queue = Queue()
                 p = Process(
-                    target=run_benchmark, args=[scenario, sample_checker, num_scenes]
+                    target=run_benchmark,
+                    args=[scenario, sample_checker, num_scenes, queue],
                 )
                 start = time.perf_counter()
                 p.start()
@@ -96,15 +109,27 @@ if __name__ == "__main__":
                 p.kill()
                 trial_time = min(time.perf_counter() - start, MAX_TIME)
 
+                # Samples per second of generation (not counting process startup)
+                if queue.empty():  # timed out
+                    rate = 0
+                else:
+                    iterations, generation_time = queue.get()
+                    rate = iterations / generation_time
+
                 print(
-                    f"({sample_checker},{benchmark},{num_scenes},{trial_iter}): {trial_time:.2f}s"
+                    f"({sample_checker},{benchmark},{num_scenes},{trial_iter}): "
+                    f"{trial_time:.2f}s, {rate:.1f} samples/s"
                 )
 
                 times.append(trial_time)
+                rates.append(rate)
 
             median_times = statistics.median(times)
             assert 0 <= median_times <= MAX_TIME
-            results_val[(str(benchmark), num_scenes)] = median_times
+            results_val[(str(benchmark), num_scenes)] = (
+                median_times,
+                statistics.median(rates),
+            )
         sc_results[sample_checker] = results_val
 
     # Dump results
@@ -118,8 +143,26 @@ if __name__ == "__main__":
 
         stats_json = sc_json["stats"]
 
-        for name, median_times in sc_results[sample_checker].items():
-            stats_json[str(name)] = {"status": True, "rtime": median_times}
+        for name, (median_times, median_rate) in sc_results[sample_checker].items():
+            stats_json[str(name)] = {
+                "status": True,
+                "rtime": median_times,
+                "samples_per_sec": median_rate,
+            }
 
         with open(Path("results") / f"{sample_checker}.json", "w") as f:
             json.dump(sc_json, f, indent=4)
+
+    # Summarize the gain in samples/sec relative to the first sample checker
+    baseline = SAMPLE_CHECKERS[0]
+    for sample_checker in SAMPLE_CHECKERS[1:]:
+        speedups = [
+            rate / sc_results[baseline][key][1]
+            for key, (_, rate) in sc_results[sample_checker].items()
+            if rate > 0 and sc_results[baseline][key][1] > 0
+        ]
+        if speedups:
+            print(
+                f"{sample_checker}: {statistics.geometric_mean(speedups):.2f}x "
+                f"samples/sec of {baseline} (geometric mean)"
+            )
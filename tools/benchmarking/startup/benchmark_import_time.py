@@ -0,0 +1,105 @@
+"""Benchmark the time taken to import Scenic, guarding against regressions.
+
+Runs ``python -X importtime -c "import scenic"`` several times in fresh processes and
+reports the median total import time along with the modules taking the most time to
+import themselves. If a baseline has been saved (with ``--save``), the benchmark
+fails if the median time exceeds it by more than the given tolerance. It also fails
+if any of the modules which Scenic deliberately imports lazily are loaded at startup.
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+TRIALS = 10
+BASELINE = pathlib.Path(__file__).parent / "baseline.json"
+
+# Modules which should only be imported when the features needing them are used
+DEFERRED_MODULES = (
+    "matplotlib",
+    "pdb",
+    "pygame",
+    "pyglet",
+    "scenic.formats.opendrive.xodr_parser",
+    "scenic.syntax.compiler",
+    "scenic.syntax.parser",
+)
+
+
+def importTimes(module):
+    """Import a module in a fresh process, returning the times for each submodule.
+
+    Returns a dictionary mapping module names to pairs of self and cumulative import
+    times in milliseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        selfTime, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(selfTime) / 1000, int(cumulative) / 1000)
+    return times
+
+
+def run_benchmark(trials=TRIALS):
+    totals = []
+    selfTimes = {}
+    for _ in range(trials):
+        times = importTimes("scenic")
+        totals.append(times["scenic"][1])
+        for name, (selfTime, _) in times.items():
+            selfTimes.setdefault(name, []).append(selfTime)
+    medianSelfTimes = {name: statistics.median(ts) for name, ts in selfTimes.items()}
+    return statistics.median(totals), medianSelfTimes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=TRIALS)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown compared to the baseline (default 0.25)",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="save the results as the new baseline"
+    )
+    args = parser.parse_args()
+
+    total, selfTimes = run_benchmark(args.trials)
+    print(f"import scenic: {total:.1f} ms (median of {args.trials})")
+    print("Slowest modules (self time):")
+    slowest = sorted(selfTimes.items(), key=lambda item: item[1], reverse=True)
+    for name, selfTime in slowest[:15]:
+        print(f"  {selfTime:8.1f} ms  {name}")
+
+    failed = False
+    loaded = [name for name in DEFERRED_MODULES if name in selfTimes]
+    if loaded:
+        print(f"FAIL: modules imported at startup: {', '.join(loaded)}")
+        failed = True
+
+    if args.save:
+        BASELINE.write_text(json.dumps({"scenic": total}, indent=4) + "\n")
+        print(f"Saved baseline to {BASELINE}")
+    elif BASELINE.exists():
+        baseline = json.loads(BASELINE.read_text())["scenic"]
+        limit = baseline * (1 + args.tolerance)
+        print(f"Baseline: {baseline:.1f} ms (limit {limit:.1f} ms)")
+        if total > limit:
+            print("FAIL: import time regressed")
+            failed = True
+    else:
+        print("No baseline saved; run with --save to record one")
+
+    sys.exit(1 if failed else 0)